@@ -4,9 +4,11 @@ Health Check Endpoint
 헬스체크 API
 """
 
-from fastapi import APIRouter
-from app.models import HealthResponse
+from fastapi import APIRouter, Depends, Response
+from app.models import HealthResponse, ReadinessResponse
 from app.core.config import settings
+from app.core.deps import get_readiness
+from core.observability import ReadinessChecker
 
 # 🔥 prefix 필수
 router = APIRouter(prefix="/health")
@@ -28,4 +30,47 @@ async def health() -> HealthResponse:
     return HealthResponse(
         status="healthy",
         version=settings.VERSION
-    )
\ No newline at end of file
+    )
+
+
+@router.get(
+    "/live",
+    response_model=HealthResponse,
+    summary="Liveness 프로브",
+    description="프로세스 생존 여부 (외부 의존성 점검 없음)",
+)
+async def live() -> HealthResponse:
+    """
+    Liveness 엔드포인트
+
+    이벤트 루프가 응답 가능한지만 확인합니다. DB/LLM 장애로 재시작되지 않도록
+    외부 의존성은 점검하지 않습니다.
+    """
+    return HealthResponse(status="alive", version=settings.VERSION)
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    summary="Readiness 프로브",
+    description="DB 커넥션 풀, FAISS 인덱스 로드, LLM Provider 도달 가능 여부 점검 (짧은 TTL 캐시)",
+    responses={503: {"model": ReadinessResponse, "description": "하나 이상의 컴포넌트 비정상"}},
+)
+async def ready(
+    response: Response,
+    readiness: ReadinessChecker = Depends(get_readiness),  # DI로 주입
+) -> ReadinessResponse:
+    """
+    Readiness 엔드포인트
+
+    하나라도 실패하면 503을 반환해 로드밸런서가 트래픽을 보내지 않도록 합니다.
+    """
+    report = await readiness.check()
+    if not report["ready"]:
+        response.status_code = 503
+
+    return ReadinessResponse(
+        status="ready" if report["ready"] else "not_ready",
+        checks=report["checks"],
+        cached=report["cached"],
+    )
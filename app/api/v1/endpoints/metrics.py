@@ -0,0 +1,28 @@
+"""
+Metrics Endpoint
+
+Prometheus 메트릭 노출 (text exposition format)
+"""
+
+from fastapi import APIRouter, Response
+
+from core.observability.metrics import render_latest, METRICS_CONTENT_TYPE
+
+router = APIRouter(prefix="/metrics")
+
+
+@router.get(
+    "",
+    summary="Prometheus 메트릭",
+    description=(
+        "요청 지연(agent_type/success별), SQL 시도 횟수, Router 분류, "
+        "LLM 호출 수/지연(provider/model별), DB 풀 checkout 대기, 단계별(FAISS 검색 등) 지연, "
+        "single-flight/bulkhead 상태"
+    ),
+    response_class=Response,
+)
+async def metrics() -> Response:
+    """
+    Prometheus scrape 엔드포인트
+    """
+    return Response(content=render_latest(), media_type=METRICS_CONTENT_TYPE)
@@ -2,16 +2,44 @@
 Query Endpoint - HR Agent 통합 API (DI 적용)
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+import functools
+import json
+import time
 
-from app.models import QueryRequest, QueryResponse
-from app.core.deps import get_hr_agent
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi.responses import StreamingResponse
+
+from app.models import QueryRequest, QueryResponse, BatchQueryRequest, BatchQueryResponse
+from app.core.config import Settings
+from app.core.deps import get_hr_agent, get_query_dispatcher, get_app_settings
 from core.agents import HRAgent
-from core.types.errors import HRAgentError
+from core.concurrency import QueryDispatcher, run_batch
+from core.observability.metrics import REQUEST_LATENCY
+from core.observability.timing import start_timing, timed
+from core.utils.text import normalize_question
+from core.types.agent_types import AgentResult, StreamEvent
+from core.types.errors import HRAgentError, OverloadedError
 
 router = APIRouter(prefix="/query")
 
 
+def to_response(question: str, result: AgentResult) -> QueryResponse:
+    """AgentResult → QueryResponse"""
+    return QueryResponse(
+        question=question,
+        answer=result["answer"],  # AgentResult 사용
+        agent_type=result["metadata"]["agent_type"],
+        success=result["success"],
+        error=result.get("error"),
+    )
+
+
+def format_sse(event: StreamEvent) -> str:
+    """StreamEvent → SSE 메시지 (event/data 필드)"""
+    data = json.dumps(event["data"], ensure_ascii=False, default=str)
+    return f"event: {event['type']}\ndata: {data}\n\n"
+
+
 @router.post(
     "",
     response_model=QueryResponse,
@@ -20,22 +48,33 @@ router = APIRouter(prefix="/query")
 )
 async def query(
     request: QueryRequest,
-    hr_agent: HRAgent = Depends(get_hr_agent),  # DI로 주입
+    response: Response,
+    dispatcher: QueryDispatcher = Depends(get_query_dispatcher),  # DI로 주입
 ) -> QueryResponse:
     """
     HR Agent 통합 질의 엔드포인트
+
+    이벤트 루프를 블로킹하지 않도록 async 경로 또는 워커 풀로 실행합니다.
+    동시에 들어온 같은 질문은 한 번만 처리하고 결과를 공유합니다.
+    단계별 소요시간은 Server-Timing 헤더로 항상 전달합니다.
     """
+    timings = start_timing()
     try:
-        result = hr_agent.query(request.question)
-
-        return QueryResponse(
-            question=request.question,
-            answer=result["answer"],  # AgentResult 사용
-            agent_type=result["metadata"]["agent_type"],
-            success=result["success"],
-            error=result.get("error"),
-        )
+        with timed("total"):
+            result = await dispatcher.run(request.question, answer_mode=request.answer_mode)
 
+        response.headers["Server-Timing"] = timings.server_timing()
+        body = to_response(request.question, result)
+        if request.debug_timing:
+            body.timings = timings.as_dict()
+        return body
+
+    except OverloadedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail={"code": e.code, "message": e.message},
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except HRAgentError as e:
         raise HTTPException(
             status_code=400,
@@ -46,3 +85,114 @@ async def query(
             status_code=500,
             detail=f"질의 처리 중 오류 발생: {str(e)}",
         )
+
+
+@router.post(
+    "/batch",
+    response_model=BatchQueryResponse,
+    summary="HR 배치 질의 (동시 처리 + 중복 제거)",
+    description=(
+        "여러 질문을 동시성 상한 안에서 병렬 처리합니다. "
+        "정규화 후 같은 질문은 한 번만 실행하며, 결과는 입력 순서대로 반환합니다."
+    ),
+)
+async def query_batch(
+    request: BatchQueryRequest,
+    dispatcher: QueryDispatcher = Depends(get_query_dispatcher),  # DI로 주입
+    settings: Settings = Depends(get_app_settings),  # DI로 주입
+) -> BatchQueryResponse:
+    """
+    HR Agent 배치 질의 엔드포인트
+
+    항목별 실패는 해당 항목의 success=False/error로 반환되고 배치 전체는 성공합니다.
+    """
+    if len(request.questions) > settings.QUERY_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "BATCH_TOO_LARGE",
+                "message": f"한 번에 최대 {settings.QUERY_BATCH_MAX_SIZE}개까지 질의할 수 있습니다.",
+            },
+        )
+
+    concurrency = min(
+        request.concurrency or settings.QUERY_BATCH_CONCURRENCY,
+        settings.QUERY_BATCH_CONCURRENCY,
+    )
+
+    outcomes = await run_batch(
+        request.questions,
+        functools.partial(dispatcher.run, answer_mode=request.answer_mode),
+        concurrency=concurrency,
+    )
+
+    results = []
+    for question, outcome in zip(request.questions, outcomes):
+        if isinstance(outcome, BaseException):
+            message = outcome.message if isinstance(outcome, HRAgentError) else str(outcome)
+            results.append(QueryResponse(
+                question=question,
+                answer="",
+                agent_type="UNKNOWN",
+                success=False,
+                error=f"질의 처리 중 오류 발생: {message}",
+            ))
+        else:
+            results.append(to_response(question, outcome))
+
+    succeeded = sum(1 for r in results if r.success)
+    return BatchQueryResponse(
+        results=results,
+        total=len(results),
+        unique=len({normalize_question(q) for q in request.questions}),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+    )
+
+
+@router.post(
+    "/stream",
+    summary="HR 질의 스트리밍 (Server-Sent Events)",
+    description=(
+        "처리 단계별 이벤트를 SSE로 전송합니다: "
+        "route → sql_generated / sql_executed 또는 sources → token... → done"
+    ),
+    response_class=StreamingResponse,
+)
+async def query_stream(
+    request: QueryRequest,
+    hr_agent: HRAgent = Depends(get_hr_agent),  # DI로 주입
+) -> StreamingResponse:
+    """
+    HR Agent 스트리밍 엔드포인트
+
+    마지막 done 이벤트의 data는 /query 응답(QueryResponse)과 같은 형식입니다.
+    """
+
+    async def event_source():
+        started = time.perf_counter()
+        try:
+            async for event in hr_agent.astream(request.question, answer_mode=request.answer_mode):
+                if event["type"] == "done":
+                    response = to_response(request.question, event["data"])
+                    REQUEST_LATENCY.labels(
+                        agent_type=response.agent_type, success=str(response.success).lower()
+                    ).observe(time.perf_counter() - started)
+                    event = StreamEvent(type="done", data=response.model_dump(exclude={"timings"}))
+                yield format_sse(event)
+        except OverloadedError as e:
+            # 스트림이 이미 시작(200)됐으므로 503 대신 error 이벤트로 전달
+            yield format_sse(StreamEvent(
+                type="error",
+                data={"code": e.code, "message": e.message, "retry_after": e.retry_after},
+            ))
+        except Exception as e:
+            yield format_sse(
+                StreamEvent(type="error", data={"message": f"질의 처리 중 오류 발생: {str(e)}"})
+            )
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
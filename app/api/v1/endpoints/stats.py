@@ -0,0 +1,36 @@
+"""
+Stats Endpoint
+
+런타임 통계 API (동시성 제어 상태 확인용)
+"""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from app.core.deps import get_single_flight, get_bulkheads
+from core.concurrency import SingleFlight, Bulkhead
+
+router = APIRouter(prefix="/stats")
+
+
+@router.get(
+    "",
+    summary="런타임 통계",
+    description="single-flight coalescing, Agent별 bulkhead 등 요청 처리 통계",
+)
+async def stats(
+    single_flight: SingleFlight = Depends(get_single_flight),  # DI로 주입
+    bulkheads: Dict[str, Bulkhead] = Depends(get_bulkheads),  # DI로 주입
+) -> Dict[str, Any]:
+    """
+    런타임 통계 엔드포인트
+
+    - single_flight.coalesced: 진행 중인 동일 질문에 합류한 요청 수
+    - single_flight.executions: 실제로 실행된 질의 수
+    - bulkheads.<AGENT>.queue_depth / wait_seconds_*: Agent별 대기열 깊이와 대기 시간
+    """
+    return {
+        "single_flight": single_flight.stats(),
+        "bulkheads": {name: bulkhead.stats() for name, bulkhead in bulkheads.items()},
+    }
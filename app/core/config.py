@@ -6,7 +6,7 @@ Application Configuration
 from typing import Optional, List
 from functools import lru_cache
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, model_validator
 
 
 class Settings(BaseSettings):
@@ -40,6 +40,26 @@ class Settings(BaseSettings):
 
     # === SQL Agent 설정 ===
     SQL_AGENT_MAX_ATTEMPTS: int = 3
+    SQL_SCHEMA_LINKING: bool = True  # 질문 관련 테이블만 SQL 프롬프트에 포함 (False면 전체 스키마)
+    # "compact": 테이블별 1줄 DDL + FK 힌트 + ISO 형식 샘플 (토큰 절감)
+    # "full": 컬럼별 1줄 + 샘플 Row repr (기존 형식)
+    SQL_SCHEMA_FORMAT: str = "compact"
+    SQL_VALIDATION_ENABLED: bool = True  # 실행 전 로컬 검증 (SELECT 전용, 테이블/컬럼/ENUM 값)
+    SQL_REPAIR_ENABLED: bool = True  # 흔한 컬럼/테이블/ENUM 오류는 LLM 보정 전에 규칙 기반으로 수정
+    # 2 이상이면 첫 시도에서 후보 SQL을 동시에 생성/실행 (SQL 생성 LLM 호출이 후보 수만큼 늘어남)
+    SQL_CANDIDATES: int = 1
+    SQL_CANDIDATE_STRATEGY: str = "first"  # "first": 먼저 성공한 후보, "majority": 결과 다수결
+    SQL_CANDIDATE_TEMPERATURE: float = 0.7
+    SQL_FEW_SHOT_ENABLED: bool = True  # 유사 질문의 검증된 SQL을 생성 프롬프트에 포함
+    SQL_FEW_SHOT_K: int = 3
+    SQL_FEW_SHOT_PATH: Optional[str] = None  # None이면 data/finetuning/sql_train.json
+    SQL_FEW_SHOT_MAX_LEARNED: int = 1000  # 운영 중 성공한 SQL로 추가되는 예시 최대 개수
+    SQL_COST_GUARD_ENABLED: bool = True  # 실행 전 EXPLAIN으로 예상 검사 행 수 확인 (조인 조건 누락 등 차단)
+    SQL_COST_MAX_ROWS: int = 1_000_000  # 허용하는 최대 예상 검사 행 수
+    SQL_MAX_ROWS: int = 1000  # SQL 결과 최대 행 수 (집계가 아닌 SELECT에 LIMIT 자동 주입, 초과 시 truncated)
+    SQL_CACHE_ENABLED: bool = True  # 실행 성공한 SQL 재사용 (같은 질문이면 SQL 생성 LLM 호출 생략)
+    SQL_CACHE_PATH: Optional[str] = None  # None이면 data/cache/sql_cache.db
+    SQL_CACHE_MAX_ENTRIES: int = 10000
 
     # === RAG Agent 설정 ===
     RAG_TOP_K: int = 5
@@ -49,7 +69,66 @@ class Settings(BaseSettings):
     # === Database 설정 ===
     DATABASE_URL: Optional[str] = Field(default=None, env="DATABASE_URL")
     DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10  # 풀이 다 사용 중일 때 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0  # 풀 + overflow가 모두 사용 중일 때 checkout 최대 대기(초)
     DB_POOL_RECYCLE: int = 3600
+    DB_POOL_PREFILL: bool = True  # 예열 시 DB_POOL_SIZE개 커넥션을 미리 연결
+    DB_POOL_PRE_PING: bool = False  # 동기 풀 checkout마다 ping 왕복 (False면 백그라운드 sweeper로 확인, async 풀은 항상 pre-ping)
+    DB_POOL_SWEEP_INTERVAL: float = 30.0  # idle 커넥션 생존 확인 간격(초, 0이면 sweeper 없음)
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = 30000  # SELECT 최대 실행 시간(ms, MySQL max_execution_time)
+    DB_MAX_FETCH_ROWS: int = 10000  # 쿼리 1건이 가져오는 최대 행 수 (메모리 보호, LIMIT이 없는 쿼리 대비)
+    # async 경로 SQL 실행 드라이버 ("aiomysql" | "asyncmy", None이면 워커 스레드에서 동기 실행)
+    # DATABASE_URL을 그대로 쓰고 DB_POOL_SIZE 크기의 풀을 별도로 만듦 (pip install -e ".[async]")
+    DB_ASYNC_DRIVER: Optional[str] = None
+    SCHEMA_CACHE_TTL: float = 30.0  # 이 시간 동안은 지문 확인 없이 캐시된 스키마 사용(초)
+    RESULT_CACHE_ENABLED: bool = True  # SQL 실행 결과 캐시 (읽은 테이블이 바뀌면 무효화)
+    RESULT_CACHE_TTL: float = 60.0  # 재실행 없이 캐시 반환(초)
+    RESULT_CACHE_STALE_TTL: float = 600.0  # 이 나이까지는 캐시 반환 + 백그라운드 재실행(초)
+    RESULT_CACHE_POLL_INTERVAL: float = 5.0  # 테이블 UPDATE_TIME 조회 간격(초)
+    RESULT_CACHE_MAX_ENTRIES: int = 1000
+    RESULT_CACHE_MAX_ROWS: int = 5000  # 이보다 행이 많은 결과는 캐시하지 않음
+
+    # === Health Check 설정 ===
+    HEALTH_CHECK_TTL: float = 5.0  # readiness 결과 캐시 시간(초)
+    HEALTH_CHECK_TIMEOUT: float = 2.0  # 점검 항목별 타임아웃(초)
+    HEALTH_CHECK_LLM: bool = True  # LLM Provider 도달 가능 여부도 readiness에 포함
+
+    # === Warmup 설정 ===
+    WARMUP_ENABLED: bool = True  # 앱 시작 시 컴포넌트 병렬 예열
+    WARMUP_LLM: bool = True  # 예열 시 LLM/임베딩 클라이언트에 작은 요청 1회 (토큰 소모)
+    WARMUP_TIMEOUT: float = 30.0  # 예열 작업별 최대 시간(초)
+
+    # === 동시성 설정 ===
+    # "async": HRAgent.aquery() 네이티브 async 경로 (요청당 스레드 없음)
+    # "threadpool": 동기 HRAgent.query()를 워커 풀에서 실행
+    QUERY_EXECUTION_MODE: str = "async"
+    # 동기 Agent 호출을 실행할 워커 풀 크기 (이벤트 루프 블로킹 방지)
+    QUERY_MAX_WORKERS: int = 32
+    # 동시에 들어온 동일(정규화 기준) 질문을 한 번만 처리하고 결과 공유
+    QUERY_COALESCE_ENABLED: bool = True
+
+    # === Bulkhead (Agent별 동시 실행 제한) ===
+    # 한도 초과 요청은 대기열에서 기다리고, 대기열도 가득 차면 즉시 503 + Retry-After
+    # SQL은 DB 커넥션 풀(DB_POOL_SIZE)을 고갈시키지 않도록 풀 크기 이하로 설정
+    SQL_AGENT_MAX_CONCURRENCY: int = 5
+    SQL_AGENT_MAX_QUEUE: int = 20
+    RAG_AGENT_MAX_CONCURRENCY: int = 8
+    RAG_AGENT_MAX_QUEUE: int = 32
+    BULKHEAD_QUEUE_TIMEOUT: float = 10.0  # 대기열 최대 대기 시간(초)
+    BULKHEAD_RETRY_AFTER: int = 2  # 거절 시 Retry-After 헤더 값(초)
+    # 배치 질의: 요청당 최대 질문 수 / 기본 동시 실행 수 (요청에서 더 낮게 지정 가능)
+    QUERY_BATCH_MAX_SIZE: int = 500
+    QUERY_BATCH_CONCURRENCY: int = 8
+
+    @model_validator(mode="after")
+    def _check_row_limits(self) -> "Settings":
+        """DB fetch 상한이 SQL 결과 상한 + 1 이상이어야 초과(truncated) 여부를 판단할 수 있음"""
+        if self.DB_MAX_FETCH_ROWS <= self.SQL_MAX_ROWS:
+            raise ValueError(
+                f"DB_MAX_FETCH_ROWS({self.DB_MAX_FETCH_ROWS})는 "
+                f"SQL_MAX_ROWS({self.SQL_MAX_ROWS})보다 커야 합니다."
+            )
+        return self
 
     class Config:
         env_file = ".env"
@@ -3,8 +3,13 @@ Dependency Injection
 FastAPI 의존성 주입 (Container 기반)
 """
 
+from typing import Dict
+
+from app.core.config import Settings
 from core.container import get_container
 from core.agents import HRAgent
+from core.concurrency import QueryExecutor, QueryDispatcher, SingleFlight, Bulkhead
+from core.observability import ReadinessChecker
 
 
 def get_hr_agent() -> HRAgent:
@@ -15,3 +20,63 @@ def get_hr_agent() -> HRAgent:
         HRAgent 인스턴스 (Container에서 관리)
     """
     return get_container().hr_agent
+
+
+def get_query_executor() -> QueryExecutor:
+    """
+    QueryExecutor 의존성 주입
+
+    Returns:
+        QueryExecutor 인스턴스 (Container에서 관리)
+    """
+    return get_container().query_executor
+
+
+def get_query_dispatcher() -> QueryDispatcher:
+    """
+    QueryDispatcher 의존성 주입
+
+    Returns:
+        QueryDispatcher 인스턴스 (Container에서 관리)
+    """
+    return get_container().query_dispatcher
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    SingleFlight 의존성 주입
+
+    Returns:
+        SingleFlight 인스턴스 (Container에서 관리)
+    """
+    return get_container().single_flight
+
+
+def get_bulkheads() -> Dict[str, Bulkhead]:
+    """
+    Agent별 Bulkhead 의존성 주입
+
+    Returns:
+        Agent 타입 → Bulkhead (Container에서 관리)
+    """
+    return get_container().bulkheads
+
+
+def get_readiness() -> ReadinessChecker:
+    """
+    ReadinessChecker 의존성 주입
+
+    Returns:
+        ReadinessChecker 인스턴스 (Container에서 관리)
+    """
+    return get_container().readiness
+
+
+def get_app_settings() -> Settings:
+    """
+    Settings 의존성 주입
+
+    Returns:
+        Container에 설정된 Settings 인스턴스
+    """
+    return get_container().settings
@@ -3,6 +3,7 @@ FastAPI Main Application
 현업 표준 구조 + DI Container
 """
 
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -11,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import get_settings
 from app.api.v1.api import api_router
 from core.container import init_container
+from core.warmup import run_warmup, format_warmup_report
 
 
 @asynccontextmanager
@@ -20,17 +22,25 @@ async def lifespan(app: FastAPI):
 
     Startup:
     - DI Container 초기화
-    - DB 연결 테스트
+    - 컴포넌트 병렬 예열 (DB 풀, 스키마, FAISS, LLM 클라이언트, 그래프 컴파일)
+      (예열을 끄면 DB 연결 테스트만)
 
     Shutdown:
-    - 정리 작업
+    - 워커 풀 등 리소스 정리
     """
     # Startup
     settings = get_settings()
     container = init_container(settings)
-
-    # DB 연결 테스트 (DATABASE_URL이 설정된 경우에만)
-    if settings.DATABASE_URL:
+    if container.pool_sweeper is not None:
+        container.pool_sweeper.start()
+
+    # 예열 (실패한 컴포넌트는 첫 요청 시 다시 lazy 초기화)
+    if settings.WARMUP_ENABLED:
+        started = time.perf_counter()
+        report = await run_warmup(container.warmup_phases(), timeout=settings.WARMUP_TIMEOUT)
+        print(format_warmup_report(report, (time.perf_counter() - started) * 1000))
+    elif settings.DATABASE_URL:
+        # 예열을 끈 경우에도 DB 연결 테스트는 유지
         try:
             container.db.test_connection()
             print("✅ DB 연결 성공!")
@@ -40,6 +50,7 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    await container.ashutdown()
     print("👋 애플리케이션 종료")
 
 
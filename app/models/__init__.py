@@ -4,10 +4,24 @@ Pydantic Models
 Request/Response 모델
 """
 
-from app.models.request import QueryRequest
-from app.models.response import QueryResponse, HealthResponse
+from app.models.request import QueryRequest, BatchQueryRequest
+from app.models.response import (
+    QueryResponse,
+    BatchQueryResponse,
+    HealthResponse,
+    ComponentCheck,
+    ReadinessResponse,
+)
 
-__all__ = ["QueryRequest", "QueryResponse", "HealthResponse"]
+__all__ = [
+    "QueryRequest",
+    "BatchQueryRequest",
+    "QueryResponse",
+    "BatchQueryResponse",
+    "HealthResponse",
+    "ComponentCheck",
+    "ReadinessResponse",
+]
 
 
 
@@ -4,8 +4,12 @@ Request Models
 API 요청 Pydantic 모델
 """
 
+from typing import Annotated, List, Optional
+
 from pydantic import BaseModel, Field
 
+from core.types.agent_types import AnswerMode
+
 
 class QueryRequest(BaseModel):
     """질의 요청 모델"""
@@ -17,6 +21,17 @@ class QueryRequest(BaseModel):
         max_length=500,
         example="직원은 총 몇 명인가요?"
     )
+    debug_timing: bool = Field(
+        False,
+        description="True이면 응답 본문에 단계별 소요시간(timings) 포함",
+    )
+    answer_mode: AnswerMode = Field(
+        "auto",
+        description=(
+            "SQL 결과 답변 방식: raw(결과 행 JSON), template(규칙 기반 포맷), "
+            "llm(LLM 자연어 답변), auto(단일 값은 template, 그 외 llm)"
+        ),
+    )
     
     class Config:
         json_schema_extra = {
@@ -26,5 +41,25 @@ class QueryRequest(BaseModel):
         }
 
 
+class BatchQueryRequest(BaseModel):
+    """배치 질의 요청 모델"""
 
+    questions: List[Annotated[str, Field(min_length=1, max_length=500)]] = Field(
+        ...,
+        description="사용자 질문 목록 (최대 개수는 QUERY_BATCH_MAX_SIZE, 질문별 길이 제한은 QueryRequest와 동일)",
+        min_length=1,
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        description="동시 실행 수 (미지정 시 서버 기본값, 서버 기본값보다 클 수 없음)",
+        ge=1,
+    )
+    answer_mode: AnswerMode = Field("auto", description="SQL 결과 답변 방식 (QueryRequest와 동일)")
 
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "questions": ["직원은 총 몇 명인가요?", "부서별 직원 수", "연차휴가는 몇일인가요?"],
+                "concurrency": 4,
+            }
+        }
@@ -4,7 +4,7 @@ Response Models
 API 응답 Pydantic 모델
 """
 
-from typing import Optional, Any
+from typing import Optional, Any, List, Dict
 from pydantic import BaseModel, Field
 
 
@@ -16,6 +16,10 @@ class QueryResponse(BaseModel):
     agent_type: str = Field(..., description="사용된 Agent 타입 (SQL_AGENT | RAG_AGENT)")
     success: bool = Field(..., description="성공 여부")
     error: Optional[str] = Field(None, description="오류 메시지 (실패 시)")
+    timings: Optional[Dict[str, float]] = Field(
+        None,
+        description="단계별 소요시간(ms) (debug_timing=true일 때만)",
+    )
     
     class Config:
         json_schema_extra = {
@@ -29,6 +33,35 @@ class QueryResponse(BaseModel):
         }
 
 
+class BatchQueryResponse(BaseModel):
+    """배치 질의 응답 모델"""
+
+    results: List[QueryResponse] = Field(..., description="질문별 결과 (입력 순서)")
+    total: int = Field(..., description="전체 질문 수")
+    unique: int = Field(..., description="중복 제거 후 실제 처리한 질문 수")
+    succeeded: int = Field(..., description="성공 건수")
+    failed: int = Field(..., description="실패 건수")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "results": [
+                    {
+                        "question": "직원은 총 몇 명인가요?",
+                        "answer": "15명",
+                        "agent_type": "SQL_AGENT",
+                        "success": True,
+                        "error": None
+                    }
+                ],
+                "total": 1,
+                "unique": 1,
+                "succeeded": 1,
+                "failed": 0
+            }
+        }
+
+
 class HealthResponse(BaseModel):
     """헬스체크 응답 모델"""
     
@@ -44,5 +77,30 @@ class HealthResponse(BaseModel):
         }
 
 
+class ComponentCheck(BaseModel):
+    """컴포넌트 점검 결과"""
 
+    ok: bool = Field(..., description="정상 여부")
+    detail: Optional[str] = Field(None, description="상세 (오류 메시지 또는 상태 요약)")
+    latency_ms: float = Field(..., description="점검 소요 시간(ms)")
 
+
+class ReadinessResponse(BaseModel):
+    """Readiness 응답 모델"""
+
+    status: str = Field(..., description="ready | not_ready")
+    checks: Dict[str, ComponentCheck] = Field(..., description="컴포넌트별 점검 결과")
+    cached: bool = Field(..., description="캐시된 결과 여부 (HEALTH_CHECK_TTL 이내)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": "ready",
+                "checks": {
+                    "database": {"ok": True, "detail": "Pool size: 5 ...", "latency_ms": 3.2},
+                    "faiss_index": {"ok": True, "detail": "97 vectors", "latency_ms": 0.1},
+                    "llm": {"ok": True, "detail": "openai reachable (200)", "latency_ms": 180.4}
+                },
+                "cached": False
+            }
+        }
@@ -4,16 +4,24 @@ HR Agent - 통합 HR Agent (LangGraph 기반)
 사용법:
     agent = HRAgent(router=router, sql_agent=sql_agent, rag_agent=rag_agent)
     result = agent.query("직원 수는?")
+
+    # 비동기
+    result = await agent.aquery("직원 수는?")
 """
 
-from typing import Literal
+from contextlib import nullcontext
+from typing import AsyncIterator, Dict, Literal, Optional
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
-from core.types.agent_types import HRAgentState, AgentResult
+from core.types.agent_types import AnswerMode, HRAgentState, AgentResult, StreamEvent
 from core.routing.router import Router
 from core.agents.sql_agent import SQLAgent
 from core.agents.rag_agent import RAGAgent
+from core.concurrency.bulkhead import Bulkhead
+from core.observability.metrics import ROUTER_DECISIONS
+from core.types.errors import OverloadedError
 
 
 class HRAgent:
@@ -23,6 +31,7 @@ class HRAgent:
     - 의존성 주입으로 Router, SQLAgent, RAGAgent 받음
     - Router로 질문 분류
     - SQL Agent 또는 RAG Agent로 처리
+    - Agent별 bulkhead로 동시 실행 수 제한 (한도 초과 시 OverloadedError)
     """
 
     def __init__(
@@ -31,6 +40,7 @@ class HRAgent:
         sql_agent: SQLAgent,  # 의존성 주입
         rag_agent: RAGAgent,  # 의존성 주입
         verbose: bool = False,
+        bulkheads: Optional[Dict[str, Bulkhead]] = None,
     ):
         """
         Args:
@@ -38,11 +48,13 @@ class HRAgent:
             sql_agent: SQLAgent 인스턴스 (주입)
             rag_agent: RAGAgent 인스턴스 (주입)
             verbose: 디버그 출력 여부
+            bulkheads: Agent 타입("SQL_AGENT" | "RAG_AGENT")별 Bulkhead (None이면 제한 없음)
         """
         self.router = router
         self.sql_agent = sql_agent
         self.rag_agent = rag_agent
         self.verbose = verbose
+        self.bulkheads = bulkheads or {}
 
         self.app = self._build_graph()
 
@@ -55,49 +67,101 @@ class HRAgent:
         """질문을 분석하여 Agent 선택"""
         try:
             agent_type = self.router.route(state["question"])
-            self._log(f"[Router] 질문: {state['question']}")
-            self._log(f"[Router] 선택된 Agent: {agent_type}")
-            return {**state, "agent_type": agent_type}
+            return self._apply_route(state, agent_type)
+        except Exception as e:
+            return self._apply_route_error(state, e)
+
+    async def _aroute_node(self, state: HRAgentState) -> HRAgentState:
+        """_route_node()의 비동기 버전"""
+        try:
+            agent_type = await self.router.aroute(state["question"])
+            return self._apply_route(state, agent_type)
         except Exception as e:
-            # 라우팅 실패 시 RAG로 폴백
-            self._log(f"[Router] 오류, RAG로 폴백: {e}")
-            return {**state, "agent_type": "RAG_AGENT", "error": str(e)}
+            return self._apply_route_error(state, e)
+
+    def _apply_route(self, state: HRAgentState, agent_type: str) -> HRAgentState:
+        self._log(f"[Router] 질문: {state['question']}")
+        self._log(f"[Router] 선택된 Agent: {agent_type}")
+        ROUTER_DECISIONS.labels(agent_type=agent_type, fallback="false").inc()
+        return {**state, "agent_type": agent_type}
+
+    def _apply_route_error(self, state: HRAgentState, e: Exception) -> HRAgentState:
+        # 라우팅 실패 시 RAG로 폴백
+        self._log(f"[Router] 오류, RAG로 폴백: {e}")
+        ROUTER_DECISIONS.labels(agent_type="RAG_AGENT", fallback="true").inc()
+        return {**state, "agent_type": "RAG_AGENT", "error": str(e)}
+
+    def _bulkhead(self, agent_type: str):
+        """Agent 타입의 bulkhead (없으면 no-op 컨텍스트)"""
+        return self.bulkheads.get(agent_type) or nullcontext()
 
     def _sql_agent_node(self, state: HRAgentState) -> HRAgentState:
         """SQL Agent 실행"""
         self._log("[SQL Agent] 질문 처리 중...")
 
         try:
-            result = self.sql_agent.query(state["question"])
-            self._log("[SQL Agent] 완료")
-            return {**state, "agent_result": result, "error": ""}
+            with self._bulkhead("SQL_AGENT"):
+                result = self.sql_agent.query(state["question"], answer_mode=state["answer_mode"])
+            return self._apply_agent_result(state, "SQL", result)
+        except OverloadedError:
+            raise
         except Exception as e:
-            self._log(f"[SQL Agent] 오류: {e}")
-            error_result = AgentResult(
-                success=False,
-                answer=f"SQL Agent 오류: {str(e)}",
-                metadata={"agent_type": "SQL_AGENT"},
-                error=str(e),
-            )
-            return {**state, "agent_result": error_result, "error": str(e)}
+            return self._apply_agent_error(state, "SQL", e)
+
+    async def _asql_agent_node(self, state: HRAgentState) -> HRAgentState:
+        """_sql_agent_node()의 비동기 버전"""
+        self._log("[SQL Agent] 질문 처리 중...")
+
+        try:
+            async with self._bulkhead("SQL_AGENT"):
+                result = await self.sql_agent.aquery(
+                    state["question"], answer_mode=state["answer_mode"]
+                )
+            return self._apply_agent_result(state, "SQL", result)
+        except OverloadedError:
+            raise
+        except Exception as e:
+            return self._apply_agent_error(state, "SQL", e)
 
     def _rag_agent_node(self, state: HRAgentState) -> HRAgentState:
         """RAG Agent 실행"""
         self._log("[RAG Agent] 질문 처리 중...")
 
         try:
-            result = self.rag_agent.query(state["question"])
-            self._log("[RAG Agent] 완료")
-            return {**state, "agent_result": result, "error": ""}
+            with self._bulkhead("RAG_AGENT"):
+                result = self.rag_agent.query(state["question"])
+            return self._apply_agent_result(state, "RAG", result)
+        except OverloadedError:
+            raise
         except Exception as e:
-            self._log(f"[RAG Agent] 오류: {e}")
-            error_result = AgentResult(
-                success=False,
-                answer=f"RAG Agent 오류: {str(e)}",
-                metadata={"agent_type": "RAG_AGENT"},
-                error=str(e),
-            )
-            return {**state, "agent_result": error_result, "error": str(e)}
+            return self._apply_agent_error(state, "RAG", e)
+
+    async def _arag_agent_node(self, state: HRAgentState) -> HRAgentState:
+        """_rag_agent_node()의 비동기 버전"""
+        self._log("[RAG Agent] 질문 처리 중...")
+
+        try:
+            async with self._bulkhead("RAG_AGENT"):
+                result = await self.rag_agent.aquery(state["question"])
+            return self._apply_agent_result(state, "RAG", result)
+        except OverloadedError:
+            raise
+        except Exception as e:
+            return self._apply_agent_error(state, "RAG", e)
+
+    def _apply_agent_result(self, state: HRAgentState, name: str, result: AgentResult) -> HRAgentState:
+        self._log(f"[{name} Agent] 완료")
+        return {**state, "agent_result": result, "error": ""}
+
+    def _apply_agent_error(self, state: HRAgentState, name: str, e: Exception) -> HRAgentState:
+        self._log(f"[{name} Agent] 오류: {e}")
+        error_result = AgentResult(
+            success=False,
+            answer=f"{name} Agent 오류: {str(e)}",
+            metadata={"agent_type": f"{name}_AGENT"},
+            error=str(e),
+        )
+        return {**state, "agent_result": error_result, "error": str(e)}
 
     def _route_to_agent(self, state: HRAgentState) -> Literal["sql_agent", "rag_agent"]:
         """Agent 타입에 따라 다음 노드 결정"""
@@ -110,10 +174,14 @@ class HRAgent:
         """LangGraph 구성"""
         workflow = StateGraph(HRAgentState)
 
-        # 노드 추가
-        workflow.add_node("router", self._route_node)
-        workflow.add_node("sql_agent", self._sql_agent_node)
-        workflow.add_node("rag_agent", self._rag_agent_node)
+        # 노드 추가 (sync/async 구현 모두 등록 → invoke / ainvoke 공용)
+        workflow.add_node("router", RunnableLambda(self._route_node, afunc=self._aroute_node))
+        workflow.add_node(
+            "sql_agent", RunnableLambda(self._sql_agent_node, afunc=self._asql_agent_node)
+        )
+        workflow.add_node(
+            "rag_agent", RunnableLambda(self._rag_agent_node, afunc=self._arag_agent_node)
+        )
 
         # 엣지 추가
         workflow.set_entry_point("router")
@@ -131,17 +199,18 @@ class HRAgent:
 
         return workflow.compile()
 
-    def query(self, question: str) -> AgentResult:
-        """
-        질문에 대한 답변 생성
-
-        Args:
-            question: 사용자 질문
+    def _initial_state(self, question: str, answer_mode: AnswerMode = "auto") -> HRAgentState:
+        """그래프 초기 상태"""
+        return {
+            "question": question,
+            "answer_mode": answer_mode,
+            "agent_type": "",
+            "agent_result": None,
+            "error": "",
+        }
 
-        Returns:
-            AgentResult: 통일된 결과 형식
-        """
-        # 빈 문자열 검증
+    def _validate(self, question: str) -> Optional[AgentResult]:
+        """빈 문자열 검증 (실패 시 AgentResult 반환)"""
         if not question or not question.strip():
             return AgentResult(
                 success=False,
@@ -149,16 +218,10 @@ class HRAgent:
                 metadata={"agent_type": "VALIDATION"},
                 error="Empty question",
             )
+        return None
 
-        initial_state: HRAgentState = {
-            "question": question,
-            "agent_type": "",
-            "agent_result": None,
-            "error": "",
-        }
-
-        result = self.app.invoke(initial_state)
-
+    def _finalize(self, result: HRAgentState) -> AgentResult:
+        """그래프 최종 상태 → AgentResult"""
         # 하위 Agent 결과 반환
         if result.get("agent_result"):
             return result["agent_result"]
@@ -171,9 +234,88 @@ class HRAgent:
             error=result.get("error"),
         )
 
+    def query(self, question: str, answer_mode: AnswerMode = "auto") -> AgentResult:
+        """
+        질문에 대한 답변 생성
+
+        Args:
+            question: 사용자 질문
+            answer_mode: SQL Agent 답변 방식 ("auto" | "raw" | "template" | "llm")
+
+        Returns:
+            AgentResult: 통일된 결과 형식
+        """
+        invalid = self._validate(question)
+        if invalid:
+            return invalid
+
+        result = self.app.invoke(self._initial_state(question, answer_mode))
+        return self._finalize(result)
+
+    async def aquery(self, question: str, answer_mode: AnswerMode = "auto") -> AgentResult:
+        """
+        query()의 비동기 버전
+
+        Router/SQL/RAG 모두 네이티브 async 경로(ainvoke, aembed_query)를 사용하므로
+        요청마다 스레드를 점유하지 않습니다.
+
+        Args:
+            question: 사용자 질문
+            answer_mode: SQL Agent 답변 방식 ("auto" | "raw" | "template" | "llm")
+
+        Returns:
+            AgentResult: 통일된 결과 형식
+        """
+        invalid = self._validate(question)
+        if invalid:
+            return invalid
+
+        result = await self.app.ainvoke(self._initial_state(question, answer_mode))
+        return self._finalize(result)
+
+    async def astream(
+        self, question: str, answer_mode: AnswerMode = "auto"
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        단계별 이벤트 스트리밍 (SSE용)
+
+        Args:
+            question: 사용자 질문
+            answer_mode: SQL Agent 답변 방식 ("auto" | "raw" | "template" | "llm")
+
+        Yields:
+            route → (SQL: sql_generated/sql_executed | RAG: sources) → token... → done
+        """
+        invalid = self._validate(question)
+        if invalid:
+            yield StreamEvent(type="done", data=invalid)
+            return
+
+        state = await self._aroute_node(self._initial_state(question))
+        agent_type = state["agent_type"]
+        yield StreamEvent(type="route", data={"agent_type": agent_type})
+
+        if agent_type == "SQL_AGENT":
+            name, events = "SQL", self.sql_agent.astream(question, answer_mode=answer_mode)
+        else:
+            name, events = "RAG", self.rag_agent.astream(question)
+        self._log(f"[{name} Agent] 스트리밍 처리 중...")
+
+        try:
+            async with self._bulkhead(agent_type):
+                async for event in events:
+                    yield event
+        except OverloadedError:
+            raise
+        except Exception as e:
+            self._log(f"[{name} Agent] 오류: {e}")
+            yield StreamEvent(type="error", data={"message": str(e)})
+            error_state = self._apply_agent_error(state, name, e)
+            yield StreamEvent(type="done", data=error_state["agent_result"])
+
     def stream(self, question: str):
         """
-        스트리밍 응답 (향후 구현)
+        노드 단위 상태 스트리밍 (토큰/단계 이벤트는 astream 사용)
 
         Args:
             question: 사용자 질문
@@ -181,12 +323,5 @@ class HRAgent:
         Yields:
             상태 업데이트
         """
-        initial_state: HRAgentState = {
-            "question": question,
-            "agent_type": "",
-            "agent_result": None,
-            "error": "",
-        }
-
-        for state in self.app.stream(initial_state):
+        for state in self.app.stream(self._initial_state(question)):
             yield state
@@ -4,19 +4,24 @@ RAG Agent - 회사 규정 검색 및 답변 생성
 사용법:
     agent = RAGAgent(model="gpt-4o-mini")
     result = agent.query("연차는 몇일인가요?")
+
+    # 비동기
+    result = await agent.aquery("연차는 몇일인가요?")
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 
 from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough
 
-from core.types.agent_types import AgentResult
+from core.types.agent_types import AgentResult, StreamEvent
 from core.types.errors import RAGRetrievalError
 from core.llm.factory import create_chat_model, create_embeddings
+from core.observability.timing import timed
 
 
 class RAGAgent:
@@ -111,7 +116,10 @@ class RAGAgent:
 
         self.prompt = ChatPromptTemplate.from_template(template)
 
-        # RAG Chain (LCEL)
+        # 답변 Chain (검색 결과를 context로 직접 주입)
+        self.answer_chain = self.prompt | self.llm | StrOutputParser()
+
+        # RAG Chain (LCEL, 검색 포함)
         self.rag_chain = (
             {
                 "context": self.retriever | self._format_docs,
@@ -126,6 +134,41 @@ class RAGAgent:
         """검색된 문서를 문자열로 포맷팅"""
         return "\n\n".join(doc.page_content for doc in docs)
 
+    def _retrieve(self, question: str) -> List[Document]:
+        """질문 임베딩 → FAISS 검색"""
+        with timed("embedding"):
+            embedding = self.embeddings.embed_query(question)
+        with timed("faiss_search"):
+            return self.vectorstore.similarity_search_by_vector(embedding, k=self.top_k)
+
+    async def _aretrieve(self, question: str) -> List[Document]:
+        """_retrieve()의 비동기 버전 (aembed_query 사용)"""
+        with timed("embedding"):
+            embedding = await self.embeddings.aembed_query(question)
+        with timed("faiss_search"):
+            return await self.vectorstore.asimilarity_search_by_vector(embedding, k=self.top_k)
+
+    def _build_result(self, answer: str, source_docs: List[Document]) -> AgentResult:
+        """성공 결과 생성"""
+        return AgentResult(
+            success=True,
+            answer=answer,
+            metadata={
+                "agent_type": "RAG_AGENT",
+                "source_docs": [doc.page_content[:200] for doc in source_docs],
+            },
+            error=None,
+        )
+
+    def _build_error(self, e: Exception) -> AgentResult:
+        """실패 결과 생성"""
+        return AgentResult(
+            success=False,
+            answer="",
+            metadata={"agent_type": "RAG_AGENT", "source_docs": []},
+            error=str(e),
+        )
+
     def query(self, question: str) -> AgentResult:
         """
         질문에 대한 답변 생성
@@ -137,30 +180,75 @@ class RAGAgent:
             AgentResult: 통일된 결과 형식
         """
         try:
-            # 검색
-            source_docs = self.retriever.invoke(question)
+            # 검색 (1회만 수행하고 답변 생성에 재사용)
+            source_docs = self._retrieve(question)
 
             # 답변 생성
-            answer = self.rag_chain.invoke(question)
-
-            return AgentResult(
-                success=True,
-                answer=answer,
-                metadata={
-                    "agent_type": "RAG_AGENT",
-                    "source_docs": [doc.page_content[:200] for doc in source_docs],
-                },
-                error=None,
-            )
+            with timed("rag_llm"):
+                answer = self.answer_chain.invoke(
+                    {"context": self._format_docs(source_docs), "question": question}
+                )
+
+            return self._build_result(answer, source_docs)
+
+        except Exception as e:
+            return self._build_error(e)
+
+    async def aquery(self, question: str) -> AgentResult:
+        """
+        query()의 비동기 버전
+
+        Args:
+            question: 사용자 질문
+
+        Returns:
+            AgentResult: 통일된 결과 형식
+        """
+        try:
+            source_docs = await self._aretrieve(question)
+
+            with timed("rag_llm"):
+                answer = await self.answer_chain.ainvoke(
+                    {"context": self._format_docs(source_docs), "question": question}
+                )
+
+            return self._build_result(answer, source_docs)
 
         except Exception as e:
-            return AgentResult(
-                success=False,
-                answer="",
-                metadata={"agent_type": "RAG_AGENT", "source_docs": []},
-                error=str(e),
+            return self._build_error(e)
+
+    async def astream(self, question: str) -> AsyncIterator[StreamEvent]:
+        """
+        단계별 이벤트 스트리밍
+
+        Args:
+            question: 사용자 질문
+
+        Yields:
+            sources → token... → done
+        """
+        try:
+            source_docs = await self._aretrieve(question)
+            yield StreamEvent(
+                type="sources",
+                data={"source_docs": [doc.page_content[:200] for doc in source_docs]},
             )
 
+            chunks = []
+            with timed("rag_llm"):
+                async for chunk in self.answer_chain.astream(
+                    {"context": self._format_docs(source_docs), "question": question}
+                ):
+                    chunks.append(chunk)
+                    yield StreamEvent(type="token", data={"text": chunk})
+
+            result = self._build_result("".join(chunks), source_docs)
+
+        except Exception as e:
+            result = self._build_error(e)
+
+        yield StreamEvent(type="done", data=result)
+
     def stream(self, question: str):
         """
         스트리밍 응답 생성
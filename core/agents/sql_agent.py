@@ -6,18 +6,140 @@ SQL Agent (Refactored)
     db = DatabaseConnection(connection_url="...")
     agent = SQLAgent(db=db, model="gpt-4o-mini")
     result = agent.query("직원 수는?")
+
+    # 비동기
+    result = await agent.aquery("직원 수는?")
+
+    # 후보 SQL 3개를 동시에 생성/실행, 먼저 성공한 결과 사용
+    agent = SQLAgent(db=db, candidates=3)
 """
 
+import asyncio
+import contextvars
+import json
 import re
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
+from core.database.async_connection import AsyncDatabaseConnection
 from core.database.connection import DatabaseConnection
-from core.types.agent_types import SQLAgentState, AgentResult
+from core.database.cost_guard import QueryCostGuard
+from core.database.result_cache import ResultCache
+from core.database.schema_cache import SchemaCache, SchemaEntry
+from core.sql.schema_linking import LinkResult, SchemaLinker
+from core.sql.few_shot import FewShotMatch, FewShotRetriever, render_examples
+from core.sql.repair import SQLRepairer
+from core.sql.row_limit import inject_limit
+from core.sql.sql_cache import SQLCache
+from core.sql.validator import SQLValidator
+from core.types.agent_types import ANSWER_MODES, AnswerMode, SQLAgentState, AgentResult, StreamEvent
 from core.llm.factory import create_chat_model
+from core.observability.metrics import SQL_ATTEMPTS
+from core.observability.timing import timed
+
+
+# --------------------------
+# Prompts
+# --------------------------
+SQL_GENERATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """
+당신은 MySQL Text-to-SQL 전문가입니다.
+
+⚠️ 절대 규칙:
+1. 스키마에 존재하는 컬럼/테이블만 사용할 것
+2. SELECT 쿼리만 생성 (UPDATE/DELETE 금지)
+3. 설명/문장/마크다운/백틱 금지
+4. 반드시 SQL로만 응답 (세미콜론으로 종료)
+5. 새로운 컬럼명을 창조하지 말 것 (salary, annual_salary 금지)
+6. 부서명 조회 시 departments.name 을 사용
+7. employees.dept_id ↔ departments.dept_id 관계 사용
+8. 평균 → AVG(), 수 → COUNT(), 부서별 → GROUP BY
+""",
+        ),
+        (
+            "user",
+            """
+=== SCHEMA START ===
+{schema}
+=== SCHEMA END ===
+
+{examples}
+
+사용자 질문:
+{question}
+
+SQL만 출력하세요.
+""",
+        ),
+    ]
+)
+
+# 후보 SQL 생성용 (후보마다 다른 지침 + temperature > 0으로 다양화)
+SQL_CANDIDATE_PROMPT = SQL_GENERATION_PROMPT + [("user", "추가 지침: {hint}")]
+
+CANDIDATE_HINTS = [
+    "테이블 간 관계는 JOIN ... ON 으로 명시적으로 작성하세요.",
+    "필요하면 서브쿼리를 사용하고, 집계 전에 WHERE로 먼저 거르세요.",
+    "질문의 조건(부서명, 상태, 기간)을 빠짐없이 WHERE 절에 반영하세요.",
+]
+
+# "first": 가장 먼저 성공한 후보 / "majority": 모든 후보 실행 후 가장 많은 후보가 낸 결과
+CANDIDATE_STRATEGIES = ("first", "majority")
+
+SQL_CORRECTION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """
+당신은 SQL 오류 수정 전문가입니다.
+
+규칙:
+- SELECT 문만 출력
+- 설명/문장 금지
+- 스키마에 있는 컬럼만 사용
+- 세미콜론으로 끝날 것
+""",
+        ),
+        (
+            "user",
+            """
+=== SCHEMA START ===
+{schema}
+=== SCHEMA END ===
+
+원본 질문:
+{question}
+
+실패한 SQL:
+{sql}
+
+MySQL 오류:
+{error}
+
+수정된 SQL만 출력하세요.
+""",
+        ),
+    ]
+)
+
+# 링킹된 스키마에 없는 테이블/컬럼을 참조한 오류 (MySQL 1146, 1054)
+SCHEMA_MISS_ERROR = re.compile(r"\b(1146|1054)\b|doesn't exist|Unknown column", re.I)
+
+# 규칙 기반 수정 반복 횟수 (수정 → 검증 → 다음 오류 수정)
+MAX_REPAIR_PASSES = 3
+
+ANSWER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "SQL 조회 결과를 바탕으로 질문에 자연스러운 한국어로 답변하세요. 간결하게 핵심만 답하세요."),
+    ("user", "질문: {question}\n\nSQL 결과: {results}\n\n답변:")
+])
 
 
 class SQLAgent:
@@ -36,6 +158,19 @@ class SQLAgent:
         max_attempts: int = 3,
         provider: str = "openai",  # LLM Provider ("openai" | "ollama")
         base_url: Optional[str] = None,  # Ollama 서버 URL
+        schema_cache: Optional[SchemaCache] = None,  # 스키마 캐시 (주입)
+        schema_linker: Optional[SchemaLinker] = None,  # 스키마 링커 (None이면 전체 스키마)
+        sql_cache: Optional[SQLCache] = None,  # NL → SQL 캐시 (None이면 매번 생성)
+        result_cache: Optional[ResultCache] = None,  # SQL 결과 캐시 (None이면 매번 실행)
+        sql_validator: Optional[SQLValidator] = None,  # 실행 전 로컬 검증 (None이면 생략)
+        sql_repairer: Optional[SQLRepairer] = None,  # 규칙 기반 수정 (None이면 바로 LLM 보정)
+        candidates: int = 1,  # 동시에 생성/실행할 후보 SQL 수 (1이면 순차 생성)
+        candidate_strategy: str = "first",  # 후보 선택 방식 ("first" | "majority")
+        candidate_temperature: float = 0.7,  # 두 번째 후보부터 사용할 temperature
+        few_shot: Optional[FewShotRetriever] = None,  # 유사 질문 SQL 예시 (None이면 예시 없이 생성)
+        max_rows: Optional[int] = None,  # 결과 최대 행 수 (None이면 제한 없음)
+        cost_guard: Optional[QueryCostGuard] = None,  # 실행 전 EXPLAIN 비용 검사 (None이면 생략)
+        async_db: Optional[AsyncDatabaseConnection] = None,  # async 경로 SQL 실행 (None이면 워커 스레드)
     ):
         """
         Args:
@@ -44,8 +179,42 @@ class SQLAgent:
             max_attempts: Self-Correction 최대 시도 횟수
             provider: LLM Provider ("openai" 또는 "ollama")
             base_url: Ollama 서버 URL (ollama일 때만 사용)
+            schema_cache: SchemaCache 인스턴스 (None이면 기본 TTL로 생성)
+            schema_linker: SchemaLinker 인스턴스 (질문 관련 테이블만 프롬프트에 포함)
+            sql_cache: SQLCache 인스턴스 (hit 시 SQL 생성 LLM 호출 생략)
+            result_cache: ResultCache 인스턴스 (hit 시 DB 실행 생략)
+            sql_validator: SQLValidator 인스턴스 (검증 실패 시 DB 실행 없이 바로 보정)
+            sql_repairer: SQLRepairer 인스턴스 (수정 성공 시 LLM 보정 호출 생략)
+            candidates: 후보 SQL 수 (2 이상이면 첫 시도에서 후보를 동시에 생성/실행)
+            candidate_strategy: "first" (먼저 성공한 후보) 또는 "majority" (다수결)
+            candidate_temperature: 첫 후보(temperature=0) 외 후보의 temperature
+            few_shot: FewShotRetriever 인스턴스 (생성 프롬프트에 예시 포함, 성공한 SQL로 확장)
+            max_rows: 결과 최대 행 수 (실행 시 LIMIT max_rows + 1 주입, 초과 시 truncated=True)
+            cost_guard: QueryCostGuard 인스턴스 (예상 검사 행 수 초과 시 실행 없이 보정)
+            async_db: AsyncDatabaseConnection 인스턴스 (aquery/astream에서 스레드 없이 SQL 실행)
+
+        Raises:
+            ValueError: 지원하지 않는 candidate_strategy
         """
+        if candidate_strategy not in CANDIDATE_STRATEGIES:
+            raise ValueError(
+                f"지원하지 않는 후보 선택 방식입니다: {candidate_strategy}. "
+                f"{', '.join(CANDIDATE_STRATEGIES)} 중 하나를 사용하세요."
+            )
+
         self.db = db
+        self.schema_cache = schema_cache or SchemaCache(db, async_db=async_db)
+        self.schema_linker = schema_linker
+        self.sql_cache = sql_cache
+        self.result_cache = result_cache
+        self.sql_validator = sql_validator
+        self.sql_repairer = sql_repairer
+        self.candidates = max(1, candidates)
+        self.candidate_strategy = candidate_strategy
+        self.few_shot = few_shot
+        self.max_rows = max_rows
+        self.cost_guard = cost_guard
+        self.async_db = async_db
         self.model = model
         self.max_attempts = max_attempts
         self.provider = provider
@@ -58,112 +227,467 @@ class SQLAgent:
             temperature=0,
             base_url=base_url
         )
+
+        # 체인 (LCEL) - sync/async 공용
+        self.sql_chain = SQL_GENERATION_PROMPT | self.llm | StrOutputParser()
+        self.correction_chain = SQL_CORRECTION_PROMPT | self.llm | StrOutputParser()
+        self.answer_chain = ANSWER_PROMPT | self.llm | StrOutputParser()
+
+        # 후보 SQL 체인 (첫 후보는 sql_chain 그대로 사용)
+        self.candidate_chain = None
+        if self.candidates > 1:
+            candidate_llm = create_chat_model(
+                provider=provider,
+                model=model,
+                temperature=candidate_temperature,
+                base_url=base_url,
+            )
+            self.candidate_chain = SQL_CANDIDATE_PROMPT | candidate_llm | StrOutputParser()
+
         self.app = self._build_workflow()
 
-    def query(self, question: str) -> AgentResult:
+    def _initial_state(
+        self,
+        question: str,
+        entry: SchemaEntry,
+        link: Optional[LinkResult] = None,
+        cached_sql: Optional[str] = None,
+    ) -> SQLAgentState:
+        """워크플로우 초기 상태 (cached_sql이 있으면 생성 단계 없이 실행부터)"""
+        return {
+            "question": question,
+            "schema": link.schema if link else entry.text,
+            "full_schema": entry.text if link and not link.fallback else None,
+            "snapshot": entry.snapshot,
+            "sql": cached_sql or "",
+            "error": None,
+            "results": None,
+            "attempt": 1 if cached_sql else 0,
+            "max_attempts": self.max_attempts,
+            "repairs": [],
+            "candidates": [],
+            "examples": [] if cached_sql else self._retrieve_examples(question),
+            "truncated": False,
+        }
+
+    def _is_success(self, final: SQLAgentState) -> bool:
+        """워크플로우 최종 상태의 성공 여부"""
+        return final["error"] is None and final["results"] is not None
+
+    def _build_result(
+        self,
+        final: SQLAgentState,
+        answer: str,
+        link: Optional[LinkResult] = None,
+        cached_sql: Optional[str] = None,
+        answer_mode: Optional[str] = None,
+    ) -> AgentResult:
+        """통일된 AgentResult 형식으로 변환"""
+        success = self._is_success(final)
+        SQL_ATTEMPTS.labels(success=str(success).lower()).observe(final["attempt"])
+        metadata = {
+            "agent_type": "SQL_AGENT",
+            "sql": final["sql"],
+            "results": final["results"],
+            "attempts": final["attempt"],
+            "truncated": final["truncated"],
+        }
+        if answer_mode is not None:
+            metadata["answer_mode"] = answer_mode
+        if link is not None:
+            metadata["schema_linking"] = link.report()
+        if self.sql_cache is not None:
+            metadata["sql_cache"] = "hit" if cached_sql else "miss"
+        if self.sql_repairer is not None:
+            metadata["repairs"] = final["repairs"]
+        if self.candidates > 1:
+            metadata["candidates"] = final["candidates"]
+        if self.few_shot is not None:
+            metadata["few_shot"] = [
+                {"question": m.question, "score": m.score, "source": m.source} for m in final["examples"]
+            ]
+        return AgentResult(
+            success=success,
+            answer=answer,
+            metadata=metadata,
+            error=final["error"],
+        )
+
+    def query(self, question: str, answer_mode: AnswerMode = "auto") -> AgentResult:
         """
         질문에 대한 답변 생성
 
         Args:
             question: 사용자 질문
+            answer_mode: 답변 방식 ("auto" | "raw" | "template" | "llm")
 
         Returns:
             AgentResult: 통일된 결과 형식
         """
-        # 매 요청마다 최신 스키마 로딩
-        schema = self.db.get_table_schema()
+        self._check_answer_mode(answer_mode)
+        entry, link = self._load_schema(question)
+        cached_sql = self._lookup_sql(question, entry)
 
-        state: SQLAgentState = {
-            "question": question,
-            "schema": schema,
-            "sql": "",
-            "error": None,
-            "results": None,
-            "attempt": 0,
-            "max_attempts": self.max_attempts,
-        }
+        final = self.app.invoke(self._initial_state(question, entry, link, cached_sql))
+        self._update_sql_cache(question, entry, final, cached_sql)
+        self._learn_example(question, final)
 
-        final = self.app.invoke(state)
+        mode = self._resolve_answer_mode(answer_mode, final)
+        answer = self._direct_answer(final, mode)
+        if answer is None:
+            answer = self._generate_answer(question, final["results"])
 
-        # 통일된 AgentResult 형식으로 변환
-        success = final["error"] is None and final["results"] is not None
+        return self._build_result(final, answer, link, cached_sql, mode)
 
-        if success:
-            answer = self._generate_answer(question, final["results"])
+    async def aquery(self, question: str, answer_mode: AnswerMode = "auto") -> AgentResult:
+        """
+        query()의 비동기 버전
+
+        LLM 호출은 ainvoke, DB 호출은 별도 스레드에서 실행합니다.
+
+        Args:
+            question: 사용자 질문
+            answer_mode: 답변 방식 ("auto" | "raw" | "template" | "llm")
+
+        Returns:
+            AgentResult: 통일된 결과 형식
+        """
+        self._check_answer_mode(answer_mode)
+        entry, link = await self._aload_schema(question)
+        cached_sql = await self._alookup_sql(question, entry)
+
+        final = await self.app.ainvoke(self._initial_state(question, entry, link, cached_sql))
+        await asyncio.to_thread(self._update_sql_cache, question, entry, final, cached_sql)
+        self._learn_example(question, final)
+
+        mode = self._resolve_answer_mode(answer_mode, final)
+        answer = self._direct_answer(final, mode)
+        if answer is None:
+            answer = await self._agenerate_answer(question, final["results"])
+
+        return self._build_result(final, answer, link, cached_sql, mode)
+
+    async def astream(
+        self, question: str, answer_mode: AnswerMode = "auto"
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        단계별 이벤트 스트리밍
+
+        Args:
+            question: 사용자 질문
+            answer_mode: 답변 방식 ("auto" | "raw" | "template" | "llm")
+
+        Yields:
+            sql_generated → sql_executed (재시도 시 반복) → token... → done
+        """
+        self._check_answer_mode(answer_mode)
+        entry, link = await self._aload_schema(question)
+        cached_sql = await self._alookup_sql(question, entry)
+        final = self._initial_state(question, entry, link, cached_sql)
+
+        if cached_sql:
+            yield StreamEvent(
+                type="sql_generated",
+                data={"sql": cached_sql, "attempt": final["attempt"], "cached": True},
+            )
+
+        # 노드 단위 업데이트 → 단계 이벤트
+        async for update in self.app.astream(final, stream_mode="updates"):
+            for node, state in update.items():
+                final = state
+                if node in ("generate_sql", "correction"):
+                    yield StreamEvent(
+                        type="sql_generated",
+                        data={"sql": state["sql"], "attempt": state["attempt"]},
+                    )
+                elif node == "generate_candidates":
+                    results = state["results"]
+                    yield StreamEvent(
+                        type="sql_generated",
+                        data={
+                            "sql": state["sql"],
+                            "attempt": state["attempt"],
+                            "candidates": len(state["candidates"]),
+                        },
+                    )
+                    yield StreamEvent(
+                        type="sql_executed",
+                        data={
+                            "row_count": len(results) if results is not None else 0,
+                            "error": state["error"],
+                        },
+                    )
+                elif node == "repair" and state["error"] is None:
+                    yield StreamEvent(
+                        type="sql_generated",
+                        data={"sql": state["sql"], "attempt": state["attempt"], "repaired": True},
+                    )
+                elif node == "execute_sql":
+                    results = state["results"]
+                    yield StreamEvent(
+                        type="sql_executed",
+                        data={
+                            "row_count": len(results) if results is not None else 0,
+                            "error": state["error"],
+                        },
+                    )
+        await asyncio.to_thread(self._update_sql_cache, question, entry, final, cached_sql)
+        self._learn_example(question, final)
+
+        # 답변 토큰 (LLM 답변만 토큰 단위, 나머지는 한 번에)
+        mode = self._resolve_answer_mode(answer_mode, final)
+        answer = self._direct_answer(final, mode)
+        if answer is None:
+            chunks = []
+            with timed("sql_answer_llm"):
+                async for chunk in self.answer_chain.astream(
+                    {"question": question, "results": str(final["results"])}
+                ):
+                    chunks.append(chunk)
+                    yield StreamEvent(type="token", data={"text": chunk})
+            answer = "".join(chunks)
         else:
-            answer = f"SQL 실행 오류: {final['error']}"
+            yield StreamEvent(type="token", data={"text": answer})
 
-        return AgentResult(
-            success=success,
-            answer=answer,
-            metadata={
-                "agent_type": "SQL_AGENT",
-                "sql": final["sql"],
-                "results": final["results"],
-                "attempts": final["attempt"],
-            },
-            error=final["error"],
+        yield StreamEvent(
+            type="done", data=self._build_result(final, answer, link, cached_sql, mode)
         )
 
+    def _load_schema(self, question: str) -> Tuple[SchemaEntry, Optional[LinkResult]]:
+        """스키마 로딩 (캐시 → 변경 시에만 DB 재조회) + 스키마 링킹"""
+        with timed("schema_load"):
+            entry = self.schema_cache.get_entry()
+        return entry, self._link_schema(question, entry)
+
+    async def _aload_schema(self, question: str) -> Tuple[SchemaEntry, Optional[LinkResult]]:
+        """_load_schema()의 비동기 버전 (SchemaCache.aget_entry 참고)"""
+        with timed("schema_load"):
+            entry = await self.schema_cache.aget_entry()
+        return entry, self._link_schema(question, entry)
+
+    def _link_schema(self, question: str, entry: SchemaEntry) -> Optional[LinkResult]:
+        """질문 관련 테이블만 남긴 스키마 (링커 미설정/스키마 추출 실패 시 None)"""
+        if self.schema_linker is None or entry.snapshot is None:
+            return None
+        with timed("schema_linking"):
+            return self.schema_linker.link(question, entry.snapshot, entry.text)
+
+    # --------------------------
+    # NL → SQL Cache
+    # --------------------------
+    @property
+    def _cache_model(self) -> str:
+        return f"{self.provider}:{self.model}"
+
+    def _lookup_sql(self, question: str, entry: SchemaEntry) -> Optional[str]:
+        """캐시된 SQL (캐시 미설정/스키마 추출 실패 시 None)"""
+        if self.sql_cache is None or entry.structure_hash is None:
+            return None
+        with timed("sql_cache_lookup"):
+            return self.sql_cache.get(question, entry.structure_hash, self._cache_model)
+
+    async def _alookup_sql(self, question: str, entry: SchemaEntry) -> Optional[str]:
+        """_lookup_sql()의 비동기 버전 (sqlite 조회는 _update_sql_cache와 같이 워커 스레드에서)"""
+        if self.sql_cache is None or entry.structure_hash is None:
+            return None
+        return await asyncio.to_thread(self._lookup_sql, question, entry)
+
+    def _update_sql_cache(
+        self, question: str, entry: SchemaEntry, final: SQLAgentState, cached_sql: Optional[str]
+    ):
+        """실행 성공한 새 SQL은 저장, 실패한 캐시 SQL은 삭제"""
+        if self.sql_cache is None or entry.structure_hash is None:
+            return
+        if self._is_success(final):
+            if final["sql"] != cached_sql:
+                self.sql_cache.put(question, entry.structure_hash, self._cache_model, final["sql"])
+        elif cached_sql is not None:
+            self.sql_cache.delete(question, entry.structure_hash, self._cache_model)
+
+    # --------------------------
+    # Few-shot Examples
+    # --------------------------
+    def _retrieve_examples(self, question: str) -> List[FewShotMatch]:
+        """생성 프롬프트에 넣을 유사 예시 (retriever 미설정 시 빈 목록)"""
+        if self.few_shot is None:
+            return []
+        with timed("sql_few_shot"):
+            return self.few_shot.search(question)
+
+    def _learn_example(self, question: str, final: SQLAgentState):
+        """실행에 성공한 SQL을 예시 인덱스에 추가"""
+        if self.few_shot is not None and self._is_success(final):
+            self.few_shot.add(question, final["sql"])
+
+    # --------------------------
+    # Answer
+    # --------------------------
+    def _check_answer_mode(self, answer_mode: str):
+        if answer_mode not in ANSWER_MODES:
+            raise ValueError(
+                f"지원하지 않는 답변 방식입니다: {answer_mode}. {', '.join(ANSWER_MODES)} 중 하나를 사용하세요."
+            )
+
+    def _resolve_answer_mode(self, answer_mode: AnswerMode, final: SQLAgentState) -> str:
+        """auto → 단일 값/빈 결과는 template, 그 외 llm"""
+        if answer_mode != "auto":
+            return answer_mode
+        results = final["results"]
+        if not results or (len(results) == 1 and len(results[0]) == 1):
+            return "template"
+        return "llm"
+
+    def _direct_answer(self, final: SQLAgentState, mode: str) -> Optional[str]:
+        """LLM 없이 만드는 답변 (None이면 LLM 답변 필요)"""
+        if not self._is_success(final):
+            return f"SQL 실행 오류: {final['error']}"
+        if mode == "raw":
+            return json.dumps(final["results"], ensure_ascii=False, default=str)
+        if mode == "template" or not final["results"]:
+            with timed("sql_answer_template"):
+                answer = self._format_results(final["results"])
+            if final["truncated"]:
+                answer += f"\n(결과가 많아 상위 {len(final['results'])}행만 표시합니다.)"
+            return answer
+        return None
+
     def _generate_answer(self, question: str, results: List[Dict[str, Any]]) -> str:
         """LLM으로 자연어 답변 생성"""
         if not results:
             return "조회 결과가 없습니다."
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "SQL 조회 결과를 바탕으로 질문에 자연스러운 한국어로 답변하세요. 간결하게 핵심만 답하세요."),
-            ("user", "질문: {question}\n\nSQL 결과: {results}\n\n답변:")
-        ])
+        with timed("sql_answer_llm"):
+            return self.answer_chain.invoke({"question": question, "results": str(results)})
+
+    async def _agenerate_answer(self, question: str, results: List[Dict[str, Any]]) -> str:
+        """_generate_answer()의 비동기 버전"""
+        if not results:
+            return "조회 결과가 없습니다."
 
-        chain = prompt | self.llm | StrOutputParser()
-        return chain.invoke({"question": question, "results": str(results)})
+        with timed("sql_answer_llm"):
+            return await self.answer_chain.ainvoke({"question": question, "results": str(results)})
 
     # --------------------------
     # Node: SQL Generation
     # --------------------------
     def _generate_sql_node(self, state: SQLAgentState) -> SQLAgentState:
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    """
-당신은 MySQL Text-to-SQL 전문가입니다.
+        with timed(f"sql_generate_{state['attempt'] + 1}"):
+            raw_sql = self.sql_chain.invoke(self._generation_inputs(state))
+        return self._apply_generated_sql(state, raw_sql)
 
-⚠️ 절대 규칙:
-1. 스키마에 존재하는 컬럼/테이블만 사용할 것
-2. SELECT 쿼리만 생성 (UPDATE/DELETE 금지)
-3. 설명/문장/마크다운/백틱 금지
-4. 반드시 SQL로만 응답 (세미콜론으로 종료)
-5. 새로운 컬럼명을 창조하지 말 것 (salary, annual_salary 금지)
-6. 부서명 조회 시 departments.name 을 사용
-7. employees.dept_id ↔ departments.dept_id 관계 사용
-8. 평균 → AVG(), 수 → COUNT(), 부서별 → GROUP BY
-""",
-                ),
-                (
-                    "user",
-                    """
-=== SCHEMA START ===
-{schema}
-=== SCHEMA END ===
+    async def _agenerate_sql_node(self, state: SQLAgentState) -> SQLAgentState:
+        with timed(f"sql_generate_{state['attempt'] + 1}"):
+            raw_sql = await self.sql_chain.ainvoke(self._generation_inputs(state))
+        return self._apply_generated_sql(state, raw_sql)
 
-사용자 질문:
-{question}
+    def _generation_inputs(self, state: SQLAgentState) -> Dict[str, Any]:
+        return {
+            "schema": state["schema"],
+            "question": state["question"],
+            "examples": render_examples(state["examples"]),
+        }
 
-SQL만 출력하세요.
-""",
-                ),
-            ]
-        )
+    def _apply_generated_sql(self, state: SQLAgentState, raw_sql: str) -> SQLAgentState:
+        sql = self._clean_sql(raw_sql.strip())
+        return {**state, "sql": sql, "attempt": state["attempt"] + 1}
 
-        chain = prompt | self.llm | StrOutputParser()
-        raw_sql = chain.invoke(
-            {"schema": state["schema"], "question": state["question"]}
-        ).strip()
+    # --------------------------
+    # Node: Candidate SQL (생성 + 실행을 후보별로 동시에)
+    # --------------------------
+    def _generate_candidates_node(self, state: SQLAgentState) -> SQLAgentState:
+        finished, errors = [], []
+        with timed("sql_candidates"):
+            pool = ThreadPoolExecutor(max_workers=self.candidates, thread_name_prefix="sql-candidate")
+            # 후보마다 컨텍스트 복사 (단계 타이밍 수집기 전파)
+            futures = {
+                pool.submit(contextvars.copy_context().run, self._run_candidate, state, index): index
+                for index in range(self.candidates)
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        finished.append((futures[future], future.result()))
+                    except Exception as e:
+                        errors.append(e)
+                        continue
+                    if self.candidate_strategy == "first" and self._is_success(finished[-1][1]):
+                        break
+            finally:
+                # 남은 후보는 기다리지 않음 (진행 중인 LLM/DB 호출은 끝까지 실행된 뒤 버려짐)
+                pool.shutdown(wait=False, cancel_futures=True)
+        return self._select_candidate(state, finished, errors)
 
-        sql = self._clean_sql(raw_sql)
+    async def _agenerate_candidates_node(self, state: SQLAgentState) -> SQLAgentState:
+        async def run(index: int):
+            return index, await self._arun_candidate(state, index)
 
-        return {**state, "sql": sql, "attempt": state["attempt"] + 1}
+        finished, errors = [], []
+        with timed("sql_candidates"):
+            tasks = [asyncio.create_task(run(index)) for index in range(self.candidates)]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        finished.append(await next_done)
+                    except Exception as e:
+                        errors.append(e)
+                        continue
+                    if self.candidate_strategy == "first" and self._is_success(finished[-1][1]):
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+        return self._select_candidate(state, finished, errors)
+
+    def _run_candidate(self, state: SQLAgentState, index: int) -> SQLAgentState:
+        chain, inputs = self._candidate_inputs(state, index)
+        with timed(f"sql_candidate_{index}"):
+            raw_sql = chain.invoke(inputs)
+        return self._execute_sql_node(self._apply_generated_sql(state, raw_sql))
+
+    async def _arun_candidate(self, state: SQLAgentState, index: int) -> SQLAgentState:
+        chain, inputs = self._candidate_inputs(state, index)
+        with timed(f"sql_candidate_{index}"):
+            raw_sql = await chain.ainvoke(inputs)
+        return await self._aexecute_sql_node(self._apply_generated_sql(state, raw_sql))
+
+    def _candidate_inputs(self, state: SQLAgentState, index: int):
+        """후보별 (체인, 입력) - 0번은 기본 생성 체인, 나머지는 지침/temperature로 다양화"""
+        inputs = self._generation_inputs(state)
+        if index == 0:
+            return self.sql_chain, inputs
+        return self.candidate_chain, {**inputs, "hint": CANDIDATE_HINTS[(index - 1) % len(CANDIDATE_HINTS)]}
+
+    def _select_candidate(self, state: SQLAgentState, finished, errors) -> SQLAgentState:
+        """
+        완료된 후보 중 결과 선택
+
+        - first: 가장 먼저 성공한 후보
+        - majority: 성공 후보를 결과(값 기준)로 묶어 가장 큰 묶음 (동률이면 앞 번호 후보)
+        - 모두 실패: 0번에 가장 가까운 후보의 오류로 규칙 기반 수정/LLM 보정 진행
+        """
+        if not finished:
+            raise errors[0]
+
+        report = [
+            {"index": index, "sql": s["sql"], "success": self._is_success(s), "error": s["error"]}
+            for index, s in sorted(finished, key=lambda item: item[0])
+        ]
+        successes = [(index, s) for index, s in finished if self._is_success(s)]
+        if not successes:
+            winner = min(finished, key=lambda item: item[0])[1]
+        elif self.candidate_strategy == "majority":
+            groups: Dict[Tuple[str, ...], List[Tuple[int, SQLAgentState]]] = {}
+            for index, s in successes:
+                groups.setdefault(self._result_key(s["results"]), []).append((index, s))
+            best = max(groups.values(), key=lambda g: (len(g), -min(index for index, _ in g)))
+            winner = min(best, key=lambda item: item[0])[1]
+        else:
+            winner = successes[0][1]
+        return {**winner, "candidates": report}
+
+    def _result_key(self, results: List[Dict[str, Any]]) -> Tuple[str, ...]:
+        """결과 비교 키 (컬럼 별칭/행 순서 무시, 값만 비교)"""
+        return tuple(sorted(json.dumps(list(row.values()), default=str) for row in results))
 
     # --------------------------
     # SQL Cleaner
@@ -189,93 +713,253 @@ SQL만 출력하세요.
     # Node: SQL Execution
     # --------------------------
     def _execute_sql_node(self, state: SQLAgentState) -> SQLAgentState:
-        results, error = self.db.execute_query(state["sql"])
+        invalid = self._validate_sql(state)
+        if invalid:
+            return {**state, "error": invalid, "results": None}
+
+        sql = self._bounded_sql(state["sql"])
+        cached, rejected = self._lookup_or_check_cost(state, sql)
+        if rejected:
+            return {**state, "error": rejected, "results": None}
+
+        with timed(f"sql_execute_{state['attempt']}"):
+            if cached is not None:
+                results, error = cached, None
+            else:
+                results, error = self._executor.execute_query(sql)
+        return self._apply_execution(state, results, error)
+
+    async def _aexecute_sql_node(self, state: SQLAgentState) -> SQLAgentState:
+        invalid = self._validate_sql(state)
+        if invalid:
+            return {**state, "error": invalid, "results": None}
+
+        sql = self._bounded_sql(state["sql"])
+        # 결과 캐시 hit이면 비용 검사/스레드 전환 없음
+        cached = self._peek_result(sql)
+        if cached is None and self.cost_guard is not None:
+            cached, rejected = await self._alookup_or_check_cost(state, sql)
+            if rejected:
+                return {**state, "error": rejected, "results": None}
+
+        with timed(f"sql_execute_{state['attempt']}"):
+            if cached is not None:
+                results, error = cached, None
+            else:
+                results, error = await self._aexecute_query(sql)
+        return self._apply_execution(state, results, error)
 
+    def _validate_sql(self, state: SQLAgentState) -> Optional[str]:
+        """실행 전 로컬 검증 (실패 시 오류 메시지 → DB 접근 없이 보정 단계로)"""
+        if self.sql_validator is None or state["snapshot"] is None:
+            return None
+        with timed(f"sql_validate_{state['attempt']}"):
+            return self.sql_validator.validate(state["sql"], state["snapshot"]).error
+
+    def _peek_result(self, sql: str) -> Optional[List[Dict[str, Any]]]:
+        """DB 접근 없이 반환 가능한 캐시 결과"""
+        return self.result_cache.peek(sql) if self.result_cache else None
+
+    def _lookup_or_check_cost(
+        self, state: SQLAgentState, sql: str
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        결과 캐시 조회 후 miss일 때만 EXPLAIN 비용 검사
+
+        Returns:
+            (캐시 결과, 차단 사유) - 캐시 hit이면 비용 검사 없음
+        """
+        cached = self.result_cache.lookup(sql) if self.result_cache else None
+        if cached is not None:
+            return cached, None
+        return None, self._check_cost(state, sql)
+
+    async def _alookup_or_check_cost(
+        self, state: SQLAgentState, sql: str
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """_lookup_or_check_cost()의 async 버전 (ResultCache.alookup, QueryCostGuard.acheck)"""
+        cached = await self.result_cache.alookup(sql) if self.result_cache else None
+        if cached is not None:
+            return cached, None
+        if self.cost_guard is None:
+            return None, None
+        with timed(f"sql_explain_{state['attempt']}"):
+            return None, await self.cost_guard.acheck(sql)
+
+    def _check_cost(self, state: SQLAgentState, sql: str) -> Optional[str]:
+        """EXPLAIN 비용 검사 (초과 시 사유 → 보정 단계로)"""
+        if self.cost_guard is None:
+            return None
+        with timed(f"sql_explain_{state['attempt']}"):
+            return self.cost_guard.check(sql)
+
+    def _bounded_sql(self, sql: str) -> str:
+        """실행할 SQL (max_rows가 있으면 LIMIT max_rows + 1 → 초과 여부 판단용 1행 추가)"""
+        if self.max_rows is None:
+            return sql
+        return inject_limit(sql, self.max_rows + 1)
+
+    @property
+    def _executor(self):
+        """쿼리 실행 대상 (결과 캐시가 있으면 캐시 경유)"""
+        return self.result_cache or self.db
+
+    async def _aexecute_query(self, sql: str):
+        """async 경로 실행 (async_db가 있으면 await, 없으면 워커 스레드에서 동기 실행)"""
+        if self.result_cache is not None:
+            return await self.result_cache.aexecute_query(sql)
+        if self.async_db is not None:
+            return await self.async_db.execute_query_async(sql)
+        return await asyncio.to_thread(self.db.execute_query, sql)
+
+    def _apply_execution(self, state: SQLAgentState, results, error) -> SQLAgentState:
         if error:
-            return {**state, "error": error, "results": None}
-        return {**state, "error": None, "results": results}
+            return {**state, "error": error, "results": None, "truncated": False}
+        # LIMIT max_rows + 1로 넘친 행, 또는 DB 연결의 fetch 상한에서 잘린 경우
+        truncated = getattr(results, "truncated", False)
+        if self.max_rows is not None and len(results) > self.max_rows:
+            results, truncated = results[: self.max_rows], True
+        return {**state, "error": None, "results": results, "truncated": truncated}
 
     # --------------------------
-    # Node: SQL Correction
+    # Node: SQL Repair (규칙 기반, LLM 호출 없음)
     # --------------------------
-    def _correction_node(self, state: SQLAgentState) -> SQLAgentState:
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    """
-당신은 SQL 오류 수정 전문가입니다.
+    def _repair_node(self, state: SQLAgentState) -> SQLAgentState:
+        """
+        오류 메시지 기반 로컬 수정 (실패 시 상태 그대로 → LLM 보정)
 
-규칙:
-- SELECT 문만 출력
-- 설명/문장 금지
-- 스키마에 있는 컬럼만 사용
-- 세미콜론으로 끝날 것
-""",
-                ),
-                (
-                    "user",
-                    """
-=== SCHEMA START ===
-{schema}
-=== SCHEMA END ===
+        수정 후 검증기가 다른 수정 가능 오류를 찾으면 이어서 수정합니다.
+        (예: 컬럼명 수정 후 ENUM 값 오류)
+        """
+        if self.sql_repairer is None or state["snapshot"] is None:
+            return state
 
-원본 질문:
-{question}
+        sql, error, fixes = state["sql"], state["error"], []
+        with timed(f"sql_repair_{state['attempt'] + 1}"):
+            for _ in range(MAX_REPAIR_PASSES):
+                repaired = self.sql_repairer.repair(sql, error, state["snapshot"])
+                if repaired is None:
+                    break
+                sql, fixes = repaired.sql, fixes + repaired.fixes
+                if self.sql_validator is None:
+                    break
+                error = self.sql_validator.validate(sql, state["snapshot"]).error
+                if error is None:
+                    break
 
-실패한 SQL:
-{sql}
+        if not fixes:
+            return state
+        return {
+            **state,
+            "sql": sql,
+            "error": None,
+            "attempt": state["attempt"] + 1,
+            "repairs": state["repairs"] + fixes,
+        }
 
-MySQL 오류:
-{error}
+    async def _arepair_node(self, state: SQLAgentState) -> SQLAgentState:
+        # CPU 작업만 (수 ms) → 이벤트 루프에서 바로 실행
+        return self._repair_node(state)
 
-수정된 SQL만 출력하세요.
-""",
-                ),
-            ]
-        )
+    # --------------------------
+    # Node: SQL Correction
+    # --------------------------
+    def _correction_node(self, state: SQLAgentState) -> SQLAgentState:
+        with timed(f"sql_correct_{state['attempt'] + 1}"):
+            corrected = self.correction_chain.invoke(self._correction_inputs(state))
+        return self._apply_correction(state, corrected)
 
-        chain = prompt | self.llm | StrOutputParser()
-        corrected = chain.invoke(
-            {
-                "schema": state["schema"],
-                "question": state["question"],
-                "sql": state["sql"],
-                "error": state["error"],
-            }
-        ).strip()
+    async def _acorrection_node(self, state: SQLAgentState) -> SQLAgentState:
+        with timed(f"sql_correct_{state['attempt'] + 1}"):
+            corrected = await self.correction_chain.ainvoke(self._correction_inputs(state))
+        return self._apply_correction(state, corrected)
 
-        corrected = self._clean_sql(corrected)
+    def _correction_inputs(self, state: SQLAgentState) -> Dict[str, Any]:
+        # 링킹에서 빠진 테이블/컬럼 오류면 전체 스키마로 보정
+        schema = state["schema"]
+        if state["full_schema"] and SCHEMA_MISS_ERROR.search(state["error"] or ""):
+            schema = state["full_schema"]
+        return {
+            "schema": schema,
+            "question": state["question"],
+            "sql": state["sql"],
+            "error": state["error"],
+        }
 
+    def _apply_correction(self, state: SQLAgentState, corrected: str) -> SQLAgentState:
+        corrected = self._clean_sql(corrected.strip())
         return {**state, "sql": corrected, "error": None, "attempt": state["attempt"] + 1}
 
     # --------------------------
     # Conditional Edge
     # --------------------------
+    def _route_start(self, state: SQLAgentState) -> str:
+        if state["sql"]:
+            return "execute_sql"
+        return "generate_candidates" if self.candidates > 1 else "generate_sql"
+
     def _should_retry(self, state: SQLAgentState) -> str:
         if state["error"] is None and state["results"] is not None:
             return "end"
         if state["attempt"] < state["max_attempts"]:
-            return "correction"
+            return "repair"
         return "end"
 
+    def _after_repair(self, state: SQLAgentState) -> str:
+        """로컬 수정 성공 → 재실행, 실패 → LLM 보정"""
+        return "execute_sql" if state["error"] is None else "correction"
+
     # --------------------------
     # Build LangGraph Workflow
     # --------------------------
     def _build_workflow(self):
         workflow = StateGraph(SQLAgentState)
 
-        workflow.add_node("generate_sql", self._generate_sql_node)
-        workflow.add_node("execute_sql", self._execute_sql_node)
-        workflow.add_node("correction", self._correction_node)
+        # 각 노드는 sync/async 구현을 모두 가짐 (invoke / ainvoke 공용 그래프)
+        workflow.add_node(
+            "generate_sql",
+            RunnableLambda(self._generate_sql_node, afunc=self._agenerate_sql_node),
+        )
+        workflow.add_node(
+            "generate_candidates",
+            RunnableLambda(self._generate_candidates_node, afunc=self._agenerate_candidates_node),
+        )
+        workflow.add_node(
+            "execute_sql",
+            RunnableLambda(self._execute_sql_node, afunc=self._aexecute_sql_node),
+        )
+        workflow.add_node(
+            "repair",
+            RunnableLambda(self._repair_node, afunc=self._arepair_node),
+        )
+        workflow.add_node(
+            "correction",
+            RunnableLambda(self._correction_node, afunc=self._acorrection_node),
+        )
 
-        workflow.set_entry_point("generate_sql")
+        # 캐시된 SQL이 있으면 생성 단계 생략
+        workflow.set_conditional_entry_point(
+            self._route_start,
+            {
+                "generate_sql": "generate_sql",
+                "generate_candidates": "generate_candidates",
+                "execute_sql": "execute_sql",
+            },
+        )
         workflow.add_edge("generate_sql", "execute_sql")
 
+        # 후보 노드는 실행까지 마친 상태 → 실행 노드와 같은 재시도 분기
+        for node in ("execute_sql", "generate_candidates"):
+            workflow.add_conditional_edges(
+                node,
+                self._should_retry,
+                {"repair": "repair", "end": END},
+            )
+
         workflow.add_conditional_edges(
-            "execute_sql",
-            self._should_retry,
-            {"correction": "correction", "end": END},
+            "repair",
+            self._after_repair,
+            {"execute_sql": "execute_sql", "correction": "correction"},
         )
 
         workflow.add_edge("correction", "execute_sql")
@@ -0,0 +1,12 @@
+"""
+Concurrency Module
+요청 동시 처리 (워커 풀, 배치 fan-out, single-flight, bulkhead 등)
+"""
+
+from core.concurrency.executor import QueryExecutor
+from core.concurrency.batch import run_batch
+from core.concurrency.singleflight import SingleFlight
+from core.concurrency.dispatcher import QueryDispatcher
+from core.concurrency.bulkhead import Bulkhead
+
+__all__ = ["QueryExecutor", "run_batch", "SingleFlight", "QueryDispatcher", "Bulkhead"]
@@ -0,0 +1,61 @@
+"""
+Batch Runner
+여러 질문을 동시성 상한(concurrency) 안에서 처리 + 배치 내 중복 제거
+
+사용법:
+    results = await run_batch(questions, hr_agent.aquery, concurrency=8)
+    # results[i]는 questions[i]의 결과 또는 예외 객체
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, TypeVar, Union
+
+from core.utils.text import normalize_question
+
+T = TypeVar("T")
+
+
+async def run_batch(
+    questions: List[str],
+    fn: Callable[[str], Awaitable[T]],
+    concurrency: int = 8,
+) -> List[Union[T, BaseException]]:
+    """
+    질문 목록을 bounded fan-out으로 처리
+
+    - 정규화 결과가 같은 질문은 한 번만 실행하고 결과를 공유
+    - 최대 concurrency개만 동시에 실행
+    - 실패는 예외 객체로 반환 (다른 항목에 영향 없음), 입력 순서 유지
+
+    Args:
+        questions: 질문 목록
+        fn: 질문 1개를 처리하는 async 함수
+        concurrency: 동시 실행 상한
+
+    Returns:
+        입력 순서대로 결과 또는 예외
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency는 1 이상이어야 합니다.")
+
+    # 정규화 키 → 대표 질문 (처음 등장한 원문)
+    unique: Dict[str, str] = {}
+    keys = []
+    for question in questions:
+        key = normalize_question(question)
+        unique.setdefault(key, question)
+        keys.append(key)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(question: str):
+        async with semaphore:
+            return await fn(question)
+
+    outcomes = await asyncio.gather(
+        *(run_one(question) for question in unique.values()),
+        return_exceptions=True,
+    )
+    by_key = dict(zip(unique.keys(), outcomes))
+
+    return [by_key[key] for key in keys]
@@ -0,0 +1,241 @@
+"""
+Bulkhead
+Agent별 동시 실행 상한 + bounded 대기열 (초과 시 즉시 거절)
+
+사용법:
+    bulkhead = Bulkhead("SQL_AGENT", max_concurrent=5, max_queue=20)
+
+    # 동기 (워커 스레드)
+    with bulkhead:
+        result = sql_agent.query(question)
+
+    # 비동기
+    async with bulkhead:
+        result = await sql_agent.aquery(question)
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from core.observability.metrics import (
+    BULKHEAD_ACTIVE,
+    BULKHEAD_QUEUE_DEPTH,
+    BULKHEAD_REJECTED,
+    BULKHEAD_WAIT,
+)
+from core.types.errors import OverloadedError
+
+
+class _Waiter:
+    """대기열 항목 (스레드 대기: event, 비동기 대기: loop + future)"""
+
+    __slots__ = ("event", "loop", "future", "granted")
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.loop = loop
+        self.future = loop.create_future() if loop else None
+        self.event = None if loop else threading.Event()
+        self.granted = False
+
+    def wake(self):
+        """슬롯 양도 알림 (호출 스레드와 무관하게 안전)"""
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._set_future)
+
+    def _set_future(self):
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class Bulkhead:
+    """
+    동시 실행 상한 + bounded 대기열
+
+    - 실행 중 < max_concurrent: 즉시 실행
+    - 대기 중 < max_queue: FIFO로 대기 (queue_timeout 초과 시 거절)
+    - 그 외: 즉시 OverloadedError (엔드포인트에서 503 + Retry-After)
+
+    스레드(동기 경로)와 이벤트 루프(async 경로)에서 같은 인스턴스를 함께 사용할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        max_queue: int = 0,
+        queue_timeout: Optional[float] = None,
+        retry_after: int = 1,
+    ):
+        """
+        Args:
+            name: bulkhead 이름 (예: "SQL_AGENT")
+            max_concurrent: 동시 실행 상한
+            max_queue: 대기열 길이 상한 (0이면 대기 없이 바로 거절)
+            queue_timeout: 대기 최대 시간(초, None이면 무제한)
+            retry_after: 거절 시 클라이언트에 알려줄 재시도 대기 시간(초)
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent는 1 이상이어야 합니다.")
+
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self._lock = threading.Lock()
+        self._waiters: Deque[_Waiter] = deque()
+        self._active = 0
+
+        # 통계
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    # --------------------------
+    # Admission
+    # --------------------------
+    def _try_admit(self, waiter_factory) -> Optional[_Waiter]:
+        """즉시 실행 가능하면 None, 대기해야 하면 대기열에 넣은 _Waiter 반환"""
+        with self._lock:
+            if self._active < self.max_concurrent and not self._waiters:
+                self._active += 1
+                self.admitted += 1
+                self._publish_locked()
+                return None
+            if len(self._waiters) >= self.max_queue:
+                self.rejected += 1
+                BULKHEAD_REJECTED.labels(bulkhead=self.name, reason="queue_full").inc()
+                raise self._overloaded("대기열이 가득 찼습니다")
+            waiter = waiter_factory()
+            self._waiters.append(waiter)
+            self._publish_locked()
+            return waiter
+
+    def _finish_wait(self, waiter: _Waiter, started: float, cancelled: bool = False) -> bool:
+        """
+        대기 종료 처리
+
+        Returns:
+            슬롯 보유 여부. 타임아웃과 동시에 양도받은 슬롯도 그대로 사용합니다.
+            (취소된 경우에만 다음 대기자에게 넘김, 양도받지 못했으면 대기열에서 제거)
+        """
+        with self._lock:
+            waited = time.perf_counter() - started
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            BULKHEAD_WAIT.labels(bulkhead=self.name).observe(waited)
+
+            if waiter.granted:
+                if cancelled:
+                    self._release_locked()
+                    return False
+                self.admitted += 1
+                return True
+            self._waiters.remove(waiter)
+            self._publish_locked()
+            return False
+
+    def _overloaded(self, reason: str) -> OverloadedError:
+        return OverloadedError(
+            f"{self.name} 처리 한도 초과: {reason}. 잠시 후 다시 시도해주세요.",
+            retry_after=self.retry_after,
+        )
+
+    def acquire(self) -> None:
+        """슬롯 획득 (동기, 호출 스레드 블로킹)"""
+        waiter = self._try_admit(_Waiter)
+        if waiter is None:
+            return
+
+        started = time.perf_counter()
+        waiter.event.wait(self.queue_timeout)
+        if not self._finish_wait(waiter, started):
+            self._timed_out()
+
+    async def acquire_async(self) -> None:
+        """슬롯 획득 (비동기, 이벤트 루프 블로킹 없음)"""
+        loop = asyncio.get_running_loop()
+        waiter = self._try_admit(lambda: _Waiter(loop))
+        if waiter is None:
+            return
+
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            self._finish_wait(waiter, started, cancelled=True)
+            raise
+
+        if not self._finish_wait(waiter, started):
+            self._timed_out()
+
+    def _timed_out(self):
+        with self._lock:
+            self.timed_out += 1
+        BULKHEAD_REJECTED.labels(bulkhead=self.name, reason="timeout").inc()
+        raise self._overloaded("대기 시간 초과")
+
+    def release(self) -> None:
+        """슬롯 반환 (대기자가 있으면 FIFO로 양도)"""
+        with self._lock:
+            self._release_locked()
+
+    def _release_locked(self) -> None:
+        if self._waiters:
+            # 실행 중 카운트는 그대로 두고 슬롯을 다음 대기자에게 양도
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            waiter.wake()
+        else:
+            self._active -= 1
+        self._publish_locked()
+
+    def _publish_locked(self) -> None:
+        """현재 상태를 게이지 메트릭에 반영"""
+        BULKHEAD_ACTIVE.labels(bulkhead=self.name).set(self._active)
+        BULKHEAD_QUEUE_DEPTH.labels(bulkhead=self.name).set(len(self._waiters))
+
+    # --------------------------
+    # Context managers
+    # --------------------------
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+    # --------------------------
+    # Stats
+    # --------------------------
+    def stats(self) -> Dict[str, Any]:
+        """현재 상태 및 누적 통계"""
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queue_depth": len(self._waiters),
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
@@ -0,0 +1,96 @@
+"""
+Query Dispatcher
+엔드포인트 → HRAgent 호출 경로 (실행 모드 선택 + single-flight)
+
+사용법:
+    dispatcher = QueryDispatcher(hr_agent, executor, mode="async", single_flight=SingleFlight())
+    result = await dispatcher.run("직원 수는?")
+"""
+
+import time
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from core.concurrency.executor import QueryExecutor
+from core.concurrency.singleflight import SingleFlight
+from core.observability.metrics import REQUEST_LATENCY
+from core.observability.timing import StageTimings, current_timing, start_timing
+from core.types.agent_types import AgentResult, AnswerMode
+from core.utils.text import normalize_question
+
+if TYPE_CHECKING:
+    from core.agents.hr_agent import HRAgent
+
+
+class QueryDispatcher:
+    """
+    HRAgent 호출 디스패처
+
+    - async: 네이티브 async 경로 (hr_agent.aquery)
+    - threadpool: 동기 hr_agent.query()를 워커 풀에서 실행
+    - single_flight가 있으면 정규화 결과가 같은 동시 질문을 1회 실행으로 합침
+      (실행 구간은 실행 전용 수집기에 기록 → 완료 후 합류한 요청 모두의 수집기로 복사)
+    """
+
+    def __init__(
+        self,
+        hr_agent: "HRAgent",
+        executor: QueryExecutor,
+        mode: str = "async",
+        single_flight: Optional[SingleFlight] = None,
+    ):
+        """
+        Args:
+            hr_agent: HRAgent 인스턴스
+            executor: 동기 실행용 워커 풀
+            mode: 실행 모드 ("async" | "threadpool")
+            single_flight: 동시 동일 질문 coalescing (None이면 비활성화)
+        """
+        if mode not in ("async", "threadpool"):
+            raise ValueError(f"지원하지 않는 실행 모드입니다: {mode}. 'async' 또는 'threadpool'을 사용하세요.")
+
+        self.hr_agent = hr_agent
+        self.executor = executor
+        self.mode = mode
+        self.single_flight = single_flight
+
+    async def run(self, question: str, answer_mode: AnswerMode = "auto") -> AgentResult:
+        """질문 처리 (동시 동일 질문 + 같은 답변 방식은 결과 공유) + 요청 지연 메트릭 기록"""
+        started = time.perf_counter()
+        agent_type, success = "ERROR", "false"
+        try:
+            if self.single_flight is None:
+                result = await self._execute(question, answer_mode)
+            else:
+                key = f"{answer_mode}\x1f{normalize_question(question)}"
+                result, flight_timings = await self.single_flight.do(
+                    key, lambda: self._execute_timed(question, answer_mode)
+                )
+                timings = current_timing()
+                if timings is not None:
+                    timings.extend(flight_timings)
+            agent_type = result["metadata"].get("agent_type", "UNKNOWN")
+            success = str(result["success"]).lower()
+            return result
+        finally:
+            REQUEST_LATENCY.labels(agent_type=agent_type, success=success).observe(
+                time.perf_counter() - started
+            )
+
+    async def _execute_timed(
+        self, question: str, answer_mode: AnswerMode
+    ) -> Tuple[AgentResult, StageTimings]:
+        """
+        공유 실행 + 실행 전용 단계 수집기
+
+        single-flight Task는 먼저 온 요청의 컨텍스트 복사본에서 실행되므로
+        Task 안에서 새 수집기를 설정해 기다리는 요청마다 같은 구간을 복사할 수 있게 합니다.
+        (실행이 실패하면 단계 구간은 전달되지 않음)
+        """
+        timings = start_timing()
+        return await self._execute(question, answer_mode), timings
+
+    async def _execute(self, question: str, answer_mode: AnswerMode) -> AgentResult:
+        """실행 모드에 따라 HRAgent 호출"""
+        if self.mode == "async":
+            return await self.hr_agent.aquery(question, answer_mode=answer_mode)
+        return await self.executor.run(self.hr_agent.query, question, answer_mode=answer_mode)
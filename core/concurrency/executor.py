@@ -0,0 +1,56 @@
+"""
+Query Executor
+동기 Agent 호출을 이벤트 루프 밖의 bounded 워커 풀에서 실행
+
+사용법:
+    executor = QueryExecutor(max_workers=32)
+    result = await executor.run(hr_agent.query, "직원 수는?")
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class QueryExecutor:
+    """
+    Bounded 워커 풀
+
+    - HRAgent.query()처럼 LLM HTTP 호출/DB 왕복으로 블로킹되는 함수를 실행
+    - 이벤트 루프는 블로킹되지 않으므로 헬스체크 등 다른 요청이 계속 처리됨
+    - 풀 크기(max_workers)를 넘는 요청은 풀 내부 큐에서 대기
+    """
+
+    def __init__(self, max_workers: int = 32, thread_name_prefix: str = "hr-query"):
+        """
+        Args:
+            max_workers: 동시에 실행할 최대 워커(스레드) 수
+            thread_name_prefix: 워커 스레드 이름 접두어
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다.")
+
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=thread_name_prefix,
+        )
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        함수를 워커 풀에서 실행하고 결과를 await
+
+        contextvars를 복사해서 넘기므로 요청 단위 컨텍스트가 워커에서도 유지됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, fn, *args, **kwargs)
+        return await loop.run_in_executor(self._pool, call)
+
+    def shutdown(self, wait: bool = True):
+        """워커 풀 종료"""
+        self._pool.shutdown(wait=wait)
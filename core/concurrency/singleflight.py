@@ -0,0 +1,71 @@
+"""
+Single-flight
+같은 키로 동시에 들어온 요청을 하나의 실행으로 합침 (coalescing)
+
+사용법:
+    single_flight = SingleFlight()
+    result = await single_flight.do("연차휴가는 며칠인가요", lambda: hr_agent.aquery(q))
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from core.observability.metrics import SINGLE_FLIGHT_COALESCED, SINGLE_FLIGHT_EXECUTIONS
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    In-flight 요청 coalescing
+
+    - 같은 키의 실행이 진행 중이면 새로 실행하지 않고 그 결과를 같이 기다림
+    - 실행은 별도 Task로 돌리므로 먼저 온 요청이 취소(클라이언트 종료)돼도
+      나머지 요청은 계속 결과를 받음
+    - 완료 즉시 키를 제거 (결과 캐시가 아님)
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.executions = 0  # 실제 실행 횟수
+        self.coalesced = 0  # 진행 중인 실행에 합류한 요청 수
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        키 단위로 fn 실행 (진행 중이면 합류)
+
+        Args:
+            key: coalescing 키 (예: 정규화된 질문)
+            fn: 실제 실행할 async 함수
+
+        Returns:
+            fn의 결과 (합류한 요청도 같은 결과)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._forget(key, t))
+            self.executions += 1
+            SINGLE_FLIGHT_EXECUTIONS.inc()
+        else:
+            self.coalesced += 1
+            SINGLE_FLIGHT_COALESCED.inc()
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        """완료된 실행 제거"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외 미조회 경고가 나지 않도록
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """coalescing 통계"""
+        return {
+            "in_flight": len(self._inflight),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
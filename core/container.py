@@ -12,16 +12,36 @@ DI Container
     hr_agent = get_container().hr_agent
 """
 
+import threading
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, List, Optional
 from functools import cached_property
+from pathlib import Path
 
 from app.core.config import Settings, get_settings
+from core.database.async_connection import AsyncDatabaseConnection
 from core.database.connection import DatabaseConnection
+from core.database.cost_guard import QueryCostGuard
+from core.database.pool_sweeper import PoolSweeper
+from core.database.result_cache import ResultCache
+from core.database.schema_cache import SchemaCache
 from core.routing.router import Router
+from core.sql.schema_linking import SchemaLinker
+from core.sql.few_shot import FewShotRetriever
+from core.sql.repair import SQLRepairer
+from core.sql.sql_cache import SQLCache
+from core.sql.validator import SQLValidator
 from core.agents.sql_agent import SQLAgent
 from core.agents.rag_agent import RAGAgent
 from core.agents.hr_agent import HRAgent
+from core.concurrency.executor import QueryExecutor
+from core.concurrency.singleflight import SingleFlight
+from core.concurrency.dispatcher import QueryDispatcher
+from core.concurrency.bulkhead import Bulkhead
+from core.llm.factory import check_llm_provider
+from core.observability.health import ReadinessChecker
+from core.utils.tokens import tokenizer_available
+from core.warmup import WarmupPhase
 
 
 @dataclass
@@ -41,6 +61,11 @@ class Container:
     _sql_agent: Optional[SQLAgent] = field(default=None, repr=False)
     _rag_agent: Optional[RAGAgent] = field(default=None, repr=False)
     _hr_agent: Optional[HRAgent] = field(default=None, repr=False)
+    _query_executor: Optional[QueryExecutor] = field(default=None, repr=False)
+
+    # RAGAgent 로드 상태 (예열/readiness 재시도 공용)
+    _rag_load_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _rag_load_error: Optional[str] = field(default=None, init=False, repr=False)
 
     @cached_property
     def db(self) -> DatabaseConnection:
@@ -51,8 +76,118 @@ class Container:
             connection_url=self.settings.DATABASE_URL,
             pool_size=self.settings.DB_POOL_SIZE,
             pool_recycle=self.settings.DB_POOL_RECYCLE,
+            max_rows=self.settings.DB_MAX_FETCH_ROWS,
+            statement_timeout_ms=self.settings.DB_STATEMENT_TIMEOUT_MS,
+            max_overflow=self.settings.DB_MAX_OVERFLOW,
+            pool_timeout=self.settings.DB_POOL_TIMEOUT,
+            pre_ping=self.settings.DB_POOL_PRE_PING,
+        )
+
+    @cached_property
+    def pool_sweeper(self) -> Optional[PoolSweeper]:
+        """PoolSweeper 인스턴스 (DB_POOL_PRE_PING=True, DB_POOL_SWEEP_INTERVAL=0 또는 DATABASE_URL이 없으면 None)"""
+        if (
+            self.settings.DB_POOL_PRE_PING
+            or self.settings.DB_POOL_SWEEP_INTERVAL <= 0
+            or not self.settings.DATABASE_URL
+        ):
+            return None
+        return PoolSweeper(self.db, interval=self.settings.DB_POOL_SWEEP_INTERVAL)
+
+    @cached_property
+    def async_db(self) -> Optional[AsyncDatabaseConnection]:
+        """AsyncDatabaseConnection 인스턴스 (DB_ASYNC_DRIVER 또는 DATABASE_URL이 없으면 None)"""
+        if not self.settings.DB_ASYNC_DRIVER or not self.settings.DATABASE_URL:
+            return None
+        return AsyncDatabaseConnection(
+            connection_url=self.settings.DATABASE_URL,
+            driver=self.settings.DB_ASYNC_DRIVER,
+            pool_size=self.settings.DB_POOL_SIZE,
+            pool_recycle=self.settings.DB_POOL_RECYCLE,
+            max_rows=self.settings.DB_MAX_FETCH_ROWS,
+            statement_timeout_ms=self.settings.DB_STATEMENT_TIMEOUT_MS,
+            max_overflow=self.settings.DB_MAX_OVERFLOW,
+            pool_timeout=self.settings.DB_POOL_TIMEOUT,
+        )
+
+    @cached_property
+    def schema_cache(self) -> SchemaCache:
+        """SchemaCache 인스턴스 (SQLAgent 프롬프트용 스키마)"""
+        return SchemaCache(
+            self.db,
+            ttl=self.settings.SCHEMA_CACHE_TTL,
+            schema_format=self.settings.SQL_SCHEMA_FORMAT,
+            async_db=self.async_db,
+        )
+
+    @cached_property
+    def result_cache(self) -> Optional[ResultCache]:
+        """ResultCache 인스턴스 (RESULT_CACHE_ENABLED=False면 None)"""
+        if not self.settings.RESULT_CACHE_ENABLED:
+            return None
+        return ResultCache(
+            self.db,
+            ttl=self.settings.RESULT_CACHE_TTL,
+            stale_ttl=self.settings.RESULT_CACHE_STALE_TTL,
+            poll_interval=self.settings.RESULT_CACHE_POLL_INTERVAL,
+            max_entries=self.settings.RESULT_CACHE_MAX_ENTRIES,
+            max_rows=self.settings.RESULT_CACHE_MAX_ROWS,
+            async_db=self.async_db,
         )
 
+    @cached_property
+    def schema_linker(self) -> Optional[SchemaLinker]:
+        """SchemaLinker 인스턴스 (SQL_SCHEMA_LINKING=False면 None)"""
+        if not self.settings.SQL_SCHEMA_LINKING:
+            return None
+        return SchemaLinker(schema_format=self.settings.SQL_SCHEMA_FORMAT)
+
+    @cached_property
+    def cost_guard(self) -> Optional[QueryCostGuard]:
+        """QueryCostGuard 인스턴스 (SQL_COST_GUARD_ENABLED=False면 None)"""
+        if not self.settings.SQL_COST_GUARD_ENABLED:
+            return None
+        return QueryCostGuard(
+            self.db, max_rows=self.settings.SQL_COST_MAX_ROWS, async_db=self.async_db
+        )
+
+    @cached_property
+    def sql_validator(self) -> Optional[SQLValidator]:
+        """SQLValidator 인스턴스 (SQL_VALIDATION_ENABLED=False면 None)"""
+        if not self.settings.SQL_VALIDATION_ENABLED:
+            return None
+        return SQLValidator()
+
+    @cached_property
+    def sql_repairer(self) -> Optional[SQLRepairer]:
+        """SQLRepairer 인스턴스 (SQL_REPAIR_ENABLED=False면 None)"""
+        if not self.settings.SQL_REPAIR_ENABLED:
+            return None
+        return SQLRepairer()
+
+    @cached_property
+    def few_shot_retriever(self) -> Optional[FewShotRetriever]:
+        """FewShotRetriever 인스턴스 (SQL_FEW_SHOT_ENABLED=False면 None, 데이터셋이 없으면 빈 인덱스)"""
+        if not self.settings.SQL_FEW_SHOT_ENABLED:
+            return None
+        path = self.settings.SQL_FEW_SHOT_PATH
+        if path is None:
+            path = Path(__file__).parent.parent / "data" / "finetuning" / "sql_train.json"
+        kwargs = {"k": self.settings.SQL_FEW_SHOT_K, "max_learned": self.settings.SQL_FEW_SHOT_MAX_LEARNED}
+        if not Path(path).exists():
+            return FewShotRetriever(**kwargs)
+        return FewShotRetriever.from_file(path, **kwargs)
+
+    @cached_property
+    def sql_cache(self) -> Optional[SQLCache]:
+        """SQLCache 인스턴스 (SQL_CACHE_ENABLED=False면 None)"""
+        if not self.settings.SQL_CACHE_ENABLED:
+            return None
+        path = self.settings.SQL_CACHE_PATH
+        if path is None:
+            path = Path(__file__).parent.parent / "data" / "cache" / "sql_cache.db"
+        return SQLCache(path, max_entries=self.settings.SQL_CACHE_MAX_ENTRIES)
+
     @cached_property
     def router(self) -> Router:
         """Router 인스턴스"""
@@ -92,6 +227,19 @@ class Container:
             max_attempts=self.settings.SQL_AGENT_MAX_ATTEMPTS,
             provider=self.settings.LLM_PROVIDER,
             base_url=self.settings.OLLAMA_BASE_URL,
+            schema_cache=self.schema_cache,
+            schema_linker=self.schema_linker,
+            sql_cache=self.sql_cache,
+            result_cache=self.result_cache,
+            sql_validator=self.sql_validator,
+            sql_repairer=self.sql_repairer,
+            candidates=self.settings.SQL_CANDIDATES,
+            candidate_strategy=self.settings.SQL_CANDIDATE_STRATEGY,
+            candidate_temperature=self.settings.SQL_CANDIDATE_TEMPERATURE,
+            few_shot=self.few_shot_retriever,
+            max_rows=self.settings.SQL_MAX_ROWS,
+            cost_guard=self.cost_guard,
+            async_db=self.async_db,
         )
 
     @cached_property
@@ -124,6 +272,26 @@ class Container:
             base_url=self.settings.OLLAMA_BASE_URL,
         )
 
+    @cached_property
+    def bulkheads(self) -> Dict[str, Bulkhead]:
+        """Agent 타입별 Bulkhead (동시 실행 제한 + bounded 대기열)"""
+        return {
+            "SQL_AGENT": Bulkhead(
+                "SQL_AGENT",
+                max_concurrent=self.settings.SQL_AGENT_MAX_CONCURRENCY,
+                max_queue=self.settings.SQL_AGENT_MAX_QUEUE,
+                queue_timeout=self.settings.BULKHEAD_QUEUE_TIMEOUT,
+                retry_after=self.settings.BULKHEAD_RETRY_AFTER,
+            ),
+            "RAG_AGENT": Bulkhead(
+                "RAG_AGENT",
+                max_concurrent=self.settings.RAG_AGENT_MAX_CONCURRENCY,
+                max_queue=self.settings.RAG_AGENT_MAX_QUEUE,
+                queue_timeout=self.settings.BULKHEAD_QUEUE_TIMEOUT,
+                retry_after=self.settings.BULKHEAD_RETRY_AFTER,
+            ),
+        }
+
     @cached_property
     def hr_agent(self) -> HRAgent:
         """HRAgent 인스턴스"""
@@ -134,8 +302,166 @@ class Container:
             sql_agent=self.sql_agent,
             rag_agent=self.rag_agent,
             verbose=self.settings.DEBUG,
+            bulkheads=self.bulkheads,
         )
 
+    @cached_property
+    def query_executor(self) -> QueryExecutor:
+        """QueryExecutor 인스턴스 (동기 Agent 호출용 워커 풀)"""
+        if self._query_executor is not None:
+            return self._query_executor
+        return QueryExecutor(max_workers=self.settings.QUERY_MAX_WORKERS)
+
+    @cached_property
+    def single_flight(self) -> SingleFlight:
+        """SingleFlight 인스턴스 (동시 동일 질문 coalescing)"""
+        return SingleFlight()
+
+    @cached_property
+    def query_dispatcher(self) -> QueryDispatcher:
+        """QueryDispatcher 인스턴스 (엔드포인트 → HRAgent 호출 경로)"""
+        return QueryDispatcher(
+            hr_agent=self.hr_agent,
+            executor=self.query_executor,
+            mode=self.settings.QUERY_EXECUTION_MODE,
+            single_flight=self.single_flight if self.settings.QUERY_COALESCE_ENABLED else None,
+        )
+
+    @cached_property
+    def readiness(self) -> ReadinessChecker:
+        """ReadinessChecker 인스턴스 (DB 풀, FAISS 인덱스, LLM Provider 점검)"""
+        checks = {
+            "database": self._check_database,
+            "faiss_index": self._check_faiss_index,
+        }
+        if self.settings.HEALTH_CHECK_LLM:
+            checks["llm"] = self._check_llm
+
+        return ReadinessChecker(
+            checks=checks,
+            ttl=self.settings.HEALTH_CHECK_TTL,
+            timeout=self.settings.HEALTH_CHECK_TIMEOUT,
+        )
+
+    def _check_database(self) -> str:
+        """DB 풀에서 커넥션을 받아 SELECT 1"""
+        self.db.test_connection()
+        return self.db.pool_status()
+
+    def _check_faiss_index(self) -> str:
+        """
+        FAISS 인덱스 로드 여부 (로드는 예열 단계에서, 점검은 상태만 확인)
+
+        예열을 끈 경우(WARMUP_ENABLED=False)에는 첫 RAG 요청에서 로드하므로 미로드도 통과로 봅니다.
+        예열 로드가 실패했으면 점검마다 다시 로드합니다. (일시적인 임베딩/파일 오류로 영구 not ready 방지)
+        점검 timeout을 넘긴 로드는 스레드에서 계속되고, 그동안의 점검은 "로드 중"으로 보고합니다.
+        """
+        rag_agent = self.__dict__.get("rag_agent") or self._rag_agent
+        if rag_agent is None:
+            if not self.settings.WARMUP_ENABLED:
+                return "not loaded (첫 RAG 요청에서 로드)"
+            if self._rag_load_error is None:
+                if self._rag_load_lock.locked():
+                    raise RuntimeError("FAISS 인덱스 로드 중입니다.")
+                raise RuntimeError("FAISS 인덱스가 로드되지 않았습니다. (예열 대기)")
+            try:
+                rag_agent = self._load_rag_agent(blocking=False)
+            except Exception as e:
+                raise RuntimeError(f"FAISS 인덱스 로드 실패: {self._rag_load_error}") from e
+            if rag_agent is None:
+                raise RuntimeError("FAISS 인덱스 로드 중입니다. (재시도)")
+        ntotal = rag_agent.vectorstore.index.ntotal
+        if ntotal == 0:
+            raise RuntimeError("FAISS 인덱스가 비어 있습니다.")
+        return f"{ntotal} vectors"
+
+    def _load_rag_agent(self, blocking: bool = True) -> Optional[RAGAgent]:
+        """
+        RAGAgent 생성 (동시에 1회만 로드, 실패 원인 기록)
+
+        Args:
+            blocking: False면 다른 스레드가 로드 중일 때 기다리지 않고 None 반환
+        """
+        if not self._rag_load_lock.acquire(blocking=blocking):
+            return None
+        try:
+            rag_agent = self.rag_agent
+        except Exception as e:
+            self._rag_load_error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._rag_load_lock.release()
+        self._rag_load_error = None
+        return rag_agent
+
+    def _check_llm(self) -> str:
+        """LLM Provider 도달 가능 여부"""
+        return check_llm_provider(
+            provider=self.settings.LLM_PROVIDER,
+            base_url=self.settings.OLLAMA_BASE_URL,
+            timeout=self.settings.HEALTH_CHECK_TIMEOUT,
+            api_key=self.settings.OPENAI_API_KEY,
+        )
+
+    def warmup_phases(self) -> List[WarmupPhase]:
+        """
+        앱 시작 시 예열 작업 (단계 순서대로, 단계 안에서는 병렬)
+
+        1단계: 서로 독립적인 컴포넌트 생성 (DB 풀 채우기, Router, FAISS 로드, few-shot 인덱스,
+               스키마 링킹용 tiktoken 인코딩 - 최초 다운로드가 요청 경로/이벤트 루프에서 일어나지 않도록)
+        2단계: 1단계 결과에 의존하는 생성/예열 (SQLAgent, 임베딩/Router LLM)
+        3단계: 그래프 컴파일 (HRAgent), 스키마 캐시 적재, 나머지 LLM 클라이언트 예열
+        4단계: 요청 경로 (QueryDispatcher, 워커 풀)
+        """
+        has_db = bool(self.settings.DATABASE_URL)
+        warm_llm = self.settings.WARMUP_LLM
+
+        phase1: WarmupPhase = {
+            "router": lambda: self.router,
+            "rag_agent": self._load_rag_agent,
+            "few_shot": lambda: self.few_shot_retriever,
+        }
+        if self.settings.SQL_SCHEMA_LINKING:
+            phase1["tokenizer"] = tokenizer_available
+        if has_db:
+            if self.settings.DB_POOL_PREFILL:
+                phase1["db_pool"] = lambda: self.db.prefill()
+            else:
+                phase1["db_pool"] = lambda: self.db.test_connection()
+
+        phase2: WarmupPhase = {"sql_agent": lambda: self.sql_agent}
+        if warm_llm:
+            phase2["embedding"] = lambda: self.rag_agent.embeddings.embed_query("warmup")
+            phase2["router_llm"] = lambda: self.router.llm.invoke("ping")
+
+        phase3: WarmupPhase = {"hr_agent": lambda: self.hr_agent}
+        if has_db:
+            phase3["schema"] = lambda: self.sql_agent.schema_cache.get()
+        if warm_llm:
+            phase3["sql_llm"] = lambda: self.sql_agent.llm.invoke("ping")
+            phase3["rag_llm"] = lambda: self.rag_agent.llm.invoke("ping")
+
+        phase4: WarmupPhase = {"query_dispatcher": lambda: self.query_dispatcher}
+
+        return [phase1, phase2, phase3, phase4]
+
+    def shutdown(self):
+        """컨테이너가 소유한 리소스 정리 (생성된 것만)"""
+        if "query_executor" in self.__dict__:
+            self.query_executor.shutdown(wait=False)
+        if self.__dict__.get("pool_sweeper") is not None:
+            self.pool_sweeper.stop()
+        if self.__dict__.get("sql_cache") is not None:
+            self.sql_cache.close()
+        if self.__dict__.get("result_cache") is not None:
+            self.result_cache.shutdown()
+
+    async def ashutdown(self):
+        """shutdown() + async 리소스 정리 (FastAPI lifespan용)"""
+        self.shutdown()
+        if self.__dict__.get("async_db") is not None:
+            await self.async_db.dispose()
+
 
 # 전역 컨테이너 (FastAPI lifespan에서 초기화)
 _container: Optional[Container] = None
@@ -1,8 +1,26 @@
 """
 Database Module
-DB 연결 관리
+DB 연결 관리 (동기/async), 스키마 스냅샷/캐시, 결과 캐시, 쿼리 비용 검사
 """
 
 from core.database.connection import DatabaseConnection
+from core.database.async_connection import AsyncDatabaseConnection
+from core.database.schema import ColumnInfo, ForeignKey, TableInfo, SchemaSnapshot, render_schema
+from core.database.schema_cache import SchemaCache
+from core.database.result_cache import ResultCache
+from core.database.cost_guard import QueryCostGuard
+from core.database.pool_sweeper import PoolSweeper
 
-__all__ = ["DatabaseConnection"]
+__all__ = [
+    "DatabaseConnection",
+    "AsyncDatabaseConnection",
+    "ColumnInfo",
+    "ForeignKey",
+    "TableInfo",
+    "SchemaSnapshot",
+    "render_schema",
+    "SchemaCache",
+    "ResultCache",
+    "QueryCostGuard",
+    "PoolSweeper",
+]
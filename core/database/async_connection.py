@@ -0,0 +1,229 @@
+"""
+Async Database Connection
+SQLAlchemy async 엔진 기반 MySQL 연결 (이벤트 루프에서 스레드 없이 await)
+
+사용법:
+    db = AsyncDatabaseConnection(connection_url="mysql+pymysql://...", driver="aiomysql")
+    results, error = await db.execute_query_async("SELECT * FROM employees")
+    plan = await db.explain_async("SELECT * FROM employees")
+    versions = await db.get_table_versions_async()
+    schema = await db.get_table_schema_async()
+    await db.dispose()
+
+- 연결 URL은 DatabaseConnection과 같은 값을 사용 (드라이버 부분만 async 드라이버로 교체)
+- 결과 형식/행 수 제한/SELECT 실행 시간 제한은 DatabaseConnection과 동일
+- 선택 의존성: aiomysql 또는 asyncmy + greenlet (pip install -e ".[async]")
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+
+from core.database.connection import (
+    FETCH_BATCH_SIZE,
+    SCHEMA_ERROR_PREFIX,
+    DatabaseConnection,
+    QueryRows,
+    instrument_pool,
+    read_explain,
+    read_schema_fingerprint,
+    read_schema_snapshot,
+    read_table_versions,
+)
+from core.database.schema import SchemaSnapshot, render_schema
+from core.observability.metrics import DB_POOL_CHECKOUT
+from core.types.errors import DatabaseConnectionError
+
+ASYNC_DRIVERS = ("aiomysql", "asyncmy")
+
+
+def to_async_url(connection_url: str, driver: str = "aiomysql") -> str:
+    """
+    동기 연결 URL → async 드라이버 URL
+
+    mysql+pymysql://user:pw@host/db → mysql+aiomysql://user:pw@host/db
+    (호스트/인증/쿼리 파라미터는 그대로)
+    """
+    if driver not in ASYNC_DRIVERS:
+        raise ValueError(
+            f"지원하지 않는 async 드라이버입니다: {driver}. {', '.join(ASYNC_DRIVERS)} 중 하나를 사용하세요."
+        )
+    url = make_url(connection_url)
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+class AsyncDatabaseConnection:
+    """
+    MySQL async 연결 관리 클래스
+
+    동기 DatabaseConnection과 별도 커넥션 풀을 사용합니다.
+    EXPLAIN/스키마 지문/테이블 버전/스키마 조회는 동기 풀과 같은 read_* 함수를
+    run_sync로 실행합니다. (greenlet 안에서 await → 요청마다 워커 스레드 없음)
+
+    DB_POOL_PRE_PING과 관계없이 checkout마다 pre-ping을 유지합니다.
+    - PoolSweeper는 별도 스레드에서 풀 커넥션을 꺼내 ping하는데,
+      async 드라이버 커넥션은 생성한 이벤트 루프에 묶여 있어 다른 스레드에서 사용할 수 없음
+    - async 풀의 pre-ping은 checkout 시 await하는 ping 1회 (워커 스레드 점유/이벤트 루프 블로킹 없음)
+    """
+
+    def __init__(
+        self,
+        connection_url: str,
+        driver: str = "aiomysql",
+        pool_size: int = 5,
+        pool_recycle: int = 3600,
+        max_rows: Optional[int] = None,
+        statement_timeout_ms: Optional[int] = None,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+    ):
+        """
+        Args:
+            connection_url: SQLAlchemy 연결 URL (동기 드라이버 URL 그대로)
+            driver: async 드라이버 ("aiomysql" | "asyncmy")
+            pool_size: 커넥션 풀 크기
+            pool_recycle: 커넥션 재활용 시간(초)
+            max_rows: execute_query_async()가 가져오는 최대 행 수 (None이면 제한 없음)
+            statement_timeout_ms: SELECT 문 최대 실행 시간(ms, MySQL max_execution_time). None이면 서버 기본값
+            max_overflow: pool_size를 넘어 추가로 열 수 있는 커넥션 수
+            pool_timeout: 풀이 가득 찼을 때 checkout 최대 대기 시간(초)
+
+        Raises:
+            DatabaseConnectionError: URL이 없거나 async 드라이버/greenlet이 설치되지 않은 경우
+        """
+        if not connection_url:
+            raise DatabaseConnectionError("DATABASE_URL이 설정되지 않았습니다.")
+
+        try:
+            from sqlalchemy.ext.asyncio import create_async_engine
+        except ImportError as e:
+            raise DatabaseConnectionError(
+                f"async DB 엔진을 사용할 수 없습니다: {e}. pip install -e \".[async]\"로 설치하세요."
+            )
+
+        self.connection_url = to_async_url(connection_url, driver)
+        self.driver = driver
+        self.max_rows = max_rows
+
+        try:
+            self.engine = create_async_engine(
+                self.connection_url,
+                pool_pre_ping=True,  # PoolSweeper는 동기 풀 전용 (클래스 docstring 참고)
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+            )
+        except ImportError as e:
+            raise DatabaseConnectionError(
+                f"async 드라이버 '{driver}'가 설치되지 않았습니다: {e}. pip install {driver}로 설치하세요."
+            )
+
+        instrument_pool(self.engine.sync_engine, "async")
+
+        # 풀의 모든 커넥션에 SELECT 실행 시간 제한 (동기 풀과 같은 리스너)
+        if statement_timeout_ms and self.engine.dialect.name == "mysql":
+            event.listen(
+                self.engine.sync_engine,
+                "connect",
+                DatabaseConnection._set_statement_timeout(statement_timeout_ms),
+            )
+
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[Any]:
+        """풀에서 커넥션 checkout (대기 시간을 메트릭으로 기록)"""
+        started = time.perf_counter()
+        async with self.engine.connect() as conn:
+            DB_POOL_CHECKOUT.observe(time.perf_counter() - started)
+            yield conn
+
+    async def test_connection_async(self) -> bool:
+        """DB 연결 테스트"""
+        try:
+            async with self._connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            raise DatabaseConnectionError(f"DB 연결 실패: {e}")
+
+    def pool_status(self) -> str:
+        """커넥션 풀 상태 요약 (크기/대기/사용 중/overflow)"""
+        return self.engine.pool.status()
+
+    async def execute_query_async(
+        self, query: str
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        SQL 쿼리 실행 (DatabaseConnection.execute_query와 같은 형식)
+
+        서버 사이드 커서(stream)에서 fetchmany로 max_rows행까지만 가져옵니다. (초과 시 결과의 truncated=True)
+
+        Args:
+            query: 실행할 SQL 쿼리 문자열
+
+        Returns:
+            tuple: (결과 리스트, 에러 메시지)
+        """
+        try:
+            async with self._connect() as conn:
+                result = await conn.stream(text(query))
+                columns = list(result.keys())
+
+                results: List[Dict[str, Any]] = []
+                while self.max_rows is None or len(results) < self.max_rows:
+                    size = FETCH_BATCH_SIZE
+                    if self.max_rows is not None:
+                        size = min(size, self.max_rows - len(results))
+                    rows = await result.fetchmany(size)
+                    if not rows:
+                        break
+                    results.extend(dict(zip(columns, row)) for row in rows)
+
+                truncated = self.max_rows is not None and len(results) >= self.max_rows and bool(
+                    await result.fetchmany(1)
+                )
+                await result.close()
+                return QueryRows(results, truncated), None
+        except Exception as e:
+            return None, str(e)
+
+    async def explain_async(self, query: str) -> List[Dict[str, Any]]:
+        """실행 계획 조회 (DatabaseConnection.explain과 같은 형식, 쿼리는 실행하지 않음)"""
+        async with self._connect() as conn:
+            return await conn.run_sync(read_explain, query)
+
+    async def get_schema_fingerprint_async(self) -> str:
+        """스키마 변경 감지용 지문 (DatabaseConnection.get_schema_fingerprint와 같은 값)"""
+        async with self._connect() as conn:
+            return await conn.run_sync(read_schema_fingerprint)
+
+    async def get_table_versions_async(self) -> Dict[str, str]:
+        """테이블별 데이터 버전 (DatabaseConnection.get_table_versions와 같은 형식)"""
+        async with self._connect() as conn:
+            return await conn.run_sync(read_table_versions)
+
+    async def get_schema_snapshot_async(self) -> SchemaSnapshot:
+        """
+        DB의 모든 테이블/컬럼/샘플 데이터를 한 번에 조회 (커넥션 1개, read_schema_snapshot 참고)
+
+        Raises:
+            DatabaseConnectionError: 데이터베이스 이름을 가져올 수 없는 경우
+        """
+        async with self._connect() as conn:
+            return await conn.run_sync(read_schema_snapshot)
+
+    async def get_table_schema_async(self) -> str:
+        """DatabaseConnection.get_table_schema와 같은 문자열 (실패 시 SCHEMA_ERROR_PREFIX)"""
+        try:
+            return render_schema(await self.get_schema_snapshot_async())
+        except Exception as e:
+            return f"{SCHEMA_ERROR_PREFIX}: {e}"
+
+    async def dispose(self):
+        """커넥션 풀 정리 (앱 종료 시)"""
+        await self.engine.dispose()
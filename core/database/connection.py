@@ -3,13 +3,210 @@ Database Connection
 MySQL 데이터베이스 연결 관리 (DI 친화적)
 """
 
+import hashlib
+import time
 from typing import List, Dict, Any, Optional, Tuple
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 
+from core.database.schema import ColumnInfo, ForeignKey, SchemaSnapshot, TableInfo, render_schema
+from core.observability.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT,
+    DB_POOL_INVALIDATIONS,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SWEEPS,
+)
 from core.types.errors import DatabaseConnectionError
 
+# get_table_schema() 실패 시 반환 문자열 접두어 (캐시 대상에서 제외)
+SCHEMA_ERROR_PREFIX = "스키마 추출 실패"
+
+# 코드성 테이블 (샘플 데이터 전체 표시)
+SCHEMA_CODE_TABLES = {"departments"}
+# 일반 테이블 샘플 데이터 행 수
+SCHEMA_SAMPLE_LIMIT = 3
+# execute_query() fetchmany 배치 크기
+FETCH_BATCH_SIZE = 500
+
+
+class QueryRows(list):
+    """
+    execute_query() 결과 행 목록 (list와 동일하게 사용)
+
+    truncated: max_rows에서 잘려 버린 행이 있는지
+    """
+
+    def __init__(self, rows=(), truncated: bool = False):
+        super().__init__(rows)
+        self.truncated = truncated
+
+
+def instrument_pool(engine: Engine, name: str):
+    """
+    풀 메트릭 등록 (사용 중/overflow 커넥션 수는 수집 시점에 조회, 무효화는 풀 이벤트로 집계)
+
+    Args:
+        engine: 동기 Engine (AsyncEngine은 sync_engine)
+        name: 메트릭 pool 라벨 ("sync" | "async")
+    """
+    pool = engine.pool
+    DB_POOL_CHECKED_OUT.labels(pool=name).set_function(pool.checkedout)
+    # QueuePool.overflow()는 풀이 다 차기 전까지 음수 (-pool_size부터 시작)
+    DB_POOL_OVERFLOW.labels(pool=name).set_function(lambda: max(pool.overflow(), 0))
+
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        DB_POOL_INVALIDATIONS.labels(pool=name).inc()
+
+    event.listen(engine, "invalidate", on_invalidate)
+
+
+def disable_stats_cache(conn: Connection):
+    """
+    INFORMATION_SCHEMA 통계 캐시 끄기 (세션 단위)
+
+    MySQL 8.0은 INFORMATION_SCHEMA.TABLES 통계(UPDATE_TIME 등)를 기본 24시간 캐시하므로
+    information_schema_stats_expiry=0으로 최신 값을 읽습니다.
+    """
+    conn.execute(text("SET SESSION information_schema_stats_expiry = 0"))
+
+
+def read_explain(conn: Connection, query: str) -> List[Dict[str, Any]]:
+    """실행 계획 조회 (EXPLAIN, 쿼리는 실행하지 않음)"""
+    result = conn.execute(text(f"EXPLAIN {query.strip().rstrip(';')}"))
+    return [dict(row._mapping) for row in result]
+
+
+def read_schema_fingerprint(conn: Connection) -> str:
+    """
+    스키마 변경 감지용 지문 (쿼리 1회)
+
+    테이블별 CREATE_TIME/UPDATE_TIME과 컬럼 정의 해시를 합쳐 해시합니다.
+    DDL(컬럼 추가/변경)과 데이터 변경(샘플 데이터 갱신) 모두 지문을 바꿉니다.
+    (read_table_versions와 같이 캐시되지 않은 통계를 읽음)
+
+    Returns:
+        sha256 hex 문자열
+    """
+    disable_stats_cache(conn)
+    rows = conn.execute(
+        text(
+            """
+        SELECT t.TABLE_NAME, t.CREATE_TIME, t.UPDATE_TIME, c.cols
+        FROM INFORMATION_SCHEMA.TABLES t
+        LEFT JOIN (
+            SELECT TABLE_NAME,
+                   SUM(CRC32(CONCAT_WS('|', ORDINAL_POSITION, COLUMN_NAME, COLUMN_TYPE))) AS cols
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+            GROUP BY TABLE_NAME
+        ) c ON c.TABLE_NAME = t.TABLE_NAME
+        WHERE t.TABLE_SCHEMA = DATABASE()
+        ORDER BY t.TABLE_NAME
+        """
+        )
+    ).fetchall()
+    return hashlib.sha256(repr([tuple(row) for row in rows]).encode()).hexdigest()
+
+
+def read_table_versions(conn: Connection) -> Dict[str, str]:
+    """
+    테이블별 데이터 버전 (쿼리 1회)
+
+    최신 UPDATE_TIME을 읽도록 통계 캐시를 끄고 조회합니다. (disable_stats_cache 참고)
+
+    Returns:
+        {테이블명(소문자): "CREATE_TIME|UPDATE_TIME"}
+    """
+    disable_stats_cache(conn)
+    rows = conn.execute(
+        text(
+            """
+        SELECT TABLE_NAME, CREATE_TIME, UPDATE_TIME
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = DATABASE()
+        """
+        )
+    ).fetchall()
+    return {name.lower(): f"{created}|{updated}" for name, created, updated in rows}
+
+
+def read_schema_snapshot(conn: Connection) -> SchemaSnapshot:
+    """
+    DB의 모든 테이블/컬럼/샘플 데이터를 한 번에 조회 (주어진 커넥션 1개)
+
+    - 컬럼: INFORMATION_SCHEMA.COLUMNS 1회 조회 (테이블별 N회 조회 없음)
+    - 외래키: INFORMATION_SCHEMA.KEY_COLUMN_USAGE 1회 조회 (스키마 링킹 join 그래프용)
+    - 샘플 데이터: 같은 커넥션에서 테이블별 SELECT (코드성 테이블은 전체, 일반 테이블은 3개)
+
+    동기 커넥션 기준 (AsyncDatabaseConnection은 run_sync로 같은 함수 사용)
+
+    Raises:
+        DatabaseConnectionError: 데이터베이스 이름을 가져올 수 없는 경우
+    """
+    db_name = conn.execute(text("SELECT DATABASE()")).scalar()
+    if not db_name:
+        raise DatabaseConnectionError("데이터베이스 이름을 가져올 수 없습니다.")
+
+    # 테이블 목록
+    table_names = conn.execute(
+        text(
+            """
+        SELECT TABLE_NAME
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = :db_name
+        """
+        ),
+        {"db_name": db_name},
+    ).scalars().all()
+    tables = {name: TableInfo(name=name) for name in table_names}
+
+    # 전체 컬럼 목록 (ENUM 값 포함)
+    columns = conn.execute(
+        text(
+            """
+        SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, COLUMN_TYPE, COLUMN_COMMENT
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = :db_name
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """
+        ),
+        {"db_name": db_name},
+    ).fetchall()
+
+    for table_name, col_name, data_type, column_type, comment in columns:
+        if table_name in tables:
+            tables[table_name].columns.append(
+                ColumnInfo(col_name, data_type, column_type, comment or "")
+            )
+
+    # 외래키
+    foreign_keys = conn.execute(
+        text(
+            """
+        SELECT TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
+        FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = :db_name
+        AND REFERENCED_TABLE_NAME IS NOT NULL
+        """
+        ),
+        {"db_name": db_name},
+    ).fetchall()
+
+    for table_name, col_name, ref_table, ref_column in foreign_keys:
+        if table_name in tables:
+            tables[table_name].foreign_keys.append(ForeignKey(col_name, ref_table, ref_column))
+
+    # 샘플 데이터 (같은 커넥션에서 연속 실행)
+    for table in tables.values():
+        limit = "" if table.name in SCHEMA_CODE_TABLES else f"LIMIT {SCHEMA_SAMPLE_LIMIT}"
+        table.samples = conn.execute(
+            text(f"SELECT * FROM `{table.name}` {limit}")
+        ).fetchall()
+
+    return SchemaSnapshot(db_name=db_name, tables=list(tables.values()))
+
 
 class DatabaseConnection:
     """
@@ -25,43 +222,138 @@ class DatabaseConnection:
         connection_url: str,
         pool_size: int = 5,
         pool_recycle: int = 3600,
+        max_rows: Optional[int] = None,
+        statement_timeout_ms: Optional[int] = None,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pre_ping: bool = False,
     ):
         """
         Args:
             connection_url: SQLAlchemy 연결 URL
             pool_size: 커넥션 풀 크기
             pool_recycle: 커넥션 재활용 시간(초)
+            max_rows: execute_query()가 가져오는 최대 행 수 (None이면 제한 없음)
+            statement_timeout_ms: SELECT 문 최대 실행 시간(ms, MySQL max_execution_time). None이면 서버 기본값
+            max_overflow: pool_size를 넘어 추가로 열 수 있는 커넥션 수
+            pool_timeout: 풀이 가득 찼을 때 checkout 최대 대기 시간(초)
+            pre_ping: checkout마다 생존 확인 (기본값은 DB_POOL_PRE_PING과 같은 False → PoolSweeper로 백그라운드 확인)
         """
         if not connection_url:
             raise DatabaseConnectionError("DATABASE_URL이 설정되지 않았습니다.")
 
         self.connection_url = connection_url
+        self.max_rows = max_rows
+        self.pool_size = pool_size
 
         # SQLAlchemy 엔진 생성
         self.engine: Engine = create_engine(
             connection_url,
-            pool_pre_ping=True,
+            pool_pre_ping=pre_ping,
             pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
             pool_recycle=pool_recycle,
         )
+        instrument_pool(self.engine, "sync")
+
+        # 풀의 모든 커넥션에 SELECT 실행 시간 제한 (초과 시 MySQL 오류 3024로 중단)
+        if statement_timeout_ms and self.engine.dialect.name == "mysql":
+            event.listen(self.engine, "connect", self._set_statement_timeout(statement_timeout_ms))
 
         self.SessionLocal = sessionmaker(bind=self.engine)
 
+    @staticmethod
+    def _set_statement_timeout(timeout_ms: int):
+        def on_connect(dbapi_connection, connection_record):
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"SET SESSION max_execution_time = {int(timeout_ms)}")
+
+        return on_connect
+
+    def _connect(self) -> Connection:
+        """풀에서 커넥션 checkout (대기 시간을 메트릭으로 기록)"""
+        started = time.perf_counter()
+        conn = self.engine.connect()
+        DB_POOL_CHECKOUT.observe(time.perf_counter() - started)
+        return conn
+
     def test_connection(self) -> bool:
         """DB 연결 테스트"""
         try:
-            with self.engine.connect() as conn:
+            with self._connect() as conn:
                 conn.execute(text("SELECT 1"))
             return True
         except Exception as e:
             raise DatabaseConnectionError(f"DB 연결 실패: {e}")
 
+    def pool_status(self) -> str:
+        """커넥션 풀 상태 요약 (크기/대기/사용 중/overflow)"""
+        return self.engine.pool.status()
+
+    def prefill(self, count: Optional[int] = None) -> int:
+        """
+        풀 미리 채우기 (앱 시작 시, 첫 요청들의 연결 수립 지연 제거)
+
+        count개 커넥션을 동시에 checkout한 뒤 모두 반납합니다.
+
+        Args:
+            count: 채울 커넥션 수 (None이면 pool_size)
+
+        Returns:
+            풀에 반납된 idle 커넥션 수
+
+        Raises:
+            DatabaseConnectionError: 연결 실패
+        """
+        conns = []
+        try:
+            for _ in range(count or self.pool_size):
+                conns.append(self._connect())
+        except Exception as e:
+            raise DatabaseConnectionError(f"DB 연결 실패: {e}")
+        finally:
+            for conn in conns:
+                conn.close()
+        return self.engine.pool.checkedin()
+
+    def sweep_idle(self) -> int:
+        """
+        idle 커넥션 생존 확인 (pre_ping 대신 PoolSweeper가 주기적으로 호출)
+
+        풀에 반납된 커넥션을 하나씩 checkout → ping → 반납합니다. (FIFO라 반납한 커넥션은 맨 뒤로)
+        응답이 없는 커넥션은 무효화되어 다음 checkout에서 새로 연결됩니다.
+        요청이 idle 커넥션을 모두 가져가면 그 자리에서 중단합니다.
+
+        Returns:
+            무효화한 커넥션 수
+        """
+        pool = self.engine.pool
+        invalidated = 0
+        for _ in range(pool.checkedin()):
+            if pool.checkedin() == 0:
+                break
+            conn = pool.connect()
+            try:
+                self.engine.dialect.do_ping(conn.dbapi_connection)
+                DB_POOL_SWEEPS.labels(result="alive").inc()
+            except Exception as e:
+                conn.invalidate(e)
+                invalidated += 1
+                DB_POOL_SWEEPS.labels(result="dead").inc()
+            finally:
+                conn.close()
+        return invalidated
+
     def execute_query(
         self, query: str
     ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
         """
         SQL 쿼리 실행 (SELECT 등)
 
+        서버 사이드 커서(stream_results)에서 fetchmany로 max_rows행까지만 가져옵니다.
+        (전체 결과를 메모리에 올리지 않음, 초과분은 버리고 결과의 truncated=True)
+
         Args:
             query: 실행할 SQL 쿼리 문자열
 
@@ -69,89 +361,66 @@ class DatabaseConnection:
             tuple: (결과 리스트, 에러 메시지)
         """
         try:
-            with self.engine.connect() as conn:
-                result = conn.execute(text(query))
-                rows = result.fetchall()
-                columns = result.keys()
+            with self._connect() as conn:
+                result = conn.execution_options(stream_results=True).execute(text(query))
+                columns = list(result.keys())
 
-                # 결과를 딕셔너리 리스트로 변환
-                results = [dict(zip(columns, row)) for row in rows]
+                # 결과를 딕셔너리 리스트로 변환 (배치 단위)
+                results: List[Dict[str, Any]] = []
+                while self.max_rows is None or len(results) < self.max_rows:
+                    size = FETCH_BATCH_SIZE
+                    if self.max_rows is not None:
+                        size = min(size, self.max_rows - len(results))
+                    rows = result.fetchmany(size)
+                    if not rows:
+                        break
+                    results.extend(dict(zip(columns, row)) for row in rows)
 
-                return results, None
+                # max_rows에 도달했으면 1행 더 읽어 잘렸는지 확인
+                truncated = self.max_rows is not None and len(results) >= self.max_rows and bool(
+                    result.fetchmany(1)
+                )
+                return QueryRows(results, truncated), None
         except Exception as e:
             return None, str(e)
 
+    def explain(self, query: str) -> List[Dict[str, Any]]:
+        """
+        실행 계획 조회 (EXPLAIN, 쿼리는 실행하지 않음)
+
+        Returns:
+            EXPLAIN 결과 행 목록 ({"id", "table", "type", "rows", "filtered", "Extra", ...})
+        """
+        with self._connect() as conn:
+            return read_explain(conn, query)
+
+    def get_schema_fingerprint(self) -> str:
+        """스키마 변경 감지용 지문 (쿼리 1회, read_schema_fingerprint 참고)"""
+        with self._connect() as conn:
+            return read_schema_fingerprint(conn)
+
+    def get_table_versions(self) -> Dict[str, str]:
+        """테이블별 데이터 버전 (쿼리 1회, 결과 캐시 무효화용, read_table_versions 참고)"""
+        with self._connect() as conn:
+            return read_table_versions(conn)
+
+    def get_schema_snapshot(self) -> SchemaSnapshot:
+        """
+        DB의 모든 테이블/컬럼/샘플 데이터를 한 번에 조회 (커넥션 1개, read_schema_snapshot 참고)
+
+        Raises:
+            DatabaseConnectionError: 데이터베이스 이름을 가져올 수 없는 경우
+        """
+        with self._connect() as conn:
+            return read_schema_snapshot(conn)
+
     def get_table_schema(self) -> str:
         """
         DB의 모든 테이블 및 컬럼 스키마를 문자열로 반환.
         Text-to-SQL 프롬프트에 필요.
         샘플 데이터도 포함 (코드성 테이블은 전체, 일반 테이블은 3개)
         """
-        # 코드성 테이블 (전체 데이터 표시)
-        CODE_TABLES = {"departments"}
-        SAMPLE_LIMIT = 3
-
         try:
-            # DB 이름 추출
-            with self.engine.connect() as conn:
-                result = conn.execute(text("SELECT DATABASE()"))
-                db_name = result.fetchone()[0]
-
-            if not db_name:
-                return "스키마 추출 실패: 데이터베이스 이름을 가져올 수 없습니다."
-
-            # 테이블 목록
-            with self.engine.connect() as conn:
-                tables = conn.execute(
-                    text(
-                        f"""
-                    SELECT TABLE_NAME
-                    FROM INFORMATION_SCHEMA.TABLES
-                    WHERE TABLE_SCHEMA = '{db_name}'
-                    """
-                    )
-                ).fetchall()
-
-            schema_text = ""
-
-            for (table_name,) in tables:
-                schema_text += f"\nTABLE {table_name}:\n"
-
-                # 컬럼 목록 (ENUM 값 포함)
-                with self.engine.connect() as conn:
-                    columns = conn.execute(
-                        text(
-                            f"""
-                        SELECT COLUMN_NAME, DATA_TYPE, COLUMN_TYPE
-                        FROM INFORMATION_SCHEMA.COLUMNS
-                        WHERE TABLE_SCHEMA = '{db_name}'
-                        AND TABLE_NAME = '{table_name}'
-                        ORDER BY ORDINAL_POSITION
-                        """
-                        )
-                    ).fetchall()
-
-                for col_name, data_type, column_type in columns:
-                    if data_type == "enum":
-                        # ENUM 값 표시: enum('A','B','C') → (enum: A, B, C)
-                        enum_values = column_type.replace("enum(", "").replace(")", "").replace("'", "")
-                        schema_text += f"  - {col_name} (enum: {enum_values})\n"
-                    else:
-                        schema_text += f"  - {col_name} ({data_type})\n"
-
-                # 샘플 데이터 추가
-                limit = "" if table_name in CODE_TABLES else f"LIMIT {SAMPLE_LIMIT}"
-                with self.engine.connect() as conn:
-                    samples = conn.execute(
-                        text(f"SELECT * FROM {table_name} {limit}")
-                    ).fetchall()
-
-                if samples:
-                    schema_text += f"  샘플 데이터:\n"
-                    for row in samples:
-                        schema_text += f"    {row}\n"
-
-            return schema_text.strip()
-
+            return render_schema(self.get_schema_snapshot())
         except Exception as e:
-            return f"스키마 추출 실패: {e}"
+            return f"{SCHEMA_ERROR_PREFIX}: {e}"
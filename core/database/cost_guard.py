@@ -0,0 +1,115 @@
+"""
+Query Cost Guard
+실행 전 EXPLAIN으로 예상 검사 행 수를 확인해서 비싼 쿼리(조인 조건 누락 등)를 차단
+
+사용법:
+    guard = QueryCostGuard(db, max_rows=1_000_000)
+    reason = guard.check("SELECT * FROM attendance, salaries")
+    reason = await guard.acheck(sql)  # async 경로 (async_db가 있으면 스레드 없이 EXPLAIN)
+    if reason:
+        # "쿼리 비용 초과: 예상 검사 행 수 ..." → 보정 단계로
+        ...
+
+예상 검사 행 수:
+    - EXPLAIN 결과를 SELECT(id)별로 묶어 테이블별 rows × filtered% 를 곱함 (nested loop 기준)
+    - SELECT별 값을 합산
+    - 인덱스 없이 전체 스캔 + join buffer로 붙는 테이블은 조인 조건 누락 후보로 표시
+"""
+
+import asyncio
+import math
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from core.database.async_connection import AsyncDatabaseConnection
+from core.database.connection import DatabaseConnection
+from core.observability.metrics import SQL_COST_CHECKS
+
+COST_ERROR_PREFIX = "쿼리 비용 초과"
+
+
+def estimate_rows(plan: List[Dict[str, Any]]) -> int:
+    """EXPLAIN 결과 → 예상 검사 행 수"""
+    per_select: Dict[Any, float] = defaultdict(lambda: 1.0)
+    for row in plan:
+        if row.get("table") is None or row.get("rows") is None:
+            continue
+        filtered = float(row.get("filtered") or 100.0)
+        per_select[row.get("id")] *= max(float(row["rows"]) * filtered / 100.0, 1.0)
+    return int(math.ceil(sum(per_select.values()))) if per_select else 0
+
+
+def suspect_tables(plan: List[Dict[str, Any]]) -> List[str]:
+    """조인 조건 없이 붙은 것으로 보이는 테이블 (전체 스캔 + join buffer)"""
+    return [
+        row["table"]
+        for row in plan
+        if row.get("type") == "ALL" and "join buffer" in (row.get("Extra") or "")
+    ]
+
+
+class QueryCostGuard:
+    """
+    EXPLAIN 기반 쿼리 비용 검사
+
+    EXPLAIN 자체가 실패하면 통과시키고 실제 실행에서 오류를 받습니다.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnection,
+        max_rows: int = 1_000_000,
+        async_db: Optional[AsyncDatabaseConnection] = None,
+    ):
+        """
+        Args:
+            db: DatabaseConnection 인스턴스
+            max_rows: 허용하는 최대 예상 검사 행 수
+            async_db: AsyncDatabaseConnection 인스턴스 (acheck에서 스레드 없이 EXPLAIN)
+        """
+        self.db = db
+        self.max_rows = max_rows
+        self.async_db = async_db
+
+    def check(self, sql: str) -> Optional[str]:
+        """
+        비용 검사
+
+        Args:
+            sql: 실행할 SELECT 문
+
+        Returns:
+            차단 사유 (통과 시 None) - 보정 프롬프트에 그대로 전달
+        """
+        try:
+            plan = self.db.explain(sql)
+            estimated = estimate_rows(plan)
+        except Exception:
+            SQL_COST_CHECKS.labels(result="error").inc()
+            return None
+        return self._judge(plan, estimated)
+
+    async def acheck(self, sql: str) -> Optional[str]:
+        """check()의 async 버전 (async_db가 없으면 워커 스레드에서 check 실행)"""
+        if self.async_db is None:
+            return await asyncio.to_thread(self.check, sql)
+        try:
+            plan = await self.async_db.explain_async(sql)
+            estimated = estimate_rows(plan)
+        except Exception:
+            SQL_COST_CHECKS.labels(result="error").inc()
+            return None
+        return self._judge(plan, estimated)
+
+    def _judge(self, plan: List[Dict[str, Any]], estimated: int) -> Optional[str]:
+        """예상 검사 행 수 → 차단 사유 (통과 시 None)"""
+        if estimated <= self.max_rows:
+            SQL_COST_CHECKS.labels(result="ok").inc()
+            return None
+
+        SQL_COST_CHECKS.labels(result="rejected").inc()
+        reason = f"{COST_ERROR_PREFIX}: 예상 검사 행 수 {estimated:,} > 허용 {self.max_rows:,}"
+        suspects = suspect_tables(plan)
+        if suspects:
+            reason += f" (조인 조건 누락 가능성: {', '.join(suspects)} - 모든 JOIN에 ON 조건을 지정하세요)"
+        return reason
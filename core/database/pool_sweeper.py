@@ -0,0 +1,67 @@
+"""
+Pool Sweeper
+커넥션 풀의 idle 커넥션을 백그라운드에서 주기적으로 생존 확인 (checkout마다 pre-ping 대신)
+
+사용법:
+    db = DatabaseConnection(url)  # pre_ping=False (기본값)
+    sweeper = PoolSweeper(db, interval=30.0)
+    sweeper.start()
+    ...
+    sweeper.stop()
+
+- 요청 경로의 checkout은 ping 왕복 없이 바로 커넥션 사용
+- 끊긴 커넥션은 interval 안에 무효화 → 다음 checkout에서 새로 연결
+  (interval 사이에 끊긴 커넥션을 받은 요청은 오류 → SQLAgent 보정/재시도 경로)
+- 동기 풀 전용: AsyncDatabaseConnection은 커넥션이 이벤트 루프에 묶여 있어 pre-ping 유지
+"""
+
+import threading
+from typing import Optional
+
+from core.database.connection import DatabaseConnection
+
+
+class PoolSweeper:
+    """
+    DatabaseConnection.sweep_idle()을 interval마다 실행하는 데몬 스레드
+
+    sweep 중 예외는 무시하고 다음 주기에 다시 시도합니다.
+    """
+
+    def __init__(self, db: DatabaseConnection, interval: float = 30.0):
+        """
+        Args:
+            db: DatabaseConnection 인스턴스 (pre_ping=False 권장)
+            interval: 생존 확인 간격(초)
+        """
+        self.db = db
+        self.interval = interval
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """백그라운드 스레드 시작 (이미 실행 중이면 무시)"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="db-pool-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """스레드 중지 (진행 중인 sweep은 끝까지 실행)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.db.sweep_idle()
+            except Exception:
+                pass  # DB 장애 중에도 다음 주기에 재시도
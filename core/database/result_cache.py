@@ -0,0 +1,311 @@
+"""
+Result Cache
+SQL 실행 결과 캐시 (테이블 단위 무효화 + stale-while-revalidate)
+
+사용법:
+    cache = ResultCache(db, ttl=60.0, stale_ttl=600.0, async_db=async_db)
+    results, error = cache.execute_query("SELECT COUNT(*) FROM employees")  # db.execute_query와 동일
+    results, error = await cache.aexecute_query(sql)  # async 경로 (실행/버전 조회 모두 async_db)
+
+동작:
+    - 키: 정규화된 SQL (문자열 리터럴 밖의 공백 축소, 끝의 세미콜론 제거)
+    - 항목마다 읽은 테이블과 저장 시점의 테이블 버전(UPDATE_TIME)을 기록
+      (테이블을 읽지 않는 쿼리는 무효화 기준이 없으므로 캐시하지 않음, 예: SELECT NOW())
+    - 테이블 버전은 poll_interval마다 1회 조회 → 읽은 테이블이 바뀐 항목은 무효화
+    - age < ttl: 캐시 반환 (hit)
+    - ttl ≤ age < stale_ttl: 캐시 즉시 반환 + 백그라운드 재실행 (stale)
+      (CURDATE() 등 시간에 따라 결과가 바뀌는 쿼리나 UPDATE_TIME이 놓친 변경 대비)
+    - age ≥ stale_ttl: 다시 실행 (miss)
+"""
+
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from core.database.async_connection import AsyncDatabaseConnection
+from core.database.connection import DatabaseConnection
+from core.observability.metrics import RESULT_CACHE_EVENTS
+
+# 문자열 리터럴 / 공백
+_SQL_TOKEN = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"|\s+")
+_IDENTIFIER = re.compile(r"`([^`]+)`|\b([A-Za-z_][A-Za-z0-9_$]*)\b")
+_READ_ONLY = re.compile(r"^\s*(SELECT|WITH)\b", re.I)
+
+QueryResult = Tuple[Optional[List[Dict[str, Any]]], Optional[str]]
+
+
+def normalize_sql(sql: str) -> str:
+    """캐시 키용 SQL 정규화 (리터럴은 그대로)"""
+    normalized = _SQL_TOKEN.sub(lambda m: " " if m.group().isspace() else m.group(), sql.strip())
+    return normalized.rstrip("; ")
+
+
+def referenced_tables(sql: str, known_tables) -> FrozenSet[str]:
+    """SQL에 등장하는 식별자 중 실제 테이블 이름 (리터럴 제외, 넓게 잡아도 무효화만 늘어남)"""
+    code = _SQL_TOKEN.sub(lambda m: " " if m.group().isspace() else "''", sql)
+    names = {(quoted or bare).lower() for quoted, bare in _IDENTIFIER.findall(code)}
+    return frozenset(names & set(known_tables))
+
+
+@dataclass(frozen=True)
+class ResultEntry:
+    """캐시 항목"""
+
+    results: List[Dict[str, Any]]
+    versions: Dict[str, str]  # 읽은 테이블 → 저장 시점 버전
+    stored_at: float
+
+
+class ResultCache:
+    """
+    DatabaseConnection.execute_query 앞단의 결과 캐시
+
+    - 읽기 전용(SELECT/WITH) 쿼리 중 테이블을 읽는 쿼리의 성공 결과만 저장
+    - 백그라운드 재실행은 키당 1개만 (중복 예약 없음)
+    - max_entries 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnection,
+        ttl: float = 60.0,
+        stale_ttl: float = 600.0,
+        poll_interval: float = 5.0,
+        max_entries: int = 1000,
+        max_rows: int = 5000,
+        async_db: Optional[AsyncDatabaseConnection] = None,
+    ):
+        """
+        Args:
+            db: DatabaseConnection 인스턴스
+            ttl: 재실행 없이 캐시를 반환하는 시간(초)
+            stale_ttl: 캐시를 반환하며 백그라운드 재실행하는 최대 나이(초)
+            poll_interval: 테이블 버전 조회 간격(초). 0이면 매 요청 조회
+            max_entries: 최대 항목 수
+            max_rows: 이보다 행이 많은 결과는 캐시하지 않음
+            async_db: AsyncDatabaseConnection 인스턴스 (aexecute_query/alookup에서 스레드 없이 실행/버전 조회)
+        """
+        self.db = db
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.poll_interval = poll_interval
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.async_db = async_db
+
+        self._entries: "OrderedDict[str, ResultEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._apoll_lock: Optional[asyncio.Lock] = None  # 첫 async poll에서 생성 (이벤트 루프 바인딩)
+        self._versions: Dict[str, str] = {}
+        self._polled_at: Optional[float] = None
+        self._refreshing: set = set()
+        self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="result-cache")
+
+    def execute_query(self, query: str) -> QueryResult:
+        """db.execute_query()와 같은 형식 (캐시 hit이면 DB 접근 없음)"""
+        if not _READ_ONLY.match(query):
+            return self.db.execute_query(query)
+
+        self._poll_versions()
+        key = normalize_sql(query)
+        results = self._lookup(key, query)
+        if results is not None:
+            return results, None
+
+        RESULT_CACHE_EVENTS.labels(event="miss").inc()
+        return self._execute(key, query)
+
+    async def aexecute_query(self, query: str) -> QueryResult:
+        """
+        execute_query()의 async 버전 (miss 시 async_db.execute_query_async로 실행)
+
+        async_db가 없으면 워커 스레드에서 execute_query()를 실행합니다.
+        stale 항목의 백그라운드 재실행은 async_db 여부와 관계없이 동기 db로 처리합니다.
+        """
+        if self.async_db is None:
+            return await asyncio.to_thread(self.execute_query, query)
+        if not _READ_ONLY.match(query):
+            return await self.async_db.execute_query_async(query)
+
+        await self._apoll_versions()
+        key = normalize_sql(query)
+        results = self._lookup(key, query)
+        if results is not None:
+            return results, None
+
+        RESULT_CACHE_EVENTS.labels(event="miss").inc()
+        versions = self._versions
+        results, error = await self.async_db.execute_query_async(query)
+        self._store(key, query, versions, results, error)
+        return results, error
+
+    def lookup(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시 결과만 조회 (없으면 None, 쿼리는 실행하지 않음)
+
+        테이블 버전 조회 시점이 됐으면 먼저 버전을 조회합니다. (EXPLAIN 등 실행 전 검사를 miss에만 하기 위함)
+        """
+        if not _READ_ONLY.match(query):
+            return None
+        self._poll_versions()
+        return self._lookup(normalize_sql(query), query)
+
+    async def alookup(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """lookup()의 async 버전 (버전 조회는 _apoll_versions 참고)"""
+        if not _READ_ONLY.match(query):
+            return None
+        await self._apoll_versions()
+        return self._lookup(normalize_sql(query), query)
+
+    def peek(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        DB 접근 없이 반환 가능한 캐시 결과 (없으면 None)
+
+        테이블 버전 조회 시점이 됐으면 None을 반환해 execute_query()로 넘깁니다.
+        """
+        if not _READ_ONLY.match(query) or self._poll_due():
+            return None
+        return self._lookup(normalize_sql(query), query)
+
+    def invalidate(self, table: Optional[str] = None):
+        """항목 삭제 (table이 있으면 해당 테이블을 읽은 항목만)"""
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+                return
+            for key in [k for k, e in self._entries.items() if table.lower() in e.versions]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "refreshing": len(self._refreshing)}
+
+    def shutdown(self, wait: bool = False):
+        """백그라운드 재실행 중지 (이후 stale 항목은 재실행 없이 반환)"""
+        self._refresher.shutdown(wait=wait)
+
+    # --------------------------
+    # Internal
+    # --------------------------
+    def _lookup(self, key: str, query: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if any(self._versions.get(t) != v for t, v in entry.versions.items()):
+                del self._entries[key]
+                RESULT_CACHE_EVENTS.labels(event="invalidated").inc()
+                return None
+
+            age = time.monotonic() - entry.stored_at
+            if age >= self.stale_ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            if age >= self.ttl and key not in self._refreshing:
+                try:
+                    self._refresher.submit(self._refresh, key, query)
+                    self._refreshing.add(key)
+                except RuntimeError:
+                    pass  # shutdown 이후
+                RESULT_CACHE_EVENTS.labels(event="stale").inc()
+            else:
+                RESULT_CACHE_EVENTS.labels(event="hit").inc()
+            return entry.results
+
+    def _execute(self, key: str, query: str):
+        """
+        실행 후 성공 결과 저장
+
+        버전은 실행 전 값을 기록하므로 실행 중 바뀐 테이블은 다음 poll에서 무효화됩니다.
+        테이블 버전을 모르면 (조회 실패) 저장하지 않습니다.
+        """
+        versions = self._versions
+        results, error = self.db.execute_query(query)
+        self._store(key, query, versions, results, error)
+        return results, error
+
+    def _store(self, key: str, query: str, versions: Dict[str, str], results, error):
+        """성공 결과 저장 (versions: 실행 전 테이블 버전)"""
+        if error is not None or not versions or len(results) > self.max_rows:
+            return
+        tables = referenced_tables(query, versions)
+        if not tables:
+            return  # 무효화할 테이블이 없음 (NOW()/CURDATE() 등은 ttl 동안 오래된 값이 됨)
+        entry = ResultEntry(
+            results=results,
+            versions={t: versions[t] for t in tables},
+            stored_at=time.monotonic(),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _refresh(self, key: str, query: str):
+        """백그라운드 재실행 (실패하면 항목 삭제)"""
+        try:
+            self._poll_versions()
+            _, error = self._execute(key, query)
+            if error is not None:
+                with self._lock:
+                    self._entries.pop(key, None)
+            RESULT_CACHE_EVENTS.labels(event="refresh" if error is None else "refresh_error").inc()
+        except Exception:
+            with self._lock:
+                self._entries.pop(key, None)
+            RESULT_CACHE_EVENTS.labels(event="refresh_error").inc()
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _poll_due(self) -> bool:
+        return self._polled_at is None or time.monotonic() - self._polled_at >= self.poll_interval
+
+    def _poll_versions(self):
+        """테이블 버전 조회 (poll_interval마다 1회, 동시 요청은 lock으로 직렬화)"""
+        if not self._poll_due():
+            return
+        with self._poll_lock:
+            if not self._poll_due():
+                return
+            try:
+                versions = self.db.get_table_versions()
+            except Exception:
+                versions = None
+            self._set_versions(versions)
+
+    async def _apoll_versions(self):
+        """_poll_versions()의 async 버전 (async_db가 없으면 워커 스레드에서 동기 조회)"""
+        if not self._poll_due():
+            return
+        if self.async_db is None:
+            await asyncio.to_thread(self._poll_versions)
+            return
+        if self._apoll_lock is None:
+            self._apoll_lock = asyncio.Lock()
+        async with self._apoll_lock:
+            if not self._poll_due():
+                return
+            try:
+                versions = await self.async_db.get_table_versions_async()
+            except Exception:
+                versions = None
+            self._set_versions(versions)
+
+    def _set_versions(self, versions: Optional[Dict[str, str]]):
+        """조회한 테이블 버전 반영 (None이면 조회 실패)"""
+        if versions is None:
+            # 버전을 알 수 없으면 전체 무효화 (오래된 결과 반환 방지)
+            versions = {}
+            self.invalidate()
+        self._versions = versions
+        self._polled_at = time.monotonic()
@@ -0,0 +1,166 @@
+"""
+Schema Snapshot
+INFORMATION_SCHEMA 조회 결과를 구조화한 스냅샷 + 프롬프트용 텍스트 렌더링
+
+사용법:
+    snapshot = db.get_schema_snapshot()
+    schema_text = render_schema(snapshot)                 # 기존 형식 (컬럼별 1줄 + Row repr)
+    schema_text = render_schema(snapshot, "compact")      # 테이블별 1줄 DDL 형식
+
+compact 형식 예시:
+    employees(emp_id int, dept_id int -> departments.dept_id, status enum(ACTIVE|LEAVE|RESIGNED))
+      -- samples: (1, 1, 'ACTIVE') (2, 1, 'LEAVE')
+"""
+
+import datetime
+import hashlib
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+# 렌더링 형식
+SCHEMA_FORMATS = ("full", "compact")
+# compact 형식에서 샘플 문자열 최대 길이
+COMPACT_VALUE_MAX_LEN = 24
+
+
+@dataclass(frozen=True)
+class ColumnInfo:
+    """컬럼 정의"""
+
+    name: str
+    data_type: str  # 예: "int", "varchar", "enum"
+    column_type: str  # 예: "int", "varchar(50)", "enum('A','B')"
+    comment: str = ""  # COLUMN_COMMENT (스키마 링킹 키워드로 사용)
+
+
+@dataclass(frozen=True)
+class ForeignKey:
+    """외래키 (column → ref_table.ref_column)"""
+
+    column: str
+    ref_table: str
+    ref_column: str
+
+
+@dataclass
+class TableInfo:
+    """테이블 정의 + 샘플 데이터"""
+
+    name: str
+    columns: List[ColumnInfo] = field(default_factory=list)
+    samples: List[Sequence[Any]] = field(default_factory=list)  # DB가 반환한 Row 그대로
+    foreign_keys: List[ForeignKey] = field(default_factory=list)
+
+
+@dataclass
+class SchemaSnapshot:
+    """DB 전체 스키마 스냅샷 (테이블 순서 유지)"""
+
+    db_name: str
+    tables: List[TableInfo] = field(default_factory=list)
+
+    def table_map(self) -> Dict[str, TableInfo]:
+        """테이블 이름 → TableInfo"""
+        return {table.name: table for table in self.tables}
+
+    def structure_hash(self) -> str:
+        """
+        구조 해시 (테이블/컬럼/타입/외래키, 샘플 데이터 제외)
+
+        데이터 변경에는 그대로이고 DDL이 바뀔 때만 달라집니다 (NL → SQL 캐시 키용).
+        """
+        parts = []
+        for table in sorted(self.tables, key=lambda t: t.name):
+            columns = ",".join(f"{c.name}:{c.column_type}" for c in table.columns)
+            fks = ",".join(sorted(f"{fk.column}>{fk.ref_table}.{fk.ref_column}" for fk in table.foreign_keys))
+            parts.append(f"{table.name}({columns})[{fks}]")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def enum_values(column_type: str) -> List[str]:
+    """enum('A','B','A') → ['A', 'B'] (중복 제거, 순서 유지)"""
+    if not column_type.startswith("enum("):
+        return []
+    values = [v.strip().strip("'") for v in column_type[len("enum("):-1].split(",")]
+    return list(dict.fromkeys(values))
+
+
+def render_column(column: ColumnInfo) -> str:
+    """컬럼 1줄 렌더링 (ENUM은 값 목록 포함)"""
+    if column.data_type == "enum":
+        # ENUM 값 표시: enum('A','B','C') → (enum: A, B, C)
+        enum_values = column.column_type.replace("enum(", "").replace(")", "").replace("'", "")
+        return f"  - {column.name} (enum: {enum_values})\n"
+    return f"  - {column.name} ({column.data_type})\n"
+
+
+def format_value(value: Any, max_len: int = COMPACT_VALUE_MAX_LEN) -> str:
+    """샘플 값 → compact 문자열 (날짜/시간은 ISO, 긴 문자열은 생략)"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat(sep=" ") if isinstance(value, datetime.datetime) else value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        # MySQL TIME → timedelta
+        seconds = int(value.total_seconds())
+        sign = "-" if seconds < 0 else ""
+        hours, rest = divmod(abs(seconds), 3600)
+        return f"{sign}{hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+    if isinstance(value, (bytes, bytearray)):
+        return "<binary>"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+
+    text = str(value).replace("\n", " ")
+    if len(text) > max_len:
+        text = text[:max_len] + "…"
+    return f"'{text}'"
+
+
+def render_column_compact(column: ColumnInfo, foreign_key: Optional[ForeignKey] = None) -> str:
+    """컬럼 정의 1개 (name type [-> ref_table.ref_column])"""
+    if column.data_type == "enum":
+        text = f"{column.name} enum({'|'.join(enum_values(column.column_type))})"
+    else:
+        text = f"{column.name} {column.data_type}"
+    if foreign_key is not None:
+        text += f" -> {foreign_key.ref_table}.{foreign_key.ref_column}"
+    return text
+
+
+def render_table_compact(table: TableInfo) -> str:
+    """테이블 1개 compact 렌더링 (1줄 DDL + FK 힌트 + 샘플 1줄)"""
+    foreign_keys = {fk.column: fk for fk in table.foreign_keys}
+    columns = ", ".join(
+        render_column_compact(column, foreign_keys.get(column.name)) for column in table.columns
+    )
+    text = f"{table.name}({columns})\n"
+
+    if table.samples:
+        rows = " ".join(f"({', '.join(format_value(v) for v in row)})" for row in table.samples)
+        text += f"  -- samples: {rows}\n"
+    return text
+
+
+def render_table(table: TableInfo, schema_format: str = "full") -> str:
+    """테이블 1개 렌더링 (컬럼 + 샘플 데이터)"""
+    if schema_format == "compact":
+        return render_table_compact(table)
+    if schema_format != "full":
+        raise ValueError(f"지원하지 않는 스키마 형식입니다: {schema_format}. {SCHEMA_FORMATS} 중 하나를 사용하세요.")
+
+    text = f"\nTABLE {table.name}:\n"
+    for column in table.columns:
+        text += render_column(column)
+
+    if table.samples:
+        text += f"  샘플 데이터:\n"
+        for row in table.samples:
+            text += f"    {row}\n"
+    return text
+
+
+def render_schema(snapshot: SchemaSnapshot, schema_format: str = "full") -> str:
+    """스냅샷 → Text-to-SQL 프롬프트용 스키마 문자열 ("full" | "compact")"""
+    return "".join(render_table(table, schema_format) for table in snapshot.tables).strip()
@@ -0,0 +1,181 @@
+"""
+Schema Cache
+SQLAgent 프롬프트용 스키마 캐시 (TTL + 변경 감지)
+
+사용법:
+    cache = SchemaCache(db, ttl=30.0)
+    schema = cache.get()        # TTL 이내: DB 접근 없음
+    entry = cache.get_entry()   # 구조화 스냅샷 + 렌더링된 문자열
+    entry = await cache.aget_entry()  # async 경로 (async_db가 있으면 스레드 없이 지문 확인/재조회)
+    cache.invalidate()          # 다음 get()은 전체 재조회
+
+동작:
+    1. TTL 이내 → 캐시 반환 (hit)
+    2. TTL 경과 → INFORMATION_SCHEMA 지문 조회 1회 (CREATE_TIME/UPDATE_TIME/컬럼 해시)
+       - 지문 동일 → TTL 연장 후 캐시 반환 (validated)
+       - 지문 변경 → get_schema_snapshot() 전체 재조회 (reload)
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from core.database.async_connection import AsyncDatabaseConnection
+from core.database.connection import DatabaseConnection, SCHEMA_ERROR_PREFIX
+from core.database.schema import SchemaSnapshot, render_schema
+from core.observability.metrics import SCHEMA_CACHE_EVENTS
+
+
+@dataclass(frozen=True)
+class SchemaEntry:
+    """캐시 항목 (snapshot이 None이면 추출 실패, text는 오류 메시지)"""
+
+    snapshot: Optional[SchemaSnapshot]
+    text: str
+    structure_hash: Optional[str] = None  # DDL 구조 해시 (샘플 데이터 제외)
+
+
+class SchemaCache:
+    """
+    스키마 스냅샷 캐시
+
+    - 동시에 만료를 만난 요청들은 lock으로 직렬화해서 재조회는 1회만 실행
+      (동기 경로는 threading.Lock, async 경로는 asyncio.Lock - 경로별로 1회)
+    - 추출 실패 결과는 캐시하지 않음 (다음 요청에서 재시도)
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnection,
+        ttl: float = 30.0,
+        schema_format: str = "full",
+        async_db: Optional[AsyncDatabaseConnection] = None,
+    ):
+        """
+        Args:
+            db: DatabaseConnection 인스턴스
+            ttl: 지문 확인 없이 캐시를 신뢰하는 시간(초). 0이면 매 요청 지문 확인
+            schema_format: 스키마 렌더링 형식 ("full" | "compact")
+            async_db: AsyncDatabaseConnection 인스턴스 (aget_entry에서 스레드 없이 지문 확인/재조회)
+        """
+        self.db = db
+        self.async_db = async_db
+        self.ttl = ttl
+        self.schema_format = schema_format
+        self._entry: Optional[SchemaEntry] = None
+        self._fingerprint: Optional[str] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._async_lock: Optional[asyncio.Lock] = None  # 첫 aget_entry에서 생성 (이벤트 루프 바인딩)
+        self._counts = {"hit": 0, "validated": 0, "reload": 0}
+
+    def peek_entry(self) -> Optional[SchemaEntry]:
+        """TTL 이내의 캐시만 반환 (만료/미적재 시 None, DB 접근 없음)"""
+        entry = self._entry
+        if entry is not None and time.monotonic() - self._checked_at < self.ttl:
+            self._record("hit")
+            return entry
+        return None
+
+    def get_entry(self) -> SchemaEntry:
+        """스키마 항목 반환 (필요 시 지문 확인/재조회)"""
+        entry = self.peek_entry()
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            # lock 대기 중 다른 스레드가 갱신했으면 그대로 사용
+            entry = self.peek_entry()
+            if entry is not None:
+                return entry
+
+            try:
+                fingerprint = self.db.get_schema_fingerprint()
+            except Exception:
+                fingerprint = None  # 지문 조회 실패 시 전체 재조회
+
+            entry = self._validate(fingerprint)
+            if entry is not None:
+                return entry
+
+            self._record("reload")
+            try:
+                snapshot = self.db.get_schema_snapshot()
+            except Exception as e:
+                return SchemaEntry(snapshot=None, text=f"{SCHEMA_ERROR_PREFIX}: {e}")
+            return self._store(snapshot, fingerprint)
+
+    async def aget_entry(self) -> SchemaEntry:
+        """get_entry()의 async 버전 (async_db가 없으면 워커 스레드에서 get_entry 실행)"""
+        entry = self.peek_entry()
+        if entry is not None:
+            return entry
+        if self.async_db is None:
+            return await asyncio.to_thread(self.get_entry)
+
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            entry = self.peek_entry()
+            if entry is not None:
+                return entry
+
+            try:
+                fingerprint = await self.async_db.get_schema_fingerprint_async()
+            except Exception:
+                fingerprint = None
+
+            entry = self._validate(fingerprint)
+            if entry is not None:
+                return entry
+
+            self._record("reload")
+            try:
+                snapshot = await self.async_db.get_schema_snapshot_async()
+            except Exception as e:
+                return SchemaEntry(snapshot=None, text=f"{SCHEMA_ERROR_PREFIX}: {e}")
+            return self._store(snapshot, fingerprint)
+
+    def peek(self) -> Optional[str]:
+        """peek_entry()의 스키마 문자열"""
+        entry = self.peek_entry()
+        return entry.text if entry is not None else None
+
+    def get(self) -> str:
+        """get_entry()의 스키마 문자열"""
+        return self.get_entry().text
+
+    def invalidate(self):
+        """캐시 무효화 (다음 get()은 전체 재조회)"""
+        with self._lock:
+            self._entry = None
+            self._fingerprint = None
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return {**self._counts, "fingerprint": self._fingerprint}
+
+    def _validate(self, fingerprint: Optional[str]) -> Optional[SchemaEntry]:
+        """지문이 캐시와 같으면 TTL 연장 후 캐시 항목 반환 (다르면 None → 재조회)"""
+        if self._entry is not None and fingerprint is not None and fingerprint == self._fingerprint:
+            self._checked_at = time.monotonic()
+            self._record("validated")
+            return self._entry
+        return None
+
+    def _store(self, snapshot: SchemaSnapshot, fingerprint: Optional[str]) -> SchemaEntry:
+        """재조회한 스냅샷 저장"""
+        self._entry = SchemaEntry(
+            snapshot=snapshot,
+            text=render_schema(snapshot, self.schema_format),
+            structure_hash=snapshot.structure_hash(),
+        )
+        self._fingerprint = fingerprint
+        self._checked_at = time.monotonic()
+        return self._entry
+
+    def _record(self, event: str):
+        self._counts[event] += 1
+        SCHEMA_CACHE_EVENTS.labels(event=event).inc()
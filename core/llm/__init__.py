@@ -3,6 +3,6 @@ LLM Module
 Provider(OpenAI/Ollama)에 따른 LLM 인스턴스 생성
 """
 
-from core.llm.factory import create_chat_model, create_embeddings
+from core.llm.factory import create_chat_model, create_embeddings, check_llm_provider
 
-__all__ = ["create_chat_model", "create_embeddings"]
+__all__ = ["create_chat_model", "create_embeddings", "check_llm_provider"]
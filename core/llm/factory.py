@@ -16,10 +16,13 @@ Provider(openai/ollama)에 따라 적절한 LLM 인스턴스를 생성합니다.
     )
 """
 
+import os
 from typing import Optional, Union
 from langchain_core.language_models import BaseChatModel
 from langchain_core.embeddings import Embeddings
 
+from core.observability.metrics import LLMMetricsCallback
+
 
 def create_chat_model(
     provider: str,
@@ -42,6 +45,9 @@ def create_chat_model(
     Raises:
         ValueError: 지원하지 않는 provider일 경우
 
+    Note:
+        모든 모델에 LLMMetricsCallback이 연결되어 호출 수/지연 시간이 메트릭으로 수집됩니다.
+
     Examples:
         >>> llm = create_chat_model("openai", "gpt-4o-mini")
         >>> llm = create_chat_model("ollama", "llama3.1:8b", base_url="http://localhost:11434")
@@ -51,11 +57,16 @@ def create_chat_model(
         return ChatOllama(
             model=model,
             base_url=base_url or "http://localhost:11434",
-            temperature=temperature
+            temperature=temperature,
+            callbacks=[LLMMetricsCallback(provider, model)],
         )
     elif provider == "openai":
         from langchain_openai import ChatOpenAI
-        return ChatOpenAI(model=model, temperature=temperature)
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            callbacks=[LLMMetricsCallback(provider, model)],
+        )
     else:
         raise ValueError(f"지원하지 않는 LLM provider입니다: {provider}. 'openai' 또는 'ollama'를 사용하세요.")
 
@@ -95,7 +106,6 @@ def create_embeddings(
         from langchain_openai import OpenAIEmbeddings
         return OpenAIEmbeddings(model=model)
     elif provider == "google":
-        import os
         from langchain_google_genai import GoogleGenerativeAIEmbeddings
         return GoogleGenerativeAIEmbeddings(
             model=model,
@@ -117,3 +127,41 @@ def create_embeddings(
         return SentenceTransformerEmbeddings(model)
     else:
         raise ValueError(f"지원하지 않는 Embedding provider입니다: {provider}. 'openai', 'ollama', 'google', 또는 'huggingface'를 사용하세요.")
+
+
+def check_llm_provider(
+    provider: str,
+    base_url: Optional[str] = None,
+    timeout: float = 2.0,
+    api_key: Optional[str] = None
+) -> str:
+    """
+    LLM Provider 도달 가능 여부 확인 (토큰을 소모하지 않는 목록 API 호출)
+
+    Args:
+        provider: "openai" 또는 "ollama"
+        base_url: Ollama 서버 URL (ollama일 때만 사용)
+        timeout: 요청 타임아웃(초)
+        api_key: OpenAI API 키 (None이면 OPENAI_API_KEY 환경변수)
+
+    Returns:
+        상태 설명 문자열
+
+    Raises:
+        ValueError: 지원하지 않는 provider일 경우
+        httpx.HTTPError: 연결 실패 또는 오류 응답
+    """
+    import httpx
+
+    if provider == "ollama":
+        url = f"{(base_url or 'http://localhost:11434').rstrip('/')}/api/tags"
+        response = httpx.get(url, timeout=timeout)
+    elif provider == "openai":
+        url = f"{os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1').rstrip('/')}/models"
+        headers = {"Authorization": f"Bearer {api_key or os.getenv('OPENAI_API_KEY', '')}"}
+        response = httpx.get(url, headers=headers, timeout=timeout)
+    else:
+        raise ValueError(f"지원하지 않는 LLM provider입니다: {provider}. 'openai' 또는 'ollama'를 사용하세요.")
+
+    response.raise_for_status()
+    return f"{provider} reachable ({response.status_code})"
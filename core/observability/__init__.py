@@ -0,0 +1,9 @@
+"""
+Observability Module
+단계별 지연시간 측정, Prometheus 메트릭, Readiness 점검
+"""
+
+from core.observability.timing import StageTimings, start_timing, current_timing, timed
+from core.observability.health import ReadinessChecker
+
+__all__ = ["StageTimings", "start_timing", "current_timing", "timed", "ReadinessChecker"]
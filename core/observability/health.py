@@ -0,0 +1,84 @@
+"""
+Readiness Checker
+컴포넌트 상태 점검 (DB 풀, FAISS 인덱스, LLM Provider) + 짧은 TTL 캐시
+
+사용법:
+    checker = ReadinessChecker(
+        checks={"database": db_check, "faiss_index": index_check},
+        ttl=5.0,
+    )
+    report = await checker.check()
+    # {"ready": True, "checks": {"database": {"ok": True, ...}}, "cached": False}
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+# 점검 함수: 정상이면 상세 문자열(또는 None) 반환, 비정상이면 예외
+CheckFn = Callable[[], Optional[str]]
+
+
+class ReadinessChecker:
+    """
+    Readiness 점검기
+
+    - 모든 점검을 병렬로 실행 (점검별 timeout)
+    - 결과를 ttl초 동안 캐시해서 프로브 자체는 저렴하게 유지
+    - 동시에 들어온 프로브는 진행 중인 점검 1회를 공유
+    """
+
+    def __init__(self, checks: Dict[str, CheckFn], ttl: float = 5.0, timeout: float = 2.0):
+        """
+        Args:
+            checks: 점검 이름 → 점검 함수 (동기, 별도 스레드에서 실행)
+            ttl: 결과 캐시 시간(초)
+            timeout: 점검별 최대 시간(초)
+        """
+        self.checks = checks
+        self.ttl = ttl
+        self.timeout = timeout
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return self._cached is not None and time.monotonic() - self._cached_at < self.ttl
+
+    async def check(self) -> Dict[str, Any]:
+        """전체 점검 결과 (TTL 내에는 캐시 반환)"""
+        if self._fresh():
+            return {**self._cached, "cached": True}
+
+        async with self._lock:
+            if self._fresh():
+                return {**self._cached, "cached": True}
+
+            names = list(self.checks)
+            results = await asyncio.gather(*(self._run(self.checks[name]) for name in names))
+            checks = dict(zip(names, results))
+
+            self._cached = {"ready": all(r["ok"] for r in results), "checks": checks}
+            self._cached_at = time.monotonic()
+            return {**self._cached, "cached": False}
+
+    async def _run(self, fn: CheckFn) -> Dict[str, Any]:
+        """점검 1개 실행 → {"ok", "detail", "latency_ms"}"""
+        started = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(asyncio.to_thread(fn), self.timeout)
+            ok = True
+        except asyncio.TimeoutError:
+            detail, ok = f"timeout ({self.timeout}s)", False
+        except Exception as e:
+            detail, ok = str(e), False
+
+        return {
+            "ok": ok,
+            "detail": detail,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def invalidate(self):
+        """캐시 무효화 (다음 점검은 실제로 실행)"""
+        self._cached = None
@@ -0,0 +1,260 @@
+"""
+Prometheus Metrics
+애플리케이션 메트릭 정의 (전용 Registry)
+
+사용법:
+    from core.observability.metrics import REQUEST_LATENCY
+
+    REQUEST_LATENCY.labels(agent_type="SQL_AGENT", success="true").observe(1.23)
+
+    # /metrics 엔드포인트
+    body = render_latest()
+"""
+
+import re
+import time
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+REGISTRY = CollectorRegistry()
+
+# LLM 호출/파이프라인은 수백 ms ~ 수십 초
+_SLOW_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+# DB 커넥션/FAISS 검색 등은 수 ms 단위
+_FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+# ===== 요청 =====
+REQUEST_LATENCY = Histogram(
+    "hr_request_duration_seconds",
+    "질의 1건 처리 시간 (엔드포인트 기준)",
+    ["agent_type", "success"],
+    buckets=_SLOW_BUCKETS,
+    registry=REGISTRY,
+)
+
+STAGE_LATENCY = Histogram(
+    "hr_stage_duration_seconds",
+    "파이프라인 단계별 소요 시간 (router_llm, embedding, faiss_search, sql_execute 등)",
+    ["stage"],
+    buckets=_FAST_BUCKETS + _SLOW_BUCKETS[5:],
+    registry=REGISTRY,
+)
+
+# ===== Router / SQL =====
+ROUTER_DECISIONS = Counter(
+    "hr_router_decisions_total",
+    "Router 분류 결과",
+    ["agent_type", "fallback"],
+    registry=REGISTRY,
+)
+
+SQL_ATTEMPTS = Histogram(
+    "hr_sql_attempts",
+    "SQL Agent 질의당 생성/수정 시도 횟수 (metadata['attempts'])",
+    ["success"],
+    buckets=(1, 2, 3, 4, 5, 6),
+    registry=REGISTRY,
+)
+
+# ===== LLM =====
+LLM_REQUESTS = Counter(
+    "hr_llm_requests_total",
+    "LLM 호출 수",
+    ["provider", "model", "status"],
+    registry=REGISTRY,
+)
+
+LLM_LATENCY = Histogram(
+    "hr_llm_request_duration_seconds",
+    "LLM 호출 지연 시간",
+    ["provider", "model"],
+    buckets=_SLOW_BUCKETS,
+    registry=REGISTRY,
+)
+
+# ===== DB =====
+DB_POOL_CHECKOUT = Histogram(
+    "hr_db_pool_checkout_seconds",
+    "DB 커넥션 풀 checkout 대기 시간",
+    buckets=_FAST_BUCKETS,
+    registry=REGISTRY,
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "hr_db_pool_checked_out",
+    "사용 중인 DB 커넥션 수",
+    ["pool"],
+    registry=REGISTRY,
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "hr_db_pool_overflow",
+    "pool_size를 넘어 추가로 연 DB 커넥션 수 (max_overflow까지)",
+    ["pool"],
+    registry=REGISTRY,
+)
+
+DB_POOL_INVALIDATIONS = Counter(
+    "hr_db_pool_invalidations_total",
+    "무효화된 DB 커넥션 수 (연결 끊김 감지, 생존 확인 실패)",
+    ["pool"],
+    registry=REGISTRY,
+)
+
+DB_POOL_SWEEPS = Counter(
+    "hr_db_pool_sweep_pings_total",
+    "백그라운드 생존 확인 결과 (alive: 정상, dead: 무효화)",
+    ["result"],
+    registry=REGISTRY,
+)
+
+SCHEMA_CACHE_EVENTS = Counter(
+    "hr_schema_cache_events_total",
+    "스키마 캐시 조회 결과 (hit: TTL 이내, validated: 지문 동일, reload: 전체 재조회)",
+    ["event"],
+    registry=REGISTRY,
+)
+
+SCHEMA_LINK_TOKENS = Histogram(
+    "hr_schema_link_tokens",
+    "SQL 프롬프트 스키마 토큰 수 (full: 전체 스키마, linked: 스키마 링킹 후)",
+    ["schema"],
+    buckets=(100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000),
+    registry=REGISTRY,
+)
+
+SQL_CACHE_EVENTS = Counter(
+    "hr_sql_cache_events_total",
+    "NL → SQL 캐시 (hit, miss, store, invalidate: 캐시된 SQL 실패, evict_schema: 스키마 변경으로 삭제)",
+    ["event"],
+    registry=REGISTRY,
+)
+
+SQL_VALIDATIONS = Counter(
+    "hr_sql_validations_total",
+    "실행 전 SQL 로컬 검증 결과 (ok 또는 실패 코드: NOT_SELECT, UNKNOWN_TABLE, UNKNOWN_COLUMN, INVALID_ENUM ...)",
+    ["result"],
+    registry=REGISTRY,
+)
+
+SQL_REPAIRS = Counter(
+    "hr_sql_repairs_total",
+    "규칙 기반 SQL 수정 시도 (rule: unknown_column/unknown_table/ambiguous_column/enum_value, result: repaired/failed)",
+    ["rule", "result"],
+    registry=REGISTRY,
+)
+
+SQL_COST_CHECKS = Counter(
+    "hr_sql_cost_checks_total",
+    "실행 전 EXPLAIN 비용 검사 결과 (ok, rejected, error)",
+    ["result"],
+    registry=REGISTRY,
+)
+
+RESULT_CACHE_EVENTS = Counter(
+    "hr_result_cache_events_total",
+    "SQL 결과 캐시 (hit, stale: 캐시 반환 + 백그라운드 재실행, miss, invalidated: 테이블 변경, refresh, refresh_error)",
+    ["event"],
+    registry=REGISTRY,
+)
+
+# ===== 동시성 제어 =====
+SINGLE_FLIGHT_EXECUTIONS = Counter(
+    "hr_single_flight_executions_total",
+    "single-flight에서 실제 실행된 질의 수",
+    registry=REGISTRY,
+)
+
+SINGLE_FLIGHT_COALESCED = Counter(
+    "hr_single_flight_coalesced_total",
+    "진행 중인 동일 질문에 합류한 요청 수",
+    registry=REGISTRY,
+)
+
+BULKHEAD_ACTIVE = Gauge(
+    "hr_bulkhead_active",
+    "bulkhead 실행 중 요청 수",
+    ["bulkhead"],
+    registry=REGISTRY,
+)
+
+BULKHEAD_QUEUE_DEPTH = Gauge(
+    "hr_bulkhead_queue_depth",
+    "bulkhead 대기열 깊이",
+    ["bulkhead"],
+    registry=REGISTRY,
+)
+
+BULKHEAD_WAIT = Histogram(
+    "hr_bulkhead_wait_seconds",
+    "bulkhead 대기열 대기 시간",
+    ["bulkhead"],
+    buckets=_FAST_BUCKETS + _SLOW_BUCKETS[5:],
+    registry=REGISTRY,
+)
+
+BULKHEAD_REJECTED = Counter(
+    "hr_bulkhead_rejected_total",
+    "bulkhead에서 거절된 요청 수",
+    ["bulkhead", "reason"],
+    registry=REGISTRY,
+)
+
+# sql_generate_2 → sql_generate (시도 번호는 라벨 카디널리티에서 제외)
+_ATTEMPT_SUFFIX = re.compile(r"_\d+$")
+
+
+def observe_stage(stage: str, seconds: float):
+    """단계 소요 시간 기록 (timed()에서 호출)"""
+    STAGE_LATENCY.labels(stage=_ATTEMPT_SUFFIX.sub("", stage)).observe(seconds)
+
+
+def render_latest() -> bytes:
+    """Prometheus text exposition format"""
+    return generate_latest(REGISTRY)
+
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+
+class LLMMetricsCallback(BaseCallbackHandler):
+    """
+    LLM 호출 수/지연 시간 수집 콜백
+
+    create_chat_model()이 생성하는 모든 Chat 모델에 연결됩니다.
+    """
+
+    run_inline = True  # async 호출에서도 executor 없이 바로 실행
+
+    def __init__(self, provider: str, model: str):
+        self.provider = provider
+        self.model = model
+        self._started: Dict[UUID, float] = {}
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[Any], *,
+                            run_id: UUID, **kwargs: Any) -> None:
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "success")
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "error")
+
+    def _finish(self, run_id: UUID, status: str):
+        started: Optional[float] = self._started.pop(run_id, None)
+        LLM_REQUESTS.labels(provider=self.provider, model=self.model, status=status).inc()
+        if started is not None:
+            LLM_LATENCY.labels(provider=self.provider, model=self.model).observe(
+                time.perf_counter() - started
+            )
@@ -0,0 +1,86 @@
+"""
+Stage Timing
+요청 단위 단계별 지연시간 수집 (contextvars 기반)
+
+사용법:
+    timings = start_timing()          # 요청 시작 시 (엔드포인트)
+
+    with timed("router_llm"):         # 측정할 구간 (Agent 내부)
+        agent_type = chain.invoke(...)
+
+    timings.as_dict()                 # {"router_llm": 812.3, ...} (ms)
+    timings.server_timing()           # "router_llm;dur=812.3, ..."
+
+- 수집기가 없는 컨텍스트(스크립트, 테스트 등)에서 timed()는 측정만 하고 버림
+- asyncio Task / asyncio.to_thread / QueryExecutor 워커로 컨텍스트가 전파됨
+- 다른 컨텍스트에서 수집한 구간은 extend()로 옮겨 담음 (single-flight 합류 요청 등)
+- 모든 구간은 Prometheus hr_stage_duration_seconds 히스토그램에도 기록됨
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from core.observability.metrics import observe_stage
+
+_current: ContextVar[Optional["StageTimings"]] = ContextVar("stage_timings", default=None)
+
+
+class StageTimings:
+    """요청 1건의 단계별 소요시간"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: List[Tuple[str, float]] = []
+
+    def add(self, stage: str, seconds: float):
+        """단계 소요시간 기록 (같은 이름이 여러 번 기록되면 합산)"""
+        with self._lock:
+            self._stages.append((stage, seconds))
+
+    def extend(self, other: "StageTimings"):
+        """다른 수집기의 구간을 이어서 기록"""
+        with other._lock:
+            stages = list(other._stages)
+        with self._lock:
+            self._stages.extend(stages)
+
+    def as_dict(self) -> Dict[str, float]:
+        """단계명 → 소요시간(ms), 기록 순서 유지"""
+        result: Dict[str, float] = {}
+        with self._lock:
+            for stage, seconds in self._stages:
+                result[stage] = result.get(stage, 0.0) + seconds * 1000
+        return {stage: round(ms, 1) for stage, ms in result.items()}
+
+    def server_timing(self) -> str:
+        """표준 Server-Timing 헤더 값"""
+        return ", ".join(f"{stage};dur={ms}" for stage, ms in self.as_dict().items())
+
+
+def start_timing() -> StageTimings:
+    """현재 컨텍스트에 새 수집기 설정 후 반환"""
+    timings = StageTimings()
+    _current.set(timings)
+    return timings
+
+
+def current_timing() -> Optional[StageTimings]:
+    """현재 컨텍스트의 수집기 (없으면 None)"""
+    return _current.get()
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """구간 소요시간을 현재 수집기 + 메트릭에 기록 (sync/async 코드 모두 사용 가능)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        observe_stage(stage, elapsed)
+        timings = _current.get()
+        if timings is not None:
+            timings.add(stage, elapsed)
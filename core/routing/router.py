@@ -5,6 +5,9 @@ Router - 질문 의도 분류기
     router = Router(model="gpt-4o-mini")
     agent_type = router.route("직원 수는?")
     # agent_type = "SQL_AGENT" 또는 "RAG_AGENT"
+
+    # 비동기
+    agent_type = await router.aroute("직원 수는?")
 """
 
 from typing import Optional
@@ -15,6 +18,7 @@ from langchain_core.output_parsers import StrOutputParser
 from core.types.agent_types import AgentType
 from core.types.errors import RouterError
 from core.llm.factory import create_chat_model
+from core.observability.timing import timed
 
 
 class Router:
@@ -48,7 +52,7 @@ class Router:
     def _init_chain(self):
         """분류 체인 초기화"""
         # LLM Factory 패턴 사용
-        llm = create_chat_model(
+        self.llm = create_chat_model(
             provider=self.provider,
             model=self.model,
             temperature=self.temperature,
@@ -81,7 +85,18 @@ SQL_AGENT 또는 RAG_AGENT 중 하나만 출력. 설명 금지.
         prompt = ChatPromptTemplate.from_template(template)
 
         # 체인 (LCEL)
-        self.chain = prompt | llm | StrOutputParser()
+        self.chain = prompt | self.llm | StrOutputParser()
+
+    def _parse_agent_type(self, result: str) -> AgentType:
+        """LLM 출력 → AgentType (알 수 없는 값이면 RAG_AGENT)"""
+        agent_type = result.strip()
+
+        # 검증
+        if agent_type not in ["SQL_AGENT", "RAG_AGENT"]:
+            # 기본값: RAG_AGENT (안전한 선택)
+            return "RAG_AGENT"
+
+        return agent_type
 
     def route(self, question: str) -> AgentType:
         """
@@ -94,16 +109,28 @@ SQL_AGENT 또는 RAG_AGENT 중 하나만 출력. 설명 금지.
             "SQL_AGENT" 또는 "RAG_AGENT"
         """
         try:
-            result = self.chain.invoke({"question": question})
-            agent_type = result.strip()
+            with timed("router_llm"):
+                result = self.chain.invoke({"question": question})
+            return self._parse_agent_type(result)
 
-            # 검증
-            if agent_type not in ["SQL_AGENT", "RAG_AGENT"]:
-                # 기본값: RAG_AGENT (안전한 선택)
-                return "RAG_AGENT"
+        except Exception as e:
+            # 오류 시 기본값
+            raise RouterError(f"라우팅 오류: {e}")
 
-            return agent_type
+    async def aroute(self, question: str) -> AgentType:
+        """
+        route()의 비동기 버전
+
+        Args:
+            question: 사용자 질문
+
+        Returns:
+            "SQL_AGENT" 또는 "RAG_AGENT"
+        """
+        try:
+            with timed("router_llm"):
+                result = await self.chain.ainvoke({"question": question})
+            return self._parse_agent_type(result)
 
         except Exception as e:
-            # 오류 시 기본값
             raise RouterError(f"라우팅 오류: {e}")
@@ -0,0 +1,22 @@
+"""
+SQL Module
+Text-to-SQL 보조 기능 (스키마 링킹, NL → SQL 캐시, 실행 전 검증, 규칙 기반 수정, few-shot 예시 검색)
+"""
+
+from core.sql.schema_linking import SchemaLinker, LinkResult
+from core.sql.sql_cache import SQLCache
+from core.sql.validator import SQLValidator, SQLValidationResult
+from core.sql.repair import SQLRepairer, RepairResult
+from core.sql.few_shot import FewShotRetriever, FewShotMatch
+
+__all__ = [
+    "SchemaLinker",
+    "LinkResult",
+    "SQLCache",
+    "SQLValidator",
+    "SQLValidationResult",
+    "SQLRepairer",
+    "RepairResult",
+    "FewShotRetriever",
+    "FewShotMatch",
+]
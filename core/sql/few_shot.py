@@ -0,0 +1,217 @@
+"""
+Few-shot Retriever
+질문과 비슷한 (질문, SQL) 예시를 골라 SQL 생성 프롬프트에 포함
+
+사용법:
+    retriever = FewShotRetriever.from_file("data/finetuning/sql_train.json", k=3)
+    matches = retriever.search("개발팀 평균 연봉은?")
+    prompt_block = render_examples(matches)
+
+    # 실행에 성공한 SQL로 인덱스 확장 (메모리)
+    retriever.add("마케팅팀 평균 연봉은?", "SELECT AVG(...) ...")
+
+유사도 (LLM/임베딩 호출 없음):
+    - 정규화된 질문의 문자 bigram(공백 제외) + 단어 토큰
+    - TF-IDF 가중 코사인 유사도, 역색인으로 공통 토큰이 있는 예시만 계산
+"""
+
+import json
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from core.utils.text import normalize_question
+
+_WHITESPACE = re.compile(r"\s+")
+
+SOURCE_DATASET = "dataset"
+SOURCE_LEARNED = "learned"
+
+
+def load_sql_examples(path: Union[str, Path]) -> List[Tuple[str, str]]:
+    """sql_train.json (prepare_dataset.py 형식) → [(질문, SQL)]"""
+    pairs = []
+    for item in json.loads(Path(path).read_text(encoding="utf-8")):
+        turns = {turn["role"]: turn["content"] for turn in item["conversations"]}
+        pairs.append((turns["user"], turns["assistant"]))
+    return pairs
+
+
+def _features(question: str) -> Counter:
+    """질문 → 토큰 빈도 (문자 bigram + 단어)"""
+    text = normalize_question(question)
+    compact = _WHITESPACE.sub("", text)
+    grams = [compact[i:i + 2] for i in range(len(compact) - 1)] or [compact]
+    return Counter(grams + [f"w:{word}" for word in text.split()])
+
+
+@dataclass(frozen=True)
+class FewShotMatch:
+    """검색된 예시"""
+
+    question: str
+    sql: str
+    score: float
+    source: str  # dataset | learned
+
+
+@dataclass(frozen=True)
+class _Example:
+    question: str
+    sql: str
+    source: str
+    features: Counter
+
+
+def render_examples(matches: List[FewShotMatch]) -> str:
+    """프롬프트용 예시 블록 (예시가 없으면 빈 문자열)"""
+    if not matches:
+        return ""
+    lines = ["=== EXAMPLES START (비슷한 질문의 검증된 SQL, 스키마 기준으로 참고) ==="]
+    for match in matches:
+        lines += [f"질문: {match.question}", f"SQL: {match.sql.strip().rstrip(';')};", ""]
+    lines[-1] = "=== EXAMPLES END ==="
+    return "\n".join(lines)
+
+
+class FewShotRetriever:
+    """
+    메모리 내 (질문, SQL) 예시 인덱스
+
+    - 데이터셋 예시는 고정, 운영 중 추가된 예시는 max_learned까지 (오래된 것부터 삭제)
+    - 같은 정규화 질문은 1개만 유지 (데이터셋 예시는 덮어쓰지 않음)
+    - 스레드 간 공유: lock
+    """
+
+    def __init__(
+        self,
+        examples: Iterable[Tuple[str, str]] = (),
+        k: int = 3,
+        min_score: float = 0.15,
+        max_learned: int = 1000,
+    ):
+        """
+        Args:
+            examples: 고정 예시 [(질문, SQL)]
+            k: 기본 반환 개수
+            min_score: 이보다 유사도가 낮은 예시는 제외 (0~1)
+            max_learned: 운영 중 추가되는 예시 최대 개수
+        """
+        self.k = k
+        self.min_score = min_score
+        self.max_learned = max_learned
+
+        self._lock = threading.Lock()
+        self._examples: Dict[str, _Example] = {}
+        self._learned: "OrderedDict[str, None]" = OrderedDict()
+        self._postings: Dict[str, Set[str]] = {}
+
+        for question, sql in examples:
+            self._insert(question, sql, SOURCE_DATASET)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], **kwargs) -> "FewShotRetriever":
+        """sql_train.json에서 고정 예시 로드"""
+        return cls(load_sql_examples(path), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._examples)
+
+    def search(self, question: str, k: Optional[int] = None) -> List[FewShotMatch]:
+        """
+        유사한 예시 top-k
+
+        Args:
+            question: 사용자 질문
+            k: 반환 개수 (None이면 기본값)
+
+        Returns:
+            유사도 내림차순 FewShotMatch 목록 (min_score 미만 제외)
+        """
+        query = _features(question)
+        with self._lock:
+            candidates = set().union(*(self._postings.get(token, ()) for token in query))
+            if not candidates:
+                return []
+
+            idf = self._idf(query)
+            query_norm = math.sqrt(sum((tf * idf[t]) ** 2 for t, tf in query.items()))
+            scored = []
+            for key in candidates:
+                example = self._examples[key]
+                dot = sum(
+                    tf * example.features[t] * idf[t] ** 2 for t, tf in query.items() if t in example.features
+                )
+                norm = math.sqrt(sum((tf * self._token_idf(t)) ** 2 for t, tf in example.features.items()))
+                score = dot / (query_norm * norm) if norm and query_norm else 0.0
+                if score >= self.min_score:
+                    scored.append((score, example))
+
+        scored.sort(key=lambda item: (-item[0], item[1].question))
+        return [
+            FewShotMatch(example.question, example.sql, round(score, 4), example.source)
+            for score, example in scored[: k or self.k]
+        ]
+
+    def add(self, question: str, sql: str) -> bool:
+        """
+        실행에 성공한 (질문, SQL) 추가
+
+        Returns:
+            추가/갱신 여부 (같은 질문의 데이터셋 예시가 있으면 False)
+        """
+        key = normalize_question(question)
+        with self._lock:
+            existing = self._examples.get(key)
+            if existing is not None and existing.source == SOURCE_DATASET:
+                return False
+            self._remove(key)
+            self._insert(question, sql, SOURCE_LEARNED)
+            while len(self._learned) > self.max_learned:
+                self._remove(next(iter(self._learned)))
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "examples": len(self._examples),
+                "learned": len(self._learned),
+                "tokens": len(self._postings),
+            }
+
+    # --------------------------
+    # Index (lock 안에서 호출)
+    # --------------------------
+    def _insert(self, question: str, sql: str, source: str):
+        key = normalize_question(question)
+        if key in self._examples:
+            return
+        example = _Example(question, sql, source, _features(question))
+        self._examples[key] = example
+        if source == SOURCE_LEARNED:
+            self._learned[key] = None
+        for token in example.features:
+            self._postings.setdefault(token, set()).add(key)
+
+    def _remove(self, key: str):
+        example = self._examples.pop(key, None)
+        if example is None:
+            return
+        self._learned.pop(key, None)
+        for token in example.features:
+            keys = self._postings.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[token]
+
+    def _token_idf(self, token: str) -> float:
+        df = len(self._postings.get(token, ()))
+        return math.log((len(self._examples) + 1) / (df + 1)) + 1
+
+    def _idf(self, query: Counter) -> Dict[str, float]:
+        return {token: self._token_idf(token) for token in query}
@@ -0,0 +1,434 @@
+"""
+SQL Repair
+흔한 SQL 오류를 LLM 호출 없이 규칙 기반으로 수정
+
+사용법:
+    repairer = SQLRepairer()
+    repair = repairer.repair(sql, error, snapshot)
+    if repair:
+        repair.sql       # 수정된 SQL
+        repair.fixes     # ["unknown_column: salary → base_salary"]
+
+처리하는 오류 (MySQL 오류 번호로 판단, SQLValidator도 같은 번호/형식 사용):
+    - 1054 Unknown column 'x'          → 오류가 난 테이블의 컬럼 중 별칭 사전/이름 유사도로 교체
+    - 1146 Table 'db.x' doesn't exist  → 단복수/유사도로 테이블 교체
+    - 1052 Column 'x' ... is ambiguous → join 키 / GROUP BY로 테이블이 정해지면 한정자 추가
+    - Invalid value 'x' for enum column c (SQLValidator) → 대소문자/한국어 사전/유사도로 ENUM 값 교체
+
+오류 번호로 규칙을 고르고 메시지에서는 첫 번째 인용 식별자만 읽으므로
+서버 메시지 언어(lc_messages)와 문구 차이에 영향받지 않습니다.
+
+후보가 하나로 정해지지 않으면 수정하지 않고 LLM 보정에 맡깁니다.
+"""
+
+import difflib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
+
+from core.database.schema import SchemaSnapshot, enum_values
+from core.observability.metrics import SQL_REPAIRS
+
+# LLM이 자주 쓰는 컬럼명 → 실제 컬럼명 (스코프 테이블에 있는 경우만 적용)
+DEFAULT_COLUMN_ALIASES: Dict[str, List[str]] = {
+    "salary": ["base_salary"],
+    "base_pay": ["base_salary"],
+    "hire_date": ["join_date"],
+    "joined_at": ["join_date"],
+    "start_date": ["join_date"],
+    "employee_id": ["emp_id"],
+    "employee_name": ["name"],
+    "emp_name": ["name"],
+    "department_id": ["dept_id"],
+    "department_name": ["name"],
+    "dept_name": ["name"],
+    "department": ["name"],
+    "rank": ["position"],
+    "title": ["position"],
+    "job_title": ["position"],
+    "attendance_date": ["date"],
+    "work_date": ["date"],
+    "pay_date": ["payment_date"],
+    "evaluation_score": ["score"],
+    "rating": ["score"],
+}
+
+# 한국어/동의어 ENUM 값 → 실제 ENUM 값 (해당 컬럼 허용 값에 있는 경우만 적용)
+DEFAULT_VALUE_ALIASES: Dict[str, List[str]] = {
+    "재직": ["ACTIVE"],
+    "재직중": ["ACTIVE"],
+    "근무": ["ACTIVE"],
+    "휴직": ["LEAVE"],
+    "퇴사": ["RESIGNED"],
+    "퇴직": ["RESIGNED"],
+    "출근": ["PRESENT"],
+    "정상": ["PRESENT"],
+    "지각": ["LATE"],
+    "결근": ["ABSENT"],
+    "휴가": ["VACATION"],
+    "연차": ["VACATION"],
+}
+
+_SIMILARITY_CUTOFF = 0.75
+
+# MySQL 오류 번호 → 규칙
+ERROR_RULES = {1054: "unknown_column", 1146: "unknown_table", 1052: "ambiguous_column"}
+
+# pymysql 오류 문자열 (SQLAlchemy 예외 문자열 포함) / SQLValidator 메시지: (1054, "Unknown column 'x' ...")
+_MYSQL_ERROR = re.compile(r"\((\d+), ([\"'])(.*?)\2\)")
+_QUOTED = re.compile(r"'([^']+)'")
+# SQLValidator 전용 (MySQL은 ENUM 비교 값 오류를 내지 않음)
+_INVALID_ENUM = re.compile(r"Invalid value '((?:[^'\\]|\\.)*)' for enum column (\w+)")
+
+
+@dataclass
+class RepairResult:
+    """규칙 기반 수정 결과"""
+
+    sql: str
+    fixes: List[str] = field(default_factory=list)  # "rule: before → after"
+
+
+class SQLRepairer:
+    """
+    규칙 기반 SQL 수정기
+
+    - 오류 메시지에서 문제 식별자/값을 뽑아 스냅샷 기준으로 후보를 찾음
+    - SQL은 sqlglot AST로 수정 (문자열 리터럴/다른 컬럼은 건드리지 않음)
+    - 오류 메시지의 모든 항목을 고쳤을 때만 결과 반환
+    """
+
+    def __init__(
+        self,
+        column_aliases: Optional[Mapping[str, List[str]]] = None,
+        value_aliases: Optional[Mapping[str, List[str]]] = None,
+        dialect: str = "mysql",
+    ):
+        """
+        Args:
+            column_aliases: 잘못된 컬럼명 → 후보 컬럼명 (None이면 HR 기본 사전)
+            value_aliases: 잘못된 ENUM 값 → 후보 값 (None이면 HR 기본 사전)
+            dialect: sqlglot 방언
+        """
+        self.column_aliases = DEFAULT_COLUMN_ALIASES if column_aliases is None else column_aliases
+        self.value_aliases = DEFAULT_VALUE_ALIASES if value_aliases is None else value_aliases
+        self.dialect = dialect
+
+    def repair(self, sql: str, error: str, snapshot: SchemaSnapshot) -> Optional[RepairResult]:
+        """
+        오류 메시지 기반 SQL 수정
+
+        Args:
+            sql: 실패한 SQL
+            error: MySQL 오류 또는 SQLValidator 오류 메시지
+            snapshot: 스키마 스냅샷
+
+        Returns:
+            RepairResult (수정할 수 없으면 None)
+        """
+        issues = self._parse_error(error)
+        if not issues:
+            return None
+
+        try:
+            tree = sqlglot.parse_one(sql, read=self.dialect)
+        except ParseError:
+            return None
+
+        fixes = []
+        for rule, target, extra in issues:
+            fix = getattr(self, f"_fix_{rule}")(tree, target, extra, snapshot)
+            SQL_REPAIRS.labels(rule=rule, result="repaired" if fix else "failed").inc()
+            if fix is None:
+                return None
+            fixes.append(f"{rule}: {fix}")
+
+        return RepairResult(sql=tree.sql(dialect=self.dialect), fixes=fixes)
+
+    # --------------------------
+    # Error Parsing
+    # --------------------------
+    def _parse_error(self, error: str) -> List[Tuple[str, str, str]]:
+        """오류 메시지 → [(rule, 대상, 부가 정보)] (중복 제거)"""
+        issues = []
+        for match in _INVALID_ENUM.finditer(error):
+            issues.append(("enum_value", match.group(1), match.group(2)))
+        for match in _MYSQL_ERROR.finditer(error):
+            rule = ERROR_RULES.get(int(match.group(1)))
+            quoted = _QUOTED.search(match.group(3))
+            if rule is None or quoted is None:
+                continue
+            target = quoted.group(1).replace("`", "")
+            if rule == "unknown_table":
+                target = target.rpartition(".")[2]  # db.table → table
+            issues.append((rule, target, ""))
+        # 테이블을 먼저 고쳐야 컬럼 후보를 찾을 수 있음
+        order = {"enum_value": 0, "unknown_table": 1, "ambiguous_column": 2, "unknown_column": 3}
+        return sorted(dict.fromkeys(issues), key=lambda issue: order[issue[0]])
+
+    # --------------------------
+    # Fixes (수정 설명 반환, 실패 시 None)
+    # --------------------------
+    def _fix_unknown_column(
+        self, tree: exp.Expression, target: str, extra: str, snapshot: SchemaSnapshot
+    ) -> Optional[str]:
+        qualifier, _, name = target.rpartition(".")
+        scope = self._scope(tree, snapshot)
+
+        # sqlglot은 모호한 컬럼도 "could not be resolved"로 보고함
+        owners = [alias for alias, table in scope.items() if name.lower() in self._columns(snapshot, table)]
+        if not qualifier and len(owners) > 1:
+            return self._fix_ambiguous_column(tree, name, "", snapshot)
+
+        if qualifier:
+            failing = scope.get(qualifier.lower())
+            if failing is None:
+                return None
+            if len(owners) == 1:
+                # 컬럼은 맞고 테이블 한정자가 틀린 경우 (e.base_salary → s.base_salary)
+                self._rewrite_columns(tree, failing, name, qualifier, name, owners[0])
+                return f"{target} → {owners[0]}.{name}"
+            tables = [failing]
+        else:
+            tables = list(dict.fromkeys(scope.values()))
+
+        candidates = {col for table in tables for col in self._columns(snapshot, table)}
+        replacement = self._pick(name.lower(), candidates, self.column_aliases)
+        if replacement is None:
+            return None
+
+        # 교체 컬럼을 가진 테이블이 오류가 난 테이블 (한정자 없으면 1개로 정해질 때만)
+        failing_tables = [table for table in tables if replacement in self._columns(snapshot, table)]
+        if len(failing_tables) != 1:
+            return None
+        if not self._rewrite_columns(tree, failing_tables[0], name, qualifier, replacement, qualifier):
+            return None
+        return f"{target} → {f'{qualifier}.' if qualifier else ''}{replacement}"
+
+    def _fix_unknown_table(
+        self, tree: exp.Expression, target: str, extra: str, snapshot: SchemaSnapshot
+    ) -> Optional[str]:
+        names = {table.name.lower(): table.name for table in snapshot.tables}
+        bad = target.lower()
+        plural = [n for n in (bad + "s", bad + "es", bad[:-1] + "ies", bad.rstrip("s")) if n in names]
+        if len(set(plural)) == 1:
+            replacement = names[plural[0]]
+        else:
+            close = difflib.get_close_matches(bad, names, n=2, cutoff=_SIMILARITY_CUTOFF)
+            if len(close) != 1:
+                return None
+            replacement = names[close[0]]
+
+        for table in tree.find_all(exp.Table):
+            if table.name.lower() == bad:
+                table.set("this", exp.to_identifier(replacement))
+        # 별칭 없이 테이블명으로 한정한 컬럼도 함께 변경
+        for column in tree.find_all(exp.Column):
+            if column.table.lower() == bad:
+                column.set("table", exp.to_identifier(replacement))
+        return f"{target} → {replacement}"
+
+    def _fix_ambiguous_column(
+        self, tree: exp.Expression, target: str, extra: str, snapshot: SchemaSnapshot
+    ) -> Optional[str]:
+        """
+        한정자 없는 컬럼에 테이블이 정해지는 경우만 한정자 추가
+
+        - join 키(a.x = b.x)에 나온 컬럼: 값이 같으므로 FROM 순서상 첫 테이블
+        - join 조건 한쪽만 한정(x = d.x): 반대쪽 테이블 (d.x = d.x가 되지 않도록)
+        - GROUP BY에 한정자와 함께 나온 컬럼(SELECT x ... GROUP BY d.x): 그 테이블
+        """
+        name = target.rpartition(".")[2].lower()
+        scope = self._scope(tree, snapshot)
+        owners = [alias for alias, table in scope.items() if name in self._columns(snapshot, table)]
+        if len(owners) < 2:
+            return None
+
+        changed = []
+        for column in list(tree.find_all(exp.Column)):
+            if column.name.lower() != name or column.table or self._refers_to_alias(column):
+                continue
+            alias = self._owner_from_context(column, owners)
+            if alias is None:
+                return None
+            column.set("table", exp.to_identifier(alias))
+            changed.append(alias)
+        if not changed:
+            return None
+        return "; ".join(f"{name} → {alias}.{name}" for alias in dict.fromkeys(changed))
+
+    def _owner_from_context(self, column: exp.Column, owners: List[str]) -> Optional[str]:
+        """한정자 없는 컬럼의 테이블 별칭 (join 조건 / GROUP BY로 정해지지 않으면 None)"""
+        name = column.name.lower()
+        parent = column.parent
+        if isinstance(parent, exp.EQ):
+            other = parent.expression if parent.this is column else parent.this
+            if isinstance(other, exp.Column) and other.name.lower() == name and other.table:
+                rest = [alias for alias in owners if alias != other.table.lower()]
+                return rest[0] if len(rest) == 1 else None
+
+        select = column.find_ancestor(exp.Select)
+        group = select.args.get("group") if select is not None else None
+        if group is not None:
+            grouped = {
+                c.table.lower()
+                for c in group.find_all(exp.Column)
+                if c.name.lower() == name and c.table.lower() in owners
+            }
+            if len(grouped) == 1:
+                return grouped.pop()
+
+        join_keys = {
+            frozenset({eq.this.table.lower(), eq.expression.table.lower()})
+            for eq in column.root().find_all(exp.EQ)
+            if isinstance(eq.this, exp.Column)
+            and isinstance(eq.expression, exp.Column)
+            and eq.this.name.lower() == name
+            and eq.expression.name.lower() == name
+        }
+        if any(frozenset({a, b}) in join_keys for a in owners for b in owners if a != b):
+            return owners[0]
+        return None
+
+    def _fix_enum_value(
+        self, tree: exp.Expression, target: str, column_name: str, snapshot: SchemaSnapshot
+    ) -> Optional[str]:
+        scope = self._scope(tree, snapshot)
+        allowed = set()
+        for table in snapshot.tables:
+            if table.name.lower() in scope.values():
+                for column in table.columns:
+                    if column.name.lower() == column_name.lower() and column.data_type == "enum":
+                        allowed.update(enum_values(column.column_type))
+        if not allowed:
+            return None
+
+        replacement = self._pick(target, allowed, self.value_aliases, case_insensitive=True)
+        if replacement is None:
+            return None
+
+        changed = False
+        for node in tree.find_all(exp.EQ, exp.NEQ, exp.In):
+            operands = node.expressions if isinstance(node, exp.In) else [node.this, node.expression]
+            columns = [node.this] if isinstance(node, exp.In) else operands
+            if not any(isinstance(c, exp.Column) and c.name.lower() == column_name.lower() for c in columns):
+                continue
+            for literal in operands:
+                if isinstance(literal, exp.Literal) and literal.is_string and literal.this == target:
+                    literal.replace(exp.Literal.string(replacement))
+                    changed = True
+        return f"'{target}' → '{replacement}'" if changed else None
+
+    # --------------------------
+    # Helpers
+    # --------------------------
+    def _scope(self, tree: exp.Expression, snapshot: SchemaSnapshot) -> Dict[str, str]:
+        """FROM/JOIN 별칭 → 실제 테이블명 (스냅샷에 있는 테이블만, FROM 순서 유지)"""
+        known = {table.name.lower() for table in snapshot.tables}
+        return {
+            table.alias_or_name.lower(): table.name.lower()
+            for table in tree.find_all(exp.Table)
+            if table.name.lower() in known
+        }
+
+    def _columns(self, snapshot: SchemaSnapshot, table_name: str) -> List[str]:
+        for table in snapshot.tables:
+            if table.name.lower() == table_name:
+                return [column.name.lower() for column in table.columns]
+        return []
+
+    def _pick(
+        self,
+        bad: str,
+        candidates,
+        aliases: Mapping[str, List[str]],
+        case_insensitive: bool = False,
+    ) -> Optional[str]:
+        """교체 후보 1개 선택 (대소문자 → 사전 → 유사도 순, 애매하면 None)"""
+        by_key = {(c.lower() if case_insensitive else c): c for c in candidates}
+        key = bad.lower() if case_insensitive else bad
+
+        if case_insensitive and key in by_key:
+            return by_key[key]
+
+        aliased = [c for c in aliases.get(bad, aliases.get(bad.lower(), [])) if c in candidates]
+        if len(aliased) == 1:
+            return aliased[0]
+
+        close = difflib.get_close_matches(key, list(by_key), n=2, cutoff=_SIMILARITY_CUTOFF)
+        if len(close) == 1 or (
+            len(close) == 2
+            and difflib.SequenceMatcher(None, key, close[0]).ratio()
+            > difflib.SequenceMatcher(None, key, close[1]).ratio()
+        ):
+            return by_key[close[0]]
+        return None
+
+    def _rewrite_columns(
+        self,
+        tree: exp.Expression,
+        table: str,
+        name: str,
+        qualifier: str,
+        new_name: str,
+        new_qualifier: str,
+    ) -> bool:
+        """
+        오류가 난 테이블(table)의 name 컬럼 참조만 교체 (교체한 참조가 있으면 True)
+
+        - 한정자가 있으면: 같은 한정자이고 그 한정자가 (가장 가까운 SELECT부터) table을 가리키는 참조만
+        - 한정자가 없으면: 가장 가까운 SELECT의 FROM/JOIN에 table이 있는 참조만
+          (ORDER BY/GROUP BY/HAVING의 SELECT 별칭 참조와 다른 테이블 컬럼은 그대로)
+        """
+        changed = False
+        for column in list(tree.find_all(exp.Column)):
+            if column.name.lower() != name.lower():
+                continue
+            if qualifier:
+                if column.table.lower() != qualifier.lower() or self._resolve(column) != table:
+                    continue
+            elif column.table or self._refers_to_alias(column) or table not in self._select_tables(column):
+                continue
+            column.set("this", exp.to_identifier(new_name))
+            if new_qualifier:
+                column.set("table", exp.to_identifier(new_qualifier))
+            changed = True
+        return changed
+
+    def _resolve(self, column: exp.Column) -> Optional[str]:
+        """컬럼 한정자 → 실제 테이블명 (가장 가까운 SELECT부터 바깥으로, 상관 서브쿼리 포함)"""
+        qualifier = column.table.lower()
+        select = column.find_ancestor(exp.Select)
+        while select is not None:
+            for table in self._from_tables(select):
+                if table.alias_or_name.lower() == qualifier:
+                    return table.name.lower()
+            select = select.find_ancestor(exp.Select)
+        return None
+
+    def _select_tables(self, column: exp.Column) -> List[str]:
+        """컬럼이 속한 가장 가까운 SELECT의 FROM/JOIN 테이블명"""
+        select = column.find_ancestor(exp.Select)
+        return [table.name.lower() for table in self._from_tables(select)] if select is not None else []
+
+    @staticmethod
+    def _from_tables(select: exp.Select) -> List[exp.Table]:
+        # sqlglot 최신 버전은 "from_", 이전 버전은 "from" 키에 FROM 절 저장
+        from_ = select.args.get("from_") or select.args.get("from")
+        sources = [from_, *(select.args.get("joins") or [])]
+        return [source.this for source in sources if source is not None and isinstance(source.this, exp.Table)]
+
+    @staticmethod
+    def _refers_to_alias(column: exp.Column) -> bool:
+        """ORDER BY/GROUP BY/HAVING에서 같은 SELECT의 출력 별칭을 가리키는 참조인지"""
+        if column.table or column.find_ancestor(exp.Order, exp.Group, exp.Having) is None:
+            return False
+        select = column.find_ancestor(exp.Select)
+        if select is None:
+            return False
+        aliases = {e.alias.lower() for e in select.expressions if isinstance(e, exp.Alias)}
+        return column.name.lower() in aliases
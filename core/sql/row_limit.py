@@ -0,0 +1,69 @@
+"""
+Row Limit
+생성된 SELECT에 LIMIT을 자동으로 붙여 결과 행 수 제한
+
+사용법:
+    inject_limit("SELECT * FROM attendance", 1001)
+    # "SELECT * FROM attendance LIMIT 1001"
+
+    inject_limit("SELECT COUNT(*) FROM attendance", 1001)
+    # 그대로 (GROUP BY 없는 집계는 1행)
+
+- 가장 바깥 쿼리에만 적용 (서브쿼리/CTE는 그대로)
+- 기존 LIMIT이 더 작으면 그대로, 더 크면 limit으로 축소 (OFFSET 유지)
+- 바꿀 필요가 없거나 파싱할 수 없으면 원본 문자열을 그대로 반환
+"""
+
+from typing import Optional
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
+
+
+def inject_limit(sql: str, limit: int, dialect: str = "mysql") -> str:
+    """
+    결과 행 수 제한 LIMIT 주입
+
+    Args:
+        sql: SELECT 문
+        limit: 최대 행 수
+        dialect: sqlglot 방언
+
+    Returns:
+        LIMIT이 적용된 SQL (변경이 없으면 원본)
+    """
+    try:
+        tree = sqlglot.parse_one(sql, read=dialect)
+    except ParseError:
+        return sql
+
+    if not isinstance(tree, exp.Query) or _is_single_row(tree):
+        return sql
+
+    current = _current_limit(tree)
+    if current is not None and current <= limit:
+        return sql
+
+    return tree.limit(limit, copy=False).sql(dialect=dialect)
+
+
+def _is_single_row(tree: exp.Query) -> bool:
+    """GROUP BY 없는 집계 SELECT (항상 1행)"""
+    return (
+        isinstance(tree, exp.Select)
+        and not tree.args.get("group")
+        and bool(tree.expressions)
+        and all(expression.find(exp.AggFunc) for expression in tree.expressions)
+    )
+
+
+def _current_limit(tree: exp.Query) -> Optional[int]:
+    """바깥 쿼리의 LIMIT 값 (없거나 숫자가 아니면 None)"""
+    limit = tree.args.get("limit")
+    if limit is None:
+        return None
+    value = limit.expression
+    if isinstance(value, exp.Literal) and value.is_int:
+        return int(value.this)
+    return None
@@ -0,0 +1,310 @@
+"""
+Schema Linking
+질문과 관련된 테이블/컬럼만 골라 SQL 프롬프트용 스키마를 축소
+
+사용법:
+    linker = SchemaLinker()
+    link = linker.link("개발팀 직원들 평균 연봉은?", snapshot, full_schema_text)
+    link.schema        # 축소된 스키마 문자열 (departments, employees, salaries)
+    link.report()      # {"tables": [...], "full_tokens": 820, "linked_tokens": 410, ...}
+
+매칭 방식 (모두 lexical, LLM/임베딩 호출 없음):
+    1. 테이블/컬럼 이름, 컬럼 COMMENT
+    2. 한국어 도메인 키워드 사전 (직원 → employees, 연봉 → salaries ...)
+    3. ENUM 값, 샘플 데이터 값 (예: '개발' → departments.name)
+    → 매칭된 테이블 + 참조하는 부모 테이블 + 매칭 테이블 사이 FK join 경로 (closure)
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from itertools import combinations
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from core.database.schema import SchemaSnapshot, TableInfo, enum_values, render_table
+from core.observability.metrics import SCHEMA_LINK_TOKENS
+from core.utils.text import normalize_question
+from core.utils.tokens import count_tokens
+
+# 한국어 키워드 → "table" 또는 "table.column" (스냅샷에 없는 대상은 무시)
+DEFAULT_SYNONYMS: Dict[str, List[str]] = {
+    # employees
+    "직원": ["employees"],
+    "사원": ["employees"],
+    "인원": ["employees"],
+    "몇 명": ["employees"],
+    "이름": ["employees.name"],
+    "이메일": ["employees.email"],
+    "메일": ["employees.email"],
+    "직급": ["employees.position"],
+    "직책": ["employees.position"],
+    "입사": ["employees.join_date"],
+    "근속": ["employees.join_date"],
+    "재직": ["employees.status"],
+    "휴직": ["employees.status"],
+    "퇴사": ["employees.status"],
+    # departments
+    "부서": ["departments"],
+    "팀": ["departments"],
+    "위치": ["departments.location"],
+    "근무지": ["departments.location"],
+    # salaries
+    "급여": ["salaries"],
+    "연봉": ["salaries"],
+    "월급": ["salaries"],
+    "인건비": ["salaries"],
+    "기본급": ["salaries.base_salary"],
+    "보너스": ["salaries.bonus"],
+    "상여": ["salaries.bonus"],
+    "성과급": ["salaries.bonus"],
+    "지급": ["salaries.payment_date"],
+    # evaluations
+    "평가": ["evaluations"],
+    "고과": ["evaluations"],
+    "점수": ["evaluations.score"],
+    "점 이상": ["evaluations.score"],
+    "점 이하": ["evaluations.score"],
+    "점 미만": ["evaluations.score"],
+    "만점": ["evaluations.score"],
+    "성과자": ["evaluations.score"],
+    "피드백": ["evaluations.feedback"],
+    "분기": ["evaluations.quarter"],
+    # attendance
+    "근태": ["attendance"],
+    "출석": ["attendance"],
+    "출근": ["attendance.check_in"],
+    "퇴근": ["attendance.check_out"],
+    "지각": ["attendance.status"],
+    "결근": ["attendance.status"],
+    "휴가": ["attendance.status"],
+}
+
+# 이름 매칭에서 제외할 짧은 토큰 (id, no 등 오탐 방지)
+_MIN_NAME_LEN = 3
+# 샘플/ENUM 값 매칭 최소 길이
+_MIN_VALUE_LEN = 2
+
+# 키워드 → [(table, column or None)]
+_Index = Dict[str, List[Tuple[str, Optional[str]]]]
+
+
+@dataclass
+class LinkResult:
+    """스키마 링킹 결과"""
+
+    schema: str  # 프롬프트에 넣을 스키마 문자열
+    tables: List[str] = field(default_factory=list)  # 질문과 직접 매칭된 테이블
+    bridge_tables: List[str] = field(default_factory=list)  # FK closure로 추가된 테이블
+    columns: Dict[str, List[str]] = field(default_factory=dict)  # 매칭된 컬럼
+    full_tokens: int = 0
+    linked_tokens: int = 0
+    latency_ms: float = 0.0
+    fallback: bool = False  # 매칭 실패 → 전체 스키마 사용
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.full_tokens - self.linked_tokens
+
+    def report(self) -> Dict[str, Any]:
+        """응답 metadata/로그용 요약"""
+        return {
+            "tables": self.tables,
+            "bridge_tables": self.bridge_tables,
+            "columns": self.columns,
+            "full_tokens": self.full_tokens,
+            "linked_tokens": self.linked_tokens,
+            "saved_tokens": self.saved_tokens,
+            "latency_ms": self.latency_ms,
+            "fallback": self.fallback,
+        }
+
+
+class SchemaLinker:
+    """
+    Lexical 스키마 링커
+
+    - 스냅샷별 키워드 인덱스와 전체 스키마 토큰 수는 스냅샷이 바뀔 때만 다시 계산
+    - 직접 매칭된 테이블은 샘플 데이터 포함, join 경로로만 추가된 테이블은 컬럼만 렌더링
+    """
+
+    def __init__(
+        self,
+        synonyms: Optional[Mapping[str, Sequence[str]]] = None,
+        schema_format: str = "full",
+    ):
+        """
+        Args:
+            synonyms: 키워드 → "table" / "table.column" 목록 (None이면 HR 기본 사전)
+            schema_format: 축소 스키마 렌더링 형식 ("full" | "compact", SchemaCache와 동일하게)
+        """
+        self.synonyms = DEFAULT_SYNONYMS if synonyms is None else synonyms
+        self.schema_format = schema_format
+        # (스냅샷, 인덱스), (전체 스키마 문자열, 토큰 수) - 튜플 단위로 교체해서 스레드 간 불일치 방지
+        self._indexed: Tuple[Optional[SchemaSnapshot], _Index] = (None, {})
+        self._counted: Tuple[Optional[str], int] = (None, 0)
+
+    def link(self, question: str, snapshot: SchemaSnapshot, full_schema: str) -> LinkResult:
+        """
+        질문 → 축소된 스키마
+
+        Args:
+            question: 사용자 질문
+            snapshot: 스키마 스냅샷
+            full_schema: render_schema(snapshot) 결과 (토큰 수 비교용)
+
+        Returns:
+            LinkResult (매칭이 없으면 fallback=True, 전체 스키마)
+        """
+        started = time.perf_counter()
+        full_tokens = self._count_full(full_schema)
+
+        matches = self._match(normalize_question(question), snapshot)
+        if not matches:
+            return self._finish(LinkResult(schema=full_schema, fallback=True), full_tokens, full_tokens, started)
+
+        table_map = snapshot.table_map()
+        selected = self._closure(set(matches), table_map)
+        if len(selected) == len(snapshot.tables):
+            result = LinkResult(schema=full_schema)
+            linked_tokens = full_tokens
+        else:
+            parts = []
+            for table in snapshot.tables:
+                if table.name in matches:
+                    parts.append(render_table(table, self.schema_format))
+                elif table.name in selected:
+                    parts.append(render_table(replace(table, samples=[]), self.schema_format))
+            result = LinkResult(schema="".join(parts).strip())
+            linked_tokens = count_tokens(result.schema)
+
+        order = [table.name for table in snapshot.tables]
+        result.tables = [name for name in order if name in matches]
+        result.bridge_tables = [name for name in order if name in selected and name not in matches]
+        result.columns = {name: sorted(cols) for name, cols in matches.items() if cols}
+        return self._finish(result, full_tokens, linked_tokens, started)
+
+    # --------------------------
+    # Matching
+    # --------------------------
+    def _match(self, question: str, snapshot: SchemaSnapshot) -> Dict[str, Set[str]]:
+        """질문에 등장한 키워드 → {table: {column, ...}}"""
+        matches: Dict[str, Set[str]] = {}
+        for keyword, targets in self._get_index(snapshot).items():
+            if keyword in question:
+                for table, column in targets:
+                    cols = matches.setdefault(table, set())
+                    if column:
+                        cols.add(column)
+        return matches
+
+    def _get_index(self, snapshot: SchemaSnapshot) -> _Index:
+        indexed, index = self._indexed
+        if indexed is not snapshot:
+            index = self._build_index(snapshot)
+            self._indexed = (snapshot, index)
+        return index
+
+    def _build_index(self, snapshot: SchemaSnapshot) -> _Index:
+        """스냅샷 → 키워드 인덱스 (이름, COMMENT, 사전, ENUM/샘플 값)"""
+        index: _Index = {}
+
+        def add(keyword: Any, table: str, column: Optional[str] = None, min_len: int = _MIN_NAME_LEN):
+            if not isinstance(keyword, str):
+                return
+            keyword = normalize_question(keyword)
+            if len(keyword) >= min_len:
+                index.setdefault(keyword, []).append((table, column))
+
+        for table in snapshot.tables:
+            add(table.name, table.name)
+            add(_singular(table.name), table.name)
+
+            for column in table.columns:
+                add(column.name, table.name, column.name)
+                for part in column.name.split("_"):
+                    add(part, table.name, column.name, min_len=4)
+                for word in column.comment.split():
+                    add(word, table.name, column.name, min_len=_MIN_VALUE_LEN)
+                for value in enum_values(column.column_type):
+                    add(value, table.name, column.name, min_len=_MIN_VALUE_LEN)
+
+            for row in table.samples:
+                for column, value in zip(table.columns, row):
+                    add(value, table.name, column.name, min_len=_MIN_VALUE_LEN)
+
+        tables = snapshot.table_map()
+        for keyword, targets in self.synonyms.items():
+            for target in targets:
+                table, _, column = target.partition(".")
+                if table in tables:
+                    index.setdefault(keyword, []).append((table, column or None))
+
+        # id 등 공통 컬럼명은 모든 테이블에 걸리므로 제외
+        return {k: v for k, v in index.items() if k not in ("id", "name", "date")}
+
+    # --------------------------
+    # FK Closure
+    # --------------------------
+    def _closure(self, matched: Set[str], table_map: Dict[str, TableInfo]) -> Set[str]:
+        """매칭 테이블 + 참조 부모 테이블 + 매칭 테이블 사이 최단 join 경로"""
+        graph: Dict[str, Set[str]] = {name: set() for name in table_map}
+        for table in table_map.values():
+            for fk in table.foreign_keys:
+                if fk.ref_table in graph:
+                    graph[table.name].add(fk.ref_table)
+                    graph[fk.ref_table].add(table.name)
+
+        selected = set(matched)
+        for name in matched:
+            selected.update(fk.ref_table for fk in table_map[name].foreign_keys if fk.ref_table in table_map)
+
+        for a, b in combinations(sorted(matched), 2):
+            selected.update(_shortest_path(graph, a, b))
+
+        return selected
+
+    # --------------------------
+    # Tokens / Metrics
+    # --------------------------
+    def _count_full(self, full_schema: str) -> int:
+        counted, tokens = self._counted
+        if counted is not full_schema:
+            tokens = count_tokens(full_schema)
+            self._counted = (full_schema, tokens)
+        return tokens
+
+    def _finish(self, result: LinkResult, full_tokens: int, linked_tokens: int, started: float) -> LinkResult:
+        result.full_tokens = full_tokens
+        result.linked_tokens = linked_tokens
+        result.latency_ms = round((time.perf_counter() - started) * 1000, 2)
+        SCHEMA_LINK_TOKENS.labels(schema="full").observe(full_tokens)
+        SCHEMA_LINK_TOKENS.labels(schema="linked").observe(linked_tokens)
+        return result
+
+
+def _singular(name: str) -> str:
+    """employees → employee, salaries → salary"""
+    if name.endswith("ies"):
+        return name[:-3] + "y"
+    if name.endswith("s"):
+        return name[:-1]
+    return name
+
+
+def _shortest_path(graph: Dict[str, Set[str]], start: str, goal: str) -> List[str]:
+    """무방향 FK 그래프 BFS (경로 없으면 빈 리스트)"""
+    previous: Dict[str, Optional[str]] = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        if node == goal:
+            path = []
+            while node is not None:
+                path.append(node)
+                node = previous[node]
+            return path
+        for neighbor in graph.get(node, ()):
+            if neighbor not in previous:
+                previous[neighbor] = node
+                queue.append(neighbor)
+    return []
@@ -0,0 +1,147 @@
+"""
+NL → SQL Cache
+(정규화된 질문, 스키마 구조 해시, 모델) → 실행에 성공한 SQL 영구 캐시 (SQLite)
+
+사용법:
+    cache = SQLCache("data/cache/sql_cache.db")
+    sql = cache.get("부서별 직원 수", schema_hash, "openai:gpt-4o-mini")
+    if sql is None:
+        sql = generate(...)
+        cache.put("부서별 직원 수", schema_hash, "openai:gpt-4o-mini", sql)
+
+- 스키마 구조 해시가 바뀌면 이전 해시의 항목은 모두 삭제
+- max_entries 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from core.observability.metrics import SQL_CACHE_EVENTS
+from core.utils.text import normalize_question
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sql_cache (
+    key TEXT PRIMARY KEY,
+    question TEXT NOT NULL,
+    schema_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    sql TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+class SQLCache:
+    """
+    NL → SQL 영구 캐시
+
+    - 프로세스 재시작 후에도 유지 (SQLite 파일, ":memory:"면 메모리)
+    - 스레드 간 공유: 커넥션 1개 + lock
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:", max_entries: int = 10000):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:"면 메모리)
+            max_entries: 최대 항목 수 (초과 시 LRU 삭제)
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = str(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 checkpoint 때만 fsync
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._schema_hash: Optional[str] = None
+
+    @staticmethod
+    def make_key(question: str, schema_hash: str, model: str) -> str:
+        """캐시 키 (정규화된 질문 + 스키마 해시 + 모델)"""
+        raw = "\x1f".join([normalize_question(question), schema_hash, model])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, question: str, schema_hash: str, model: str) -> Optional[str]:
+        """캐시된 SQL (없으면 None)"""
+        key = self.make_key(question, schema_hash, model)
+        with self._lock:
+            self._evict_other_schemas(schema_hash)
+            row = self._conn.execute("SELECT sql FROM sql_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                SQL_CACHE_EVENTS.labels(event="miss").inc()
+                return None
+
+            self._conn.execute(
+                "UPDATE sql_cache SET hits = hits + 1, last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+        SQL_CACHE_EVENTS.labels(event="hit").inc()
+        return row[0]
+
+    def put(self, question: str, schema_hash: str, model: str, sql: str):
+        """실행에 성공한 SQL 저장"""
+        key = self.make_key(question, schema_hash, model)
+        now = time.time()
+        with self._lock:
+            self._evict_other_schemas(schema_hash)
+            self._conn.execute(
+                """
+                INSERT INTO sql_cache (key, question, schema_hash, model, sql, created_at, last_used)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET sql = excluded.sql, last_used = excluded.last_used
+                """,
+                (key, normalize_question(question), schema_hash, model, sql, now, now),
+            )
+            self._conn.execute(
+                """
+                DELETE FROM sql_cache WHERE key IN (
+                    SELECT key FROM sql_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self._conn.commit()
+        SQL_CACHE_EVENTS.labels(event="store").inc()
+
+    def delete(self, question: str, schema_hash: str, model: str):
+        """항목 삭제 (캐시된 SQL이 실패한 경우)"""
+        key = self.make_key(question, schema_hash, model)
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM sql_cache WHERE key = ?", (key,)).rowcount
+            self._conn.commit()
+        if deleted:
+            SQL_CACHE_EVENTS.labels(event="invalidate").inc()
+
+    def stats(self) -> Dict[str, Any]:
+        """항목 수 / 누적 hit 수"""
+        with self._lock:
+            entries, hits = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM sql_cache"
+            ).fetchone()
+        return {"entries": entries, "hits": hits, "schema_hash": self._schema_hash}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _evict_other_schemas(self, schema_hash: str):
+        """스키마 구조가 바뀌었으면 이전 해시의 항목 삭제 (lock 안에서 호출)"""
+        if schema_hash == self._schema_hash:
+            return
+        deleted = self._conn.execute(
+            "DELETE FROM sql_cache WHERE schema_hash != ?", (schema_hash,)
+        ).rowcount
+        self._conn.commit()
+        self._schema_hash = schema_hash
+        if deleted:
+            SQL_CACHE_EVENTS.labels(event="evict_schema").inc(deleted)
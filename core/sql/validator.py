@@ -0,0 +1,261 @@
+"""
+SQL Validator
+생성된 SQL을 DB 실행 전에 로컬에서 검증 (sqlglot, MySQL 방언)
+
+사용법:
+    validator = SQLValidator()
+    result = validator.validate("SELECT nme FROM employees", snapshot)
+    result.valid   # False
+    result.error   # "SQL 검증 실패: (1054, \"Unknown column 'nme'\")"
+
+검사 항목:
+    1. 파싱 가능 + 단일 문장
+    2. SELECT 전용 (INSERT/UPDATE/DELETE/DDL, SELECT ... INTO 차단)
+    3. 테이블/컬럼이 스키마 스냅샷에 존재
+    4. ENUM 컬럼 비교 리터럴이 허용 값인지
+
+테이블/컬럼 오류 메시지는 pymysql 오류와 같은 형식 (오류 번호, "MySQL 문구")을 따르므로
+SQLAgent 보정 단계에서 전체 스키마를 사용하고, SQLRepairer는 DB 오류와 같은 방식으로 처리합니다.
+    - 1054 Unknown column / 1052 Column ... is ambiguous / 1146 Table ... doesn't exist
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import OptimizeError, ParseError
+from sqlglot.optimizer.qualify import qualify
+
+from core.database.schema import SchemaSnapshot, enum_values
+from core.observability.metrics import SQL_VALIDATIONS
+
+VALIDATION_ERROR_PREFIX = "SQL 검증 실패"
+
+# sqlglot qualify 오류에서 컬럼명 추출 ("Unknown column: x", "Column 'x' could not be resolved")
+_UNRESOLVED_COLUMN = re.compile(r"Unknown column: ([\w.]+)|Column '([^']+)' could not be resolved")
+
+# 데이터/스키마를 변경하거나 파일로 내보내는 구문
+_WRITE_NODES = (
+    exp.Insert,
+    exp.Update,
+    exp.Delete,
+    exp.Merge,
+    exp.Create,
+    exp.Drop,
+    exp.Alter,
+    exp.TruncateTable,
+    exp.Command,
+    exp.Into,
+)
+
+
+def mysql_error(code: int, message: str) -> str:
+    """pymysql 오류 문자열과 같은 형식: (1054, "Unknown column 'x'")"""
+    return f'({code}, "{message}")'
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """검증 실패 항목"""
+
+    code: str  # PARSE_ERROR | NOT_SELECT | UNKNOWN_TABLE | UNKNOWN_COLUMN | AMBIGUOUS_COLUMN | INVALID_ENUM
+    message: str
+
+
+@dataclass
+class SQLValidationResult:
+    """SQL 검증 결과"""
+
+    issues: List[ValidationIssue] = field(default_factory=list)
+    latency_ms: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues
+
+    @property
+    def error(self) -> Optional[str]:
+        """보정 단계에 넘길 오류 메시지 (통과 시 None)"""
+        if self.valid:
+            return None
+        return f"{VALIDATION_ERROR_PREFIX}: " + "; ".join(issue.message for issue in self.issues)
+
+
+class SQLValidator:
+    """
+    sqlglot 기반 SQL 검증기
+
+    - 스냅샷별 sqlglot 스키마 매핑은 스냅샷이 바뀔 때만 다시 생성
+    - 판단이 애매한 경우(분석 중 예상 밖 오류)는 통과시키고 DB 실행에 맡김
+    """
+
+    def __init__(self, dialect: str = "mysql"):
+        """
+        Args:
+            dialect: sqlglot 방언
+        """
+        self.dialect = dialect
+        # (스냅샷, 컬럼 매핑) - 튜플 단위로 교체해서 스레드 간 불일치 방지
+        self._mapped: Tuple[Optional[SchemaSnapshot], Dict[str, Dict[str, str]]] = (None, {})
+
+    def validate(self, sql: str, snapshot: SchemaSnapshot) -> SQLValidationResult:
+        """
+        SQL 검증
+
+        Args:
+            sql: 검증할 SQL
+            snapshot: 스키마 스냅샷 (전체 스키마 기준으로 검증)
+
+        Returns:
+            SQLValidationResult (issues가 비어 있으면 통과)
+        """
+        started = time.perf_counter()
+        result = SQLValidationResult(issues=self._check(sql, snapshot))
+        result.latency_ms = round((time.perf_counter() - started) * 1000, 3)
+        SQL_VALIDATIONS.labels(result=result.issues[0].code if result.issues else "ok").inc()
+        return result
+
+    # --------------------------
+    # Checks
+    # --------------------------
+    def _check(self, sql: str, snapshot: SchemaSnapshot) -> List[ValidationIssue]:
+        try:
+            statements = [s for s in sqlglot.parse(sql, read=self.dialect) if s is not None]
+        except ParseError as e:
+            return [ValidationIssue("PARSE_ERROR", f"SQL 파싱 실패: {str(e).splitlines()[0]}")]
+
+        if len(statements) != 1:
+            return [ValidationIssue("NOT_SELECT", "SELECT 문 1개만 실행할 수 있습니다.")]
+
+        statement = statements[0]
+        if not isinstance(statement, exp.Query) or statement.find(*_WRITE_NODES):
+            return [ValidationIssue("NOT_SELECT", "SELECT 문만 실행할 수 있습니다.")]
+
+        issues = self._check_tables(statement, snapshot)
+        if issues:
+            return issues
+
+        try:
+            qualified = qualify(
+                statement.copy(),
+                schema=self._get_mapping(snapshot),
+                dialect=self.dialect,
+                validate_qualify_columns=True,
+            )
+        except OptimizeError as e:
+            match = _UNRESOLVED_COLUMN.search(str(e))
+            if match is None:
+                return [ValidationIssue("UNKNOWN_COLUMN", f"Unknown column: {str(e).splitlines()[0]}")]
+            return self._column_issues(match.group(1) or match.group(2), statement, snapshot)
+        except Exception:
+            return []  # sqlglot이 해석하지 못하는 구문은 DB에 맡김
+
+        return self._check_enums(qualified, snapshot)
+
+    def _check_tables(self, statement: exp.Expression, snapshot: SchemaSnapshot) -> List[ValidationIssue]:
+        """FROM/JOIN 테이블이 스냅샷(또는 CTE)에 있는지"""
+        known = {table.name.lower() for table in snapshot.tables}
+        ctes = {cte.alias_or_name.lower() for cte in statement.find_all(exp.CTE)}
+        issues = []
+        for table in statement.find_all(exp.Table):
+            name = table.name.lower()
+            if not name or name in ctes:
+                continue
+            if name not in known or (table.db and table.db.lower() != snapshot.db_name.lower()):
+                full_name = f"{table.db}.{table.name}" if table.db else f"{snapshot.db_name}.{table.name}"
+                issues.append(
+                    ValidationIssue("UNKNOWN_TABLE", mysql_error(1146, f"Table '{full_name}' doesn't exist"))
+                )
+        return issues
+
+    def _column_issues(self, name: str, statement: exp.Expression, snapshot: SchemaSnapshot) -> List[ValidationIssue]:
+        """
+        해석하지 못한 컬럼 → 해당 이름의 실패 참조별 1054/1052 (MySQL처럼 작성된 한정자 포함)
+
+        sqlglot은 한정자 없이 이름만, 모호한 컬럼도 "could not be resolved"로 보고하므로
+        원문 참조를 다시 찾아 MySQL 오류와 같은 대상으로 바꿉니다.
+        - 한정자 있음: 한정자 테이블에 없는 참조 → 1054 'e.x'
+        - 한정자 없음: FROM/JOIN 테이블 2개 이상에 있으면 1052, 없으면 1054
+        """
+        name = name.rpartition(".")[2]
+        columns = {
+            table.name.lower(): {column.name.lower() for column in table.columns} for table in snapshot.tables
+        }
+        aliases = {table.alias_or_name.lower(): table.name.lower() for table in statement.find_all(exp.Table)}
+        derived = {node.alias.lower() for node in statement.find_all(exp.Subquery, exp.CTE) if node.alias}
+        owners = [table for table in dict.fromkeys(aliases.values()) if name.lower() in columns.get(table, ())]
+
+        issues = []
+        for column in statement.find_all(exp.Column):
+            if column.name.lower() != name.lower():
+                continue
+            if column.table:
+                qualifier = column.table.lower()
+                if qualifier in derived or name.lower() in columns.get(aliases.get(qualifier, ""), ()):
+                    continue  # 서브쿼리/CTE 컬럼은 sqlglot 해석 결과를 따름
+                issue = ValidationIssue(
+                    "UNKNOWN_COLUMN", mysql_error(1054, f"Unknown column '{column.table}.{column.name}'")
+                )
+            elif len(owners) > 1:
+                issue = ValidationIssue(
+                    "AMBIGUOUS_COLUMN", mysql_error(1052, f"Column '{column.name}' in field list is ambiguous")
+                )
+            else:
+                issue = ValidationIssue("UNKNOWN_COLUMN", mysql_error(1054, f"Unknown column '{column.name}'"))
+            if issue not in issues:
+                issues.append(issue)
+        return issues or [ValidationIssue("UNKNOWN_COLUMN", mysql_error(1054, f"Unknown column '{name}'"))]
+
+    def _check_enums(self, qualified: exp.Expression, snapshot: SchemaSnapshot) -> List[ValidationIssue]:
+        """ENUM 컬럼과 비교하는 문자열 리터럴이 허용 값인지 (=, !=, IN / MySQL처럼 대소문자 무시)"""
+        aliases = {table.alias_or_name.lower(): table.name.lower() for table in qualified.find_all(exp.Table)}
+        enums = {
+            (table.name.lower(), column.name.lower()): enum_values(column.column_type)
+            for table in snapshot.tables
+            for column in table.columns
+            if column.data_type == "enum"
+        }
+        if not enums:
+            return []
+
+        issues = []
+        for node in qualified.find_all(exp.EQ, exp.NEQ, exp.In):
+            if isinstance(node, exp.In):
+                column, literals = node.this, node.expressions
+            else:
+                column, literal = (node.this, node.expression)
+                if not isinstance(column, exp.Column):
+                    column, literal = literal, column
+                literals = [literal]
+
+            if not isinstance(column, exp.Column):
+                continue
+            allowed = enums.get((aliases.get(column.table.lower(), ""), column.name.lower()))
+            if not allowed:
+                continue
+
+            lowered = {value.lower() for value in allowed}
+            for literal in literals:
+                if isinstance(literal, exp.Literal) and literal.is_string and literal.this.lower() not in lowered:
+                    values = ", ".join(f"'{v}'" for v in allowed)
+                    issues.append(ValidationIssue(
+                        "INVALID_ENUM",
+                        f"Invalid value '{literal.this}' for enum column {column.name} (allowed: {values})",
+                    ))
+        return issues
+
+    def _get_mapping(self, snapshot: SchemaSnapshot) -> Dict[str, Dict[str, str]]:
+        """스냅샷 → sqlglot 스키마 매핑 {table: {column: type}} (타입은 검증에 쓰지 않음)"""
+        cached_snapshot, mapping = self._mapped
+        if cached_snapshot is snapshot:
+            return mapping
+
+        mapping = {
+            table.name: {column.name: "TEXT" for column in table.columns}
+            for table in snapshot.tables
+        }
+        self._mapped = (snapshot, mapping)
+        return mapping
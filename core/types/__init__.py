@@ -6,6 +6,8 @@ Core Types Module
 from core.types.agent_types import (
     AgentResult,
     AgentType,
+    StreamEvent,
+    StreamEventType,
     SQLAgentState,
     HRAgentState,
 )
@@ -15,12 +17,15 @@ from core.types.errors import (
     RAGRetrievalError,
     RouterError,
     DatabaseConnectionError,
+    OverloadedError,
 )
 
 __all__ = [
     # Types
     "AgentResult",
     "AgentType",
+    "StreamEvent",
+    "StreamEventType",
     "SQLAgentState",
     "HRAgentState",
     # Errors
@@ -29,4 +34,5 @@ __all__ = [
     "RAGRetrievalError",
     "RouterError",
     "DatabaseConnectionError",
+    "OverloadedError",
 ]
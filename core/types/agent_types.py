@@ -5,10 +5,19 @@ Agent Types
 
 from typing import TypedDict, Dict, Any, Optional, List, Literal
 
+from core.database.schema import SchemaSnapshot
+from core.sql.few_shot import FewShotMatch
+
 
 # ===== Agent 타입 =====
 AgentType = Literal["SQL_AGENT", "RAG_AGENT"]
 
+# SQL 결과 답변 방식
+# auto: 단일 값/빈 결과는 template, 그 외 llm
+# raw: 결과 행(JSON)만, template: _format_results() 포맷, llm: LLM 자연어 답변
+AnswerMode = Literal["auto", "raw", "template", "llm"]
+ANSWER_MODES = ("auto", "raw", "template", "llm")
+
 
 # ===== 통일된 Agent 결과 =====
 class AgentResult(TypedDict):
@@ -19,22 +28,47 @@ class AgentResult(TypedDict):
     error: Optional[str]
 
 
+# ===== 스트리밍 이벤트 =====
+StreamEventType = Literal[
+    "route",          # Router 분류 완료 (agent_type)
+    "sql_generated",  # SQL 생성/수정 완료 (sql, attempt)
+    "sql_executed",   # SQL 실행 완료 (row_count, error)
+    "sources",        # RAG 검색 완료 (source_docs)
+    "token",          # 답변 토큰 (text)
+    "done",           # 최종 결과 (AgentResult)
+    "error",          # 처리 중 예외 (message)
+]
+
+
+class StreamEvent(TypedDict):
+    """Agent 스트리밍 이벤트 (SSE 이벤트 1개에 대응)"""
+    type: StreamEventType
+    data: Dict[str, Any]
+
+
 # ===== SQL Agent State (LangGraph용) =====
 class SQLAgentState(TypedDict):
     """SQL Agent의 LangGraph 상태"""
     question: str
     schema: str
+    full_schema: Optional[str]  # 스키마 링킹 적용 시 전체 스키마 (누락 테이블/컬럼 오류 보정용)
+    snapshot: Optional[SchemaSnapshot]  # 실행 전 SQL 검증용 (None이면 검증 생략)
     sql: str
     error: Optional[str]
     results: Optional[List[Dict[str, Any]]]
     attempt: int
     max_attempts: int
+    repairs: List[str]  # 규칙 기반 수정 내역 ("rule: before → after")
+    candidates: List[Dict[str, Any]]  # 후보 SQL 실행 내역 (candidates > 1일 때)
+    examples: List[FewShotMatch]  # 생성 프롬프트에 넣은 유사 예시
+    truncated: bool  # 결과가 max_rows를 넘어 잘렸는지
 
 
 # ===== HR Agent State (LangGraph용) =====
 class HRAgentState(TypedDict):
     """HR Agent의 LangGraph 상태"""
     question: str
+    answer_mode: AnswerMode  # SQL Agent 답변 방식
     agent_type: str
     agent_result: Optional[AgentResult]
     error: str
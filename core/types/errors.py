@@ -43,3 +43,11 @@ class DatabaseConnectionError(HRAgentError):
 
     def __init__(self, message: str):
         super().__init__(message, "DATABASE_CONNECTION_ERROR")
+
+
+class OverloadedError(HRAgentError):
+    """과부하 오류 (동시 실행 한도/대기열 초과로 요청 거절)"""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message, "OVERLOADED")
+        self.retry_after = retry_after
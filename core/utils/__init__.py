@@ -0,0 +1,9 @@
+"""
+Utils Module
+공통 유틸리티
+"""
+
+from core.utils.text import normalize_question
+from core.utils.tokens import count_tokens
+
+__all__ = ["normalize_question", "count_tokens"]
@@ -0,0 +1,28 @@
+"""
+Text Utilities
+질문 문자열 정규화 (중복 제거/캐시 키용)
+"""
+
+import re
+import unicodedata
+
+# 질문 끝의 물음표/마침표/느낌표 등 (의미 차이 없음)
+_TRAILING_PUNCT = re.compile(r"[\s?？!！.。~]+$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    의미가 같은 질문을 같은 키로 정규화
+
+    - 유니코드 NFKC 정규화 (전각 문자 등)
+    - 대소문자 통일, 연속 공백 축소
+    - 끝의 물음표/마침표 제거
+
+    Examples:
+        >>> normalize_question("  연차휴가는   며칠인가요?? ")
+        '연차휴가는 며칠인가요'
+    """
+    text = unicodedata.normalize("NFKC", question or "")
+    text = _WHITESPACE.sub(" ", text).strip().lower()
+    return _TRAILING_PUNCT.sub("", text)
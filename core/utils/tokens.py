@@ -0,0 +1,58 @@
+"""
+Token Counting
+프롬프트 토큰 수 계산 (tiktoken, 인코딩을 받을 수 없으면 근사치)
+
+사용법:
+    from core.utils.tokens import count_tokens
+
+    count_tokens(schema_text)  # → 1234
+"""
+
+import math
+from functools import lru_cache
+from typing import Optional
+
+DEFAULT_ENCODING = "o200k_base"  # gpt-4o 계열
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(name: str):
+    """tiktoken 인코딩 로드 (최초 1회 다운로드 필요, 실패 시 None)"""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(name)
+    except Exception:
+        return None
+
+
+def tokenizer_available(encoding: str = DEFAULT_ENCODING) -> bool:
+    """tiktoken 인코딩 사용 가능 여부 (False면 count_tokens는 근사치)"""
+    return _get_encoding(encoding) is not None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 근사치 (tiktoken 없이)
+
+    ASCII는 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 약 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def count_tokens(text: str, encoding: Optional[str] = DEFAULT_ENCODING) -> int:
+    """
+    텍스트 토큰 수
+
+    Args:
+        text: 대상 텍스트
+        encoding: tiktoken 인코딩 이름 (None이면 근사치)
+
+    Returns:
+        토큰 수
+    """
+    enc = _get_encoding(encoding) if encoding else None
+    if enc is None:
+        return estimate_tokens(text)
+    return len(enc.encode(text, disallowed_special=()))
@@ -0,0 +1,70 @@
+"""
+Warmup
+앱 시작 시 컴포넌트를 미리 생성/예열해서 첫 요청이 초기화 비용을 내지 않도록 함
+
+사용법:
+    phases = container.warmup_phases()
+    report = await run_warmup(phases, timeout=30.0)
+    print(format_warmup_report(report))
+
+단계(phase)는 순서대로, 단계 안의 작업은 병렬(별도 스레드)로 실행합니다.
+의존 관계가 있는 컴포넌트는 뒤 단계에 두어 cached_property가 중복 생성되지 않게 합니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List
+
+# 단계: 작업 이름 → 동기 함수
+WarmupPhase = Dict[str, Callable[[], Any]]
+
+
+async def run_warmup(phases: List[WarmupPhase], timeout: float = 30.0) -> Dict[str, Dict[str, Any]]:
+    """
+    단계별 병렬 예열 실행
+
+    실패한 작업은 기록만 하고 계속 진행합니다 (첫 요청 시 다시 lazy 초기화 시도).
+
+    Args:
+        phases: 순서대로 실행할 단계 목록
+        timeout: 작업별 최대 시간(초)
+
+    Returns:
+        작업 이름 → {"ok", "ms", "error"} (실행 순서 유지)
+    """
+    report: Dict[str, Dict[str, Any]] = {}
+
+    for phase in phases:
+        names = list(phase)
+        results = await asyncio.gather(*(_run_step(phase[name], timeout) for name in names))
+        report.update(zip(names, results))
+
+    return report
+
+
+async def _run_step(fn: Callable[[], Any], timeout: float) -> Dict[str, Any]:
+    """작업 1개 실행 → {"ok", "ms", "error"}"""
+    started = time.perf_counter()
+    error = None
+    try:
+        await asyncio.wait_for(asyncio.to_thread(fn), timeout)
+    except asyncio.TimeoutError:
+        error = f"timeout ({timeout}s)"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return {
+        "ok": error is None,
+        "ms": round((time.perf_counter() - started) * 1000, 1),
+        "error": error,
+    }
+
+
+def format_warmup_report(report: Dict[str, Dict[str, Any]], total_ms: float) -> str:
+    """예열 결과 → 로그용 문자열"""
+    width = max((len(name) for name in report), default=0)
+    lines = [f"🔥 Warmup 완료 ({total_ms:.0f}ms)"]
+    for name, result in report.items():
+        status = "✅" if result["ok"] else f"⚠️ {result['error']}"
+        lines.append(f"   {name:<{width}}  {result['ms']:>8.1f}ms  {status}")
+    return "\n".join(lines)
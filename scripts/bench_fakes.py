@@ -0,0 +1,212 @@
+"""
+벤치마크용 Fake 컴포넌트
+실제 LLM/DB 없이 지연시간(latency)만 주입해서 HR Agent 파이프라인을 구성합니다.
+
+사용법:
+    from scripts.bench_fakes import build_fake_hr_agent
+
+    hr_agent = build_fake_hr_agent(llm_latency=0.2, db_latency=0.02)
+    result = hr_agent.query("직원 수는 몇 명인가요?")
+"""
+
+import asyncio
+import datetime
+import tempfile
+import time
+from decimal import Decimal
+from typing import Any, List, Optional
+from unittest.mock import patch
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from core.database.schema import ColumnInfo, ForeignKey, SchemaSnapshot, TableInfo, render_schema
+
+
+def _col(name: str, column_type: str) -> ColumnInfo:
+    return ColumnInfo(name, column_type.split("(")[0], column_type)
+
+
+def build_hr_snapshot() -> SchemaSnapshot:
+    """data/db_init/init.sql과 같은 구조/샘플의 스키마 스냅샷 (DB 없이 사용)"""
+    d = datetime.date
+    t = datetime.timedelta
+    return SchemaSnapshot(
+        db_name="hr_db",
+        tables=[
+            TableInfo(
+                "attendance",
+                columns=[
+                    _col("att_id", "int"), _col("emp_id", "int"), _col("date", "date"),
+                    _col("check_in", "time"), _col("check_out", "time"),
+                    _col("status", "enum('PRESENT','LATE','ABSENT','VACATION')"),
+                ],
+                samples=[
+                    (1, 1, d(2024, 1, 2), t(hours=8, minutes=55), t(hours=18, minutes=10), "PRESENT"),
+                    (2, 1, d(2024, 1, 3), t(hours=9, minutes=15), t(hours=18, minutes=30), "LATE"),
+                    (3, 1, d(2024, 1, 4), t(hours=8, minutes=50), t(hours=18), "PRESENT"),
+                ],
+                foreign_keys=[ForeignKey("emp_id", "employees", "emp_id")],
+            ),
+            TableInfo(
+                "departments",
+                columns=[_col("dept_id", "int"), _col("name", "varchar(50)"), _col("location", "varchar(50)")],
+                samples=[(1, "개발", "서울"), (2, "영업", "부산"), (3, "인사", "서울")],
+            ),
+            TableInfo(
+                "employees",
+                columns=[
+                    _col("emp_id", "int"), _col("name", "varchar(50)"), _col("email", "varchar(100)"),
+                    _col("dept_id", "int"), _col("position", "varchar(50)"), _col("join_date", "date"),
+                    _col("status", "enum('ACTIVE','LEAVE','RESIGNED')"),
+                ],
+                samples=[
+                    (1, "김철수", "cs.kim@techcorp.com", 1, "부장", d(2015, 3, 10), "ACTIVE"),
+                    (2, "이영희", "yh.lee@techcorp.com", 1, "과장", d(2018, 6, 15), "ACTIVE"),
+                    (3, "정하늘", "hn.jung@techcorp.com", 1, "대리", d(2021, 2, 1), "ACTIVE"),
+                ],
+                foreign_keys=[ForeignKey("dept_id", "departments", "dept_id")],
+            ),
+            TableInfo(
+                "evaluations",
+                columns=[
+                    _col("eval_id", "int"), _col("emp_id", "int"), _col("year", "int"),
+                    _col("quarter", "int"), _col("score", "decimal(3,1)"), _col("feedback", "text"),
+                ],
+                samples=[
+                    (1, 1, 2023, 4, Decimal("4.8"), "팀원들의 멘토링을 훌륭하게 수행함. 프로젝트 납기를 준수함."),
+                    (2, 2, 2023, 4, Decimal("4.2"), "기술적 역량은 뛰어나나 커뮤니케이션 스킬 향상이 필요함."),
+                    (3, 3, 2023, 4, Decimal("4.5"), "신규 프로젝트 리드로서 안정적인 성과를 보임."),
+                ],
+                foreign_keys=[ForeignKey("emp_id", "employees", "emp_id")],
+            ),
+            TableInfo(
+                "salaries",
+                columns=[
+                    _col("salary_id", "int"), _col("emp_id", "int"), _col("base_salary", "int"),
+                    _col("bonus", "int"), _col("payment_date", "date"),
+                ],
+                samples=[
+                    (1, 1, 9500000, 3000000, d(2024, 1, 25)),
+                    (2, 2, 7000000, 1500000, d(2024, 1, 25)),
+                    (3, 3, 5000000, 800000, d(2024, 1, 25)),
+                ],
+                foreign_keys=[ForeignKey("emp_id", "employees", "emp_id")],
+            ),
+        ],
+    )
+
+
+HR_SNAPSHOT = build_hr_snapshot()
+FAKE_SCHEMA = render_schema(HR_SNAPSHOT)
+
+FAKE_DOCS = [
+    "제20조(연차휴가) 1년간 80% 이상 출근한 직원에게 15일의 유급휴가를 준다.",
+    "제21조(육아휴직) 만 8세 이하 자녀를 양육하는 직원은 1년 이내의 육아휴직을 신청할 수 있다.",
+    "제30조(재택근무) 재택근무는 주 2회까지 부서장 승인 후 가능하다.",
+]
+
+
+def fake_reply(prompt: str) -> str:
+    """프롬프트 종류에 따라 그럴듯한 고정 응답 반환"""
+    if "분류:" in prompt:
+        # Router: 질문에 '몇'이 있으면 데이터 조회로 간주
+        question = prompt.rsplit("질문:", 1)[-1]
+        return "SQL_AGENT" if "몇" in question else "RAG_AGENT"
+    if "SCHEMA START" in prompt:
+        return "SELECT COUNT(*) AS count FROM employees;"
+    if "규정 내용" in prompt:
+        return "1년간 80% 이상 출근한 직원에게 15일의 연차휴가가 부여됩니다."
+    return "직원은 총 10명입니다."
+
+
+class FakeLatencyChatModel(BaseChatModel):
+    """고정 지연시간을 주입한 Fake Chat 모델 (sync: time.sleep, async: asyncio.sleep)"""
+
+    latency: float = 0.2
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-latency"
+
+    def _prompt_text(self, messages: List[BaseMessage]) -> str:
+        return "\n".join(str(m.content) for m in messages)
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.latency)
+        text = fake_reply(self._prompt_text(messages))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        text = fake_reply(self._prompt_text(messages))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+
+class FakeLatencyDatabase:
+    """고정 지연시간을 주입한 Fake DatabaseConnection"""
+
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+
+    def test_connection(self) -> bool:
+        return True
+
+    def execute_query(self, query: str):
+        time.sleep(self.latency)
+        return [{"count": 10}], None
+
+    def explain(self, query: str):
+        time.sleep(self.latency)
+        return [{"id": 1, "table": "employees", "type": "ALL", "rows": 10, "filtered": 100.0, "Extra": None}]
+
+    def get_schema_fingerprint(self) -> str:
+        time.sleep(self.latency)
+        return "fake"
+
+    def get_table_versions(self):
+        time.sleep(self.latency)
+        return {table.name: "fake" for table in HR_SNAPSHOT.tables}
+
+    def get_schema_snapshot(self) -> SchemaSnapshot:
+        time.sleep(self.latency)
+        return HR_SNAPSHOT
+
+    def get_table_schema(self) -> str:
+        time.sleep(self.latency)
+        return FAKE_SCHEMA
+
+
+def build_fake_hr_agent(llm_latency: float = 0.2, db_latency: float = 0.02, verbose: bool = False):
+    """
+    Fake LLM/DB/FAISS로 실제 HRAgent 파이프라인 구성
+
+    Router/SQLAgent/RAGAgent/HRAgent는 실제 클래스를 사용하고,
+    LLM Factory와 임베딩만 Fake로 대체합니다.
+    """
+    from core.agents.hr_agent import HRAgent
+    from core.agents.rag_agent import RAGAgent
+    from core.agents.sql_agent import SQLAgent
+    from core.routing.router import Router
+
+    def _chat_model(*args, **kwargs):
+        return FakeLatencyChatModel(latency=llm_latency)
+
+    embeddings = DeterministicFakeEmbedding(size=32)
+    index_dir = tempfile.mkdtemp(prefix="hr-bench-faiss-")
+    FAISS.from_texts(FAKE_DOCS, embeddings).save_local(index_dir)
+
+    with patch("core.routing.router.create_chat_model", _chat_model), \
+            patch("core.agents.sql_agent.create_chat_model", _chat_model), \
+            patch("core.agents.rag_agent.create_chat_model", _chat_model), \
+            patch("core.agents.rag_agent.create_embeddings", lambda **kwargs: embeddings):
+        router = Router()
+        sql_agent = SQLAgent(db=FakeLatencyDatabase(latency=db_latency))
+        rag_agent = RAGAgent(index_path=index_dir, top_k=2)
+
+    return HRAgent(router=router, sql_agent=sql_agent, rag_agent=rag_agent, verbose=verbose)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+DB 실행 동시성 벤치마크 (스레드 풀 vs async 엔진)
+in-flight 쿼리 수에 따른 처리량/지연시간/사용 스레드 수를 비교합니다.
+
+- threadpool: 기존 async 경로 (asyncio.to_thread로 DatabaseConnection.execute_query 실행)
+- async: AsyncDatabaseConnection.execute_query_async를 이벤트 루프에서 직접 await
+
+두 방식 모두 같은 DATABASE_URL, 같은 풀 크기(DB_POOL_SIZE)를 사용합니다.
+pre-ping은 앱과 같은 조건입니다. (동기 풀은 없음, async 풀은 checkout마다 ping - AsyncDatabaseConnection 참고)
+풀 크기보다 in-flight 수가 크면 양쪽 모두 커넥션 대기가 생기므로 --pool-size를 바꿔 가며 비교하세요.
+
+사용법:
+    DATABASE_URL=mysql+pymysql://... python scripts/benchmark_async_db.py
+    python scripts/benchmark_async_db.py --database-url mysql+pymysql://... --levels 1 8 32 128
+    python scripts/benchmark_async_db.py --query "SELECT SLEEP(0.05)" --pool-size 20 --driver asyncmy
+
+필요 패키지: aiomysql 또는 asyncmy + greenlet (pip install -e ".[async]")
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.config import get_settings
+from core.database.async_connection import AsyncDatabaseConnection
+from core.database.connection import DatabaseConnection
+
+DEFAULT_QUERY = "SELECT emp_id, name, dept_id FROM employees LIMIT 50"
+
+
+async def run_level(
+    execute: Callable[[], Awaitable[Tuple[object, object]]], concurrency: int, total: int
+) -> Dict[str, float]:
+    """concurrency개 in-flight 유지하며 total개 실행 → 처리량/지연시간/최대 스레드 수"""
+    remaining = total
+    latencies: List[float] = []
+    errors = 0
+    peak_threads = threading.active_count()
+
+    async def worker():
+        nonlocal remaining, errors, peak_threads
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            _, error = await execute()
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += error is not None
+            peak_threads = max(peak_threads, threading.active_count())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "throughput": total / elapsed,
+        "p50": statistics.median(ordered),
+        "p95": ordered[int(len(ordered) * 0.95) - 1] if len(ordered) > 1 else ordered[0],
+        "errors": errors,
+        "threads": peak_threads,
+    }
+
+
+async def main_async(args):
+    settings = get_settings()
+    url = args.database_url or settings.DATABASE_URL
+    pool_size = args.pool_size or settings.DB_POOL_SIZE
+
+    db = DatabaseConnection(connection_url=url, pool_size=pool_size)
+    async_db = AsyncDatabaseConnection(connection_url=url, driver=args.driver, pool_size=pool_size)
+
+    # 기존 앱과 같은 조건: 기본 executor 대신 QUERY_MAX_WORKERS 크기 워커 풀
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="bench-db")
+    )
+
+    modes = {
+        "threadpool": lambda: asyncio.to_thread(db.execute_query, args.query),
+        "async": lambda: async_db.execute_query_async(args.query),
+    }
+
+    # 예열 (양쪽 풀을 채우고 오류 확인)
+    for name, execute in modes.items():
+        _, error = await execute()
+        if error:
+            raise SystemExit(f"[{name}] 쿼리 실패: {error}")
+        await asyncio.gather(*(execute() for _ in range(pool_size)))
+
+    print(f"query: {args.query}")
+    print(f"pool_size={pool_size}, workers={args.workers}, driver={args.driver}")
+    print(f"{'in-flight':>9} {'mode':<11} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'threads':>8} {'errors':>7}")
+    try:
+        for level in args.levels:
+            total = max(args.requests, level * 4)
+            for name, execute in modes.items():
+                r = await run_level(execute, level, total)
+                print(
+                    f"{level:>9} {name:<11} {r['throughput']:>9.1f} {r['p50']:>8.1f} "
+                    f"{r['p95']:>8.1f} {r['threads']:>8} {r['errors']:>7}"
+                )
+    finally:
+        await async_db.dispose()
+        db.engine.dispose()
+
+
+def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="DB 실행 동시성 벤치마크 (스레드 풀 vs async 엔진)")
+    parser.add_argument("--database-url", default=None, help="기본값: DATABASE_URL")
+    parser.add_argument("--driver", default=settings.DB_ASYNC_DRIVER or "aiomysql", choices=["aiomysql", "asyncmy"])
+    parser.add_argument("--pool-size", type=int, default=None, help="기본값: DB_POOL_SIZE")
+    parser.add_argument("--workers", type=int, default=settings.QUERY_MAX_WORKERS, help="스레드 풀 크기")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=200, help="단계별 최소 쿼리 수")
+    parser.add_argument("--query", default=DEFAULT_QUERY)
+    args = parser.parse_args()
+
+    if not (args.database_url or settings.DATABASE_URL):
+        raise SystemExit("DATABASE_URL 또는 --database-url이 필요합니다.")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
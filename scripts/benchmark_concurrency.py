@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+/api/v1/query 동시성 벤치마크
+Fake LLM(지연시간 주입)으로 in-flight 요청 수(1→64)에 따른 처리량을 측정합니다.
+
+- inline: 기존 방식 (async 엔드포인트 안에서 동기 HRAgent.query() 직접 호출)
+- threadpool: QueryExecutor 워커 풀로 dispatch (QUERY_EXECUTION_MODE=threadpool)
+- async: HRAgent.aquery() 네이티브 async 경로 (QUERY_EXECUTION_MODE=async)
+
+사용법:
+    python scripts/benchmark_concurrency.py
+    python scripts/benchmark_concurrency.py --llm-latency 0.1 --levels 1 4 16 64
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.config import Settings
+from app.api.v1.api import api_router
+from core import container as container_module
+from core.container import Container
+from scripts.bench_fakes import build_fake_hr_agent
+
+QUESTION = "직원은 총 몇 명인가요?"
+
+
+def build_app(mode: str, hr_agent) -> FastAPI:
+    """벤치마크용 FastAPI 앱 (lifespan 없이 컨테이너 직접 주입)"""
+    execution_mode = "threadpool" if mode == "inline" else mode
+    # 같은 질문을 반복하므로 coalescing은 끄고 순수 실행 처리량만 측정
+    settings = Settings(
+        QUERY_EXECUTION_MODE=execution_mode,
+        QUERY_MAX_WORKERS=64,
+        QUERY_COALESCE_ENABLED=False,
+    )
+    container_module._container = Container(settings=settings, _hr_agent=hr_agent)
+
+    app = FastAPI()
+    if mode == "inline":
+        # 기존 엔드포인트 재현: 이벤트 루프에서 동기 호출
+        @app.post("/api/v1/query")
+        async def query_inline(payload: dict):
+            result = hr_agent.query(payload["question"])
+            return {"answer": result["answer"]}
+    else:
+        app.include_router(api_router, prefix="/api/v1")
+    return app
+
+
+async def run_level(app: FastAPI, concurrency: int, total: int) -> float:
+    """concurrency개 in-flight 유지하며 total개 요청 → 처리량(req/s)"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        queue: asyncio.Queue = asyncio.Queue()
+        for _ in range(total):
+            queue.put_nowait(None)
+
+        async def worker():
+            while not queue.empty():
+                queue.get_nowait()
+                resp = await client.post("/api/v1/query", json={"question": QUESTION})
+                resp.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - started)
+
+
+def measure_cpu_ceiling(samples: int = 20) -> float:
+    """지연 0인 파이프라인의 요청당 CPU 시간 → 프로세스 1개 처리량 상한(req/s)"""
+    hr_agent = build_fake_hr_agent(llm_latency=0.0, db_latency=0.0)
+    hr_agent.query(QUESTION)  # warmup
+    started = time.process_time()
+    for _ in range(samples):
+        hr_agent.query(QUESTION)
+    return samples / max(time.process_time() - started, 1e-9)
+
+
+async def main(levels: List[int], llm_latency: float, db_latency: float, requests_per_worker: int):
+    hr_agent = build_fake_hr_agent(llm_latency=llm_latency, db_latency=db_latency)
+    per_request = 3 * llm_latency + 2 * db_latency  # router + sql 생성 + 답변 생성
+    cpu_ceiling = measure_cpu_ceiling()
+
+    print("=" * 72)
+    print(f"Fake LLM latency={llm_latency * 1000:.0f}ms, DB latency={db_latency * 1000:.0f}ms")
+    print(f"요청당 이론 지연 ≈ {per_request * 1000:.0f}ms → 이상적 처리량 = in-flight / {per_request:.2f}s")
+    print(f"CPU 상한 ≈ {cpu_ceiling:.0f} req/s (Agent 오버헤드, 이 이상은 worker 프로세스 추가 필요)")
+    print("=" * 72)
+    print(f"{'in-flight':>10} | {'inline req/s':>13} | {'threadpool req/s':>17} | {'async req/s':>12}")
+    print("-" * 72)
+
+    for level in levels:
+        total = level * requests_per_worker
+        inline = await run_level(build_app("inline", hr_agent), level, total)
+        pooled = await run_level(build_app("threadpool", hr_agent), level, total)
+        native = await run_level(build_app("async", hr_agent), level, total)
+        print(f"{level:>10} | {inline:>13.1f} | {pooled:>17.1f} | {native:>12.1f}")
+
+    container_module.get_container().shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="/api/v1/query 동시성 벤치마크")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="LLM 호출당 지연(초)")
+    parser.add_argument("--db-latency", type=float, default=0.02, help="DB 호출당 지연(초)")
+    parser.add_argument("--requests-per-worker", type=int, default=2)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.levels, args.llm_latency, args.db_latency, args.requests_per_worker))
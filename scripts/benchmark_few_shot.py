@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Few-shot 예시 검색 벤치마크
+sql_train.json 질문마다 자기 자신을 뺀 인덱스에서 예시를 검색합니다 (leave-one-out).
+
+- 기본 (오프라인): 검색 품질/비용
+    테이블 일치율: top-k 예시 중 정답 SQL과 테이블 집합이 같은 예시가 있는 비율
+    구조 일치율: 테이블 집합 + 집계 함수까지 같은 예시가 있는 비율
+    프롬프트 토큰 증가량, 검색 지연시간
+- --live: 실제 DB + LLM으로 SQLAgent를 예시 없이/있이 실행해서
+    평균 시도 횟수(self-correction 포함), 성공률, 질문당 평균 지연시간 비교
+    (SQL 캐시/결과 캐시/규칙 기반 수정은 끄고 LLM 생성/보정만 비교)
+
+사용법:
+    python scripts/benchmark_few_shot.py
+    python scripts/benchmark_few_shot.py --k 5
+    DATABASE_URL=mysql+pymysql://... python scripts/benchmark_few_shot.py --live --limit 30
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import FrozenSet, List, Tuple
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import sqlglot
+from sqlglot import exp
+
+from core.sql.few_shot import FewShotRetriever, load_sql_examples, render_examples
+from core.utils.tokens import count_tokens
+
+DATASET = project_root / "data" / "finetuning" / "sql_train.json"
+
+
+def sql_shape(sql: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """SQL 구조 요약 (테이블 집합, 집계 함수 집합)"""
+    tree = sqlglot.parse_one(sql, read="mysql")
+    tables = frozenset(table.name.lower() for table in tree.find_all(exp.Table))
+    aggregates = frozenset(type(node).__name__ for node in tree.find_all(exp.AggFunc))
+    return tables, aggregates
+
+
+def leave_one_out(pairs: List[Tuple[str, str]], index: int, k: int) -> FewShotRetriever:
+    return FewShotRetriever(pairs[:index] + pairs[index + 1:], k=k)
+
+
+def run_offline(pairs: List[Tuple[str, str]], k: int, quiet: bool):
+    table_hits, hits, tokens, latencies, empty = 0, 0, [], [], 0
+    for index, (question, sql) in enumerate(pairs):
+        retriever = leave_one_out(pairs, index, k)
+
+        started = time.perf_counter()
+        matches = retriever.search(question)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+        shape = sql_shape(sql)
+        shapes = [sql_shape(match.sql) for match in matches]
+        hit = shape in shapes
+        hits += hit
+        table_hits += any(tables == shape[0] for tables, _ in shapes)
+        empty += not matches
+        tokens.append(count_tokens(render_examples(matches)))
+
+        if not quiet:
+            top = matches[0] if matches else None
+            print(
+                f"{'OK' if hit else '--':<3} {question}  →  "
+                f"{f'{top.question} ({top.score:.2f})' if top else '(예시 없음)'}"
+            )
+
+    n = len(pairs)
+    print("\n" + "=" * 60)
+    print(f"질문 수: {n}, k={k}")
+    print(f"테이블 일치 예시 포함: {table_hits}/{n} ({table_hits / n * 100:.1f}%)")
+    print(f"구조 일치 예시 포함: {hits}/{n} ({hits / n * 100:.1f}%)")
+    print(f"예시 없음 (min_score 미만): {empty}/{n}")
+    print(f"프롬프트 토큰 증가: 평균 {statistics.mean(tokens):.0f}, 최대 {max(tokens)}")
+    print(
+        f"검색 지연시간: p50 {statistics.median(latencies):.2f}ms, "
+        f"max {max(latencies):.2f}ms"
+    )
+
+
+def run_live(pairs: List[Tuple[str, str]], k: int, quiet: bool):
+    from app.core.config import get_settings
+    from core.agents.sql_agent import SQLAgent
+    from core.database.connection import DatabaseConnection
+    from core.database.schema_cache import SchemaCache
+    from core.sql.schema_linking import SchemaLinker
+    from core.sql.validator import SQLValidator
+
+    settings = get_settings()
+    model = settings.OLLAMA_MODEL if settings.LLM_PROVIDER == "ollama" else settings.LLM_MODEL
+    db = DatabaseConnection(connection_url=settings.DATABASE_URL)
+    schema_cache = SchemaCache(db, schema_format=settings.SQL_SCHEMA_FORMAT)
+    agent = SQLAgent(
+        db=db,
+        model=model,
+        max_attempts=settings.SQL_AGENT_MAX_ATTEMPTS,
+        provider=settings.LLM_PROVIDER,
+        base_url=settings.OLLAMA_BASE_URL,
+        schema_cache=schema_cache,
+        schema_linker=SchemaLinker(schema_format=settings.SQL_SCHEMA_FORMAT),
+        sql_validator=SQLValidator(),
+    )
+
+    summary = {}
+    for label, use_few_shot in (("baseline", False), ("few-shot", True)):
+        attempts, latencies, successes = [], [], 0
+        for index, (question, _) in enumerate(pairs):
+            agent.few_shot = leave_one_out(pairs, index, k) if use_few_shot else None
+            started = time.perf_counter()
+            result = agent.query(question, answer_mode="raw")  # 답변 LLM 호출 제외
+            latencies.append(time.perf_counter() - started)
+            attempts.append(result["metadata"]["attempts"])
+            successes += result["success"]
+            if not quiet:
+                print(f"[{label}] {attempts[-1]}회 {latencies[-1]:.2f}s {question}")
+        summary[label] = (statistics.mean(attempts), successes, statistics.mean(latencies))
+
+    n = len(pairs)
+    print("\n" + "=" * 60)
+    print(f"질문 수: {n}, k={k}, provider={settings.LLM_PROVIDER}, model={model}")
+    print(f"{'':<10} {'평균 시도':>8} {'성공':>8} {'평균 지연':>10}")
+    for label, (mean_attempts, successes, mean_latency) in summary.items():
+        print(f"{label:<10} {mean_attempts:>8.2f} {successes:>4}/{n:<3} {mean_latency:>9.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Few-shot 예시 검색 벤치마크")
+    parser.add_argument("--dataset", type=Path, default=DATASET)
+    parser.add_argument("--k", type=int, default=3, help="질문당 예시 수")
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 N개만")
+    parser.add_argument("--live", action="store_true", help="실제 DB/LLM으로 시도 횟수/지연시간 비교")
+    parser.add_argument("--quiet", action="store_true", help="질문별 출력 생략")
+    args = parser.parse_args()
+
+    pairs = load_sql_examples(args.dataset)[: args.limit]
+    if args.live:
+        run_live(pairs, args.k, args.quiet)
+    else:
+        run_offline(pairs, args.k, args.quiet)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+스키마 렌더링 토큰 비교
+full(기존) / compact 형식의 테이블별·전체 토큰 수와, 스키마 링킹 적용 시 질문당 평균 토큰을 비교합니다.
+
+- 기본: init.sql과 같은 구조의 내장 스냅샷 (DB 불필요)
+- --database-url: 실제 DB 스키마 사용
+- tiktoken 인코딩을 받을 수 없는 환경에서는 근사치로 계산
+
+사용법:
+    python scripts/compare_schema_tokens.py
+    python scripts/compare_schema_tokens.py --show compact
+    python scripts/compare_schema_tokens.py --database-url mysql+pymysql://...
+"""
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.database.schema import SCHEMA_FORMATS, render_schema, render_table
+from core.sql.schema_linking import SchemaLinker
+from core.utils.tokens import DEFAULT_ENCODING, count_tokens, tokenizer_available
+from scripts.report_schema_linking import DATASET, load_dataset, load_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스키마 렌더링 형식별 토큰 비교")
+    parser.add_argument("--database-url", default=None, help="실제 DB URL (없으면 내장 스냅샷)")
+    parser.add_argument("--encoding", default=DEFAULT_ENCODING, help="tiktoken 인코딩")
+    parser.add_argument("--show", choices=SCHEMA_FORMATS, default=None, help="렌더링 결과 출력")
+    args = parser.parse_args()
+
+    snapshot = load_snapshot(args.database_url)
+    exact = tokenizer_available(args.encoding)
+    print(f"토큰 계산: {args.encoding if exact else '근사치 (tiktoken 인코딩 없음)'}\n")
+
+    if args.show:
+        print(render_schema(snapshot, args.show))
+        print()
+
+    # 테이블별
+    print(f"{'table':<20} {'full':>8} {'compact':>8} {'절감':>7}")
+    print("-" * 46)
+    for table in snapshot.tables:
+        full = count_tokens(render_table(table, "full"), args.encoding)
+        compact = count_tokens(render_table(table, "compact"), args.encoding)
+        print(f"{table.name:<20} {full:>8} {compact:>8} {(1 - compact / full) * 100:>6.1f}%")
+
+    # 전체
+    totals = {fmt: count_tokens(render_schema(snapshot, fmt), args.encoding) for fmt in SCHEMA_FORMATS}
+    print("-" * 46)
+    print(
+        f"{'TOTAL':<20} {totals['full']:>8} {totals['compact']:>8} "
+        f"{(1 - totals['compact'] / totals['full']) * 100:>6.1f}%"
+    )
+
+    # 스키마 링킹 + 형식 (sql_train.json 질문 평균)
+    questions = [question for question, _ in load_dataset(DATASET)]
+    print(f"\n질문당 평균 스키마 토큰 (sql_train.json {len(questions)}개, 스키마 링킹 적용)")
+    for fmt in SCHEMA_FORMATS:
+        linker = SchemaLinker(schema_format=fmt)
+        full_schema = render_schema(snapshot, fmt)
+        tokens = [linker.link(q, snapshot, full_schema).linked_tokens for q in questions]
+        print(f"  {fmt:<8} {statistics.mean(tokens):>8.1f}  (링킹 없이 {totals[fmt]})")
+
+
+if __name__ == "__main__":
+    main()
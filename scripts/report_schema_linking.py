@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+스키마 링킹 리포트
+sql_train.json 질문별로 링킹된 테이블, 스키마 토큰 절감량, 링킹 지연시간, 정답 SQL 테이블 recall을 출력합니다.
+
+- 기본: init.sql과 같은 구조의 내장 스냅샷 (DB 불필요)
+- --database-url: 실제 DB 스키마 사용
+
+사용법:
+    python scripts/report_schema_linking.py
+    python scripts/report_schema_linking.py --database-url mysql+pymysql://... --limit 20
+"""
+
+import argparse
+import re
+import statistics
+import sys
+from pathlib import Path
+from typing import List, Set, Tuple
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.database.schema import SchemaSnapshot, render_schema
+from core.sql.few_shot import load_sql_examples
+from core.sql.schema_linking import SchemaLinker
+from core.utils.tokens import count_tokens
+
+DATASET = project_root / "data" / "finetuning" / "sql_train.json"
+_TABLE_REF = re.compile(r"\b(?:FROM|JOIN)\s+`?(\w+)`?", re.I)
+
+
+def load_dataset(path: Path) -> List[Tuple[str, str]]:
+    """sql_train.json → [(질문, 정답 SQL)]"""
+    return load_sql_examples(path)
+
+
+def gold_tables(sql: str) -> Set[str]:
+    """정답 SQL의 FROM/JOIN 테이블"""
+    return {name.lower() for name in _TABLE_REF.findall(sql)}
+
+
+def load_snapshot(database_url: str = None) -> SchemaSnapshot:
+    if database_url:
+        from core.database.connection import DatabaseConnection
+
+        return DatabaseConnection(connection_url=database_url).get_schema_snapshot()
+
+    from scripts.bench_fakes import HR_SNAPSHOT
+
+    return HR_SNAPSHOT
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스키마 링킹 토큰 절감/recall 리포트")
+    parser.add_argument("--database-url", default=None, help="실제 DB URL (없으면 내장 스냅샷)")
+    parser.add_argument("--dataset", type=Path, default=DATASET)
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 N개만")
+    parser.add_argument("--quiet", action="store_true", help="질문별 출력 생략")
+    args = parser.parse_args()
+
+    snapshot = load_snapshot(args.database_url)
+    full_schema = render_schema(snapshot)
+    linker = SchemaLinker()
+    pairs = load_dataset(args.dataset)[: args.limit]
+
+    savings, latencies, hits, fallbacks = [], [], 0, 0
+    for question, sql in pairs:
+        link = linker.link(question, snapshot, full_schema)
+        selected = set(link.tables) | set(link.bridge_tables) if not link.fallback else {
+            table.name for table in snapshot.tables
+        }
+        missing = gold_tables(sql) - selected
+        hits += not missing
+        fallbacks += link.fallback
+        savings.append(link.saved_tokens / link.full_tokens if link.full_tokens else 0)
+        latencies.append(link.latency_ms)
+
+        if not args.quiet:
+            status = "FALLBACK" if link.fallback else ("OK" if not missing else f"MISS {sorted(missing)}")
+            print(
+                f"{link.linked_tokens:>5}/{link.full_tokens:<5} tok  {link.latency_ms:>6.2f}ms  "
+                f"{status:<10} {question}  →  {','.join(link.tables + link.bridge_tables) or '-'}"
+            )
+
+    n = len(pairs)
+    print("\n" + "=" * 60)
+    print(f"질문 수: {n}")
+    print(f"스키마 토큰 (전체): {count_tokens(full_schema)}")
+    print(f"평균 토큰 절감: {statistics.mean(savings) * 100:.1f}%")
+    print(f"정답 테이블 recall: {hits}/{n} ({hits / n * 100:.1f}%)")
+    print(f"fallback (전체 스키마): {fallbacks}/{n}")
+    print(
+        f"링킹 지연시간: p50 {statistics.median(latencies):.2f}ms, "
+        f"p95 {sorted(latencies)[int(n * 0.95) - 1]:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+규칙 기반 SQL 수정 리포트
+
+- --live: 실제 DB + LLM으로 sql_train.json 질문마다 SQLAgent를 규칙 기반 수정 없이/있이 실행해서
+    LLM 보정(_correction_node) 호출 수, 성공률, 질문당 평균 지연시간 비교
+    (SQL 캐시/결과 캐시/few-shot은 끄고 수정 단계만 비교, 생략된 보정 호출 = 두 실행의 보정 호출 차이)
+- 기본 (오프라인): 규칙 자체 커버리지 (합성 오류)
+    정답 SQL에 규칙 사전을 뒤집은 오류를 주입하고 SQLRepairer가 되돌린 비율을 규칙별로 출력합니다.
+    주입 사전이 규칙 사전(DEFAULT_COLUMN_ALIASES 등)의 역이므로 규칙이 의도대로 동작하는지만 확인하며,
+    실제 LLM 보정 호출 생략 효과는 --live로 측정합니다.
+
+주입하는 오류:
+    - column_alias: 흔한 컬럼명 착각 (base_salary → salary, join_date → hire_date, emp_id → employee_id ...)
+    - unknown_table: 단수형 테이블명 (employees → employee)
+    - enum_value: 한국어 ENUM 값 (ACTIVE → 재직, LATE → 지각 ...)
+    - typo: 컬럼명 인접 글자 뒤바뀜 (name → nmae)
+    - unqualified: 여러 테이블에 있는 컬럼의 테이블 한정자 누락 (e.emp_id → emp_id)
+      (join 조건/GROUP BY로 테이블이 정해지는 경우만 수정, SELECT name처럼 근거가 없으면 LLM 보정)
+
+사전/유사도로 찾을 수 없는 창작 컬럼명(base_salary → annual_salary 등)은 규칙으로 고칠 수 없으므로
+주입하지 않습니다. (SQLRepairer는 수정하지 않고 LLM 보정에 넘김)
+
+오류 메시지는 SQLValidator로 만듭니다 (MySQL 1054/1052/1146과 같은 오류 번호/형식, DB/LLM 불필요).
+- 수정 성공: 수정된 SQL이 검증 통과
+- 정답 일치: 수정된 SQL이 원래 정답 SQL과 동일 (sqlglot 정규화 기준)
+
+사용법:
+    python scripts/report_sql_repair.py
+    python scripts/report_sql_repair.py --database-url mysql+pymysql://... --quiet
+    DATABASE_URL=mysql+pymysql://... python scripts/report_sql_repair.py --live --limit 30
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import sqlglot
+from sqlglot import exp
+
+from core.agents.sql_agent import MAX_REPAIR_PASSES
+from core.database.schema import SchemaSnapshot
+from core.sql.repair import SQLRepairer
+from core.sql.validator import SQLValidator
+from scripts.report_schema_linking import DATASET, load_dataset, load_snapshot
+
+COLUMN_MISTAKES = {
+    "base_salary": "salary",
+    "join_date": "hire_date",
+    "emp_id": "employee_id",
+    "dept_id": "department_id",
+    "payment_date": "pay_date",
+}
+TABLE_MISTAKES = {
+    "employees": "employee",
+    "departments": "department",
+    "salaries": "salary",
+    "evaluations": "evaluation",
+}
+VALUE_MISTAKES = {
+    "ACTIVE": "재직",
+    "LEAVE": "휴직",
+    "RESIGNED": "퇴사",
+    "PRESENT": "출근",
+    "LATE": "지각",
+    "ABSENT": "결근",
+    "VACATION": "휴가",
+}
+
+
+def _rename_columns(tree: exp.Expression, mistakes: Dict[str, str] = COLUMN_MISTAKES) -> bool:
+    """정답 SQL의 첫 번째 대상 컬럼을 잘못된 이름으로 (같은 이름 전체)"""
+    target = next((c.name for c in tree.find_all(exp.Column) if c.name in mistakes), None)
+    if target is None:
+        return False
+    for column in tree.find_all(exp.Column):
+        if column.name == target:
+            column.set("this", exp.to_identifier(mistakes[target]))
+    return True
+
+
+def _drop_qualifier(tree: exp.Expression) -> bool:
+    """JOIN 쿼리에서 한정자가 붙은 첫 컬럼의 한정자 제거 (여러 테이블에 있는 이름이면 모호/미해결 오류)"""
+    if not tree.find(exp.Join):
+        return False
+    column = next((c for c in tree.find_all(exp.Column) if c.table), None)
+    if column is None:
+        return False
+    column.set("table", None)
+    return True
+
+
+def _singularize_table(tree: exp.Expression) -> bool:
+    table = next((t for t in tree.find_all(exp.Table) if t.name in TABLE_MISTAKES), None)
+    if table is None:
+        return False
+    bad = TABLE_MISTAKES[table.name]
+    for column in tree.find_all(exp.Column):
+        if column.table == table.name:
+            column.set("table", exp.to_identifier(bad))
+    table.set("this", exp.to_identifier(bad))
+    return True
+
+
+def _koreanize_value(tree: exp.Expression) -> bool:
+    literal = next(
+        (l for l in tree.find_all(exp.Literal) if l.is_string and l.this in VALUE_MISTAKES), None
+    )
+    if literal is None:
+        return False
+    literal.replace(exp.Literal.string(VALUE_MISTAKES[literal.this]))
+    return True
+
+
+def _swap_letters(tree: exp.Expression) -> bool:
+    column = next((c for c in tree.find_all(exp.Column) if len(c.name) >= 4), None)
+    if column is None:
+        return False
+    name = column.name
+    column.set("this", exp.to_identifier(name[0] + name[2] + name[1] + name[3:]))
+    return True
+
+
+MUTATIONS: Dict[str, Callable[[exp.Expression], bool]] = {
+    "column_alias": _rename_columns,
+    "unknown_table": _singularize_table,
+    "enum_value": _koreanize_value,
+    "typo": _swap_letters,
+    "unqualified": _drop_qualifier,
+}
+
+
+def inject_errors(sql: str) -> List[Tuple[str, str]]:
+    """정답 SQL → [(주입 규칙, 오류 SQL)] (적용 가능한 규칙만)"""
+    broken = []
+    for rule, mutate in MUTATIONS.items():
+        tree = sqlglot.parse_one(sql, read="mysql")
+        if mutate(tree):
+            broken.append((rule, tree.sql(dialect="mysql")))
+    return broken
+
+
+def repair(
+    repairer: SQLRepairer, validator: SQLValidator, sql: str, error: str, snapshot: SchemaSnapshot
+) -> Tuple[Optional[str], List[str]]:
+    """SQLAgent 수정 노드와 같은 순서 (수정 → 검증 → 다음 오류 수정), 실패 시 (None, 수정 내역)"""
+    fixes = []
+    for _ in range(MAX_REPAIR_PASSES):
+        repaired = repairer.repair(sql, error, snapshot)
+        if repaired is None:
+            return None, fixes
+        sql, fixes = repaired.sql, fixes + repaired.fixes
+        error = validator.validate(sql, snapshot).error
+        if error is None:
+            return sql, fixes
+    return None, fixes
+
+
+def run_live(pairs: List[Tuple[str, str]], quiet: bool):
+    from app.core.config import get_settings
+    from core.agents.sql_agent import SQLAgent
+    from core.database.connection import DatabaseConnection
+    from core.database.schema_cache import SchemaCache
+    from core.sql.schema_linking import SchemaLinker
+
+    class CountingSQLAgent(SQLAgent):
+        """LLM 보정 노드 호출 수를 세는 SQLAgent"""
+
+        corrections = 0
+
+        def _correction_node(self, state):
+            self.corrections += 1
+            return super()._correction_node(state)
+
+    settings = get_settings()
+    model = settings.OLLAMA_MODEL if settings.LLM_PROVIDER == "ollama" else settings.LLM_MODEL
+    db = DatabaseConnection(connection_url=settings.DATABASE_URL)
+    schema_cache = SchemaCache(db, schema_format=settings.SQL_SCHEMA_FORMAT)
+    agent = CountingSQLAgent(
+        db=db,
+        model=model,
+        max_attempts=settings.SQL_AGENT_MAX_ATTEMPTS,
+        provider=settings.LLM_PROVIDER,
+        base_url=settings.OLLAMA_BASE_URL,
+        schema_cache=schema_cache,
+        schema_linker=SchemaLinker(schema_format=settings.SQL_SCHEMA_FORMAT),
+        sql_validator=SQLValidator(),
+    )
+
+    summary = {}
+    for label, repairer in (("baseline", None), ("repair", SQLRepairer())):
+        agent.sql_repairer = repairer
+        corrections, repaired, successes, latencies = 0, 0, 0, []
+        for question, _ in pairs:
+            agent.corrections = 0
+            started = time.perf_counter()
+            result = agent.query(question, answer_mode="raw")  # 답변 LLM 호출 제외
+            latencies.append(time.perf_counter() - started)
+            corrections += agent.corrections
+            repaired += bool(result["metadata"].get("repairs"))
+            successes += result["success"]
+            if not quiet:
+                print(f"[{label}] 보정 {agent.corrections}회 {latencies[-1]:.2f}s {question}")
+        summary[label] = (corrections, repaired, successes, statistics.mean(latencies))
+
+    n = len(pairs)
+    print("\n" + "=" * 60)
+    print(f"질문 수: {n}, provider={settings.LLM_PROVIDER}, model={model}")
+    print(f"{'':<10} {'LLM 보정':>8} {'규칙 수정':>8} {'성공':>8} {'평균 지연':>10}")
+    for label, (corrections, repaired, successes, mean_latency) in summary.items():
+        print(
+            f"{label:<10} {corrections:>8} {repaired:>8} {successes:>4}/{n:<3} {mean_latency:>9.2f}s"
+        )
+    baseline, with_repair = summary["baseline"][0], summary["repair"][0]
+    if baseline:
+        avoided = baseline - with_repair
+        print(f"\n생략된 LLM 보정 호출: {avoided}/{baseline} ({avoided / baseline * 100:.1f}%)")
+
+
+def run_offline(pairs: List[Tuple[str, str]], database_url: Optional[str], quiet: bool):
+    snapshot = load_snapshot(database_url)
+    validator = SQLValidator()
+    repairer = SQLRepairer()
+
+    stats = defaultdict(lambda: {"injected": 0, "repaired": 0, "exact": 0})
+    latencies = []
+    for question, gold in pairs:
+        expected = sqlglot.parse_one(gold, read="mysql").sql(dialect="mysql")
+        for rule, broken in inject_errors(gold):
+            error = validator.validate(broken, snapshot).error
+            if error is None:
+                continue  # 주입한 오류가 검증에 걸리지 않음 (예: 대상 컬럼이 스키마에 실제 존재)
+
+            started = time.perf_counter()
+            fixed, fixes = repair(repairer, validator, broken, error, snapshot)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+            stats[rule]["injected"] += 1
+            stats[rule]["repaired"] += fixed is not None
+            stats[rule]["exact"] += fixed == expected
+            if not quiet and fixed != expected:
+                status = "WRONG" if fixed else "FAIL"
+                print(f"{status:<5} [{rule}] {question}\n      {broken}\n      {error}")
+                if fixed:
+                    print(f"   →  {fixed}  ({'; '.join(fixes)})")
+
+    total = {key: sum(s[key] for s in stats.values()) for key in ("injected", "repaired", "exact")}
+    print("\n" + "=" * 60)
+    print(f"질문 수: {len(pairs)}")
+    print(f"{'규칙':<14} {'주입':>5} {'수정':>5} {'정답 일치':>9}")
+    for rule in MUTATIONS:
+        s = stats[rule]
+        print(f"{rule:<14} {s['injected']:>5} {s['repaired']:>5} {s['exact']:>9}")
+    print(f"{'합계':<14} {total['injected']:>5} {total['repaired']:>5} {total['exact']:>9}")
+    if total["injected"]:
+        print(
+            f"\n규칙 자체 커버리지 (합성 오류, LLM 보정 생략 효과는 --live): "
+            f"{total['repaired']}/{total['injected']} "
+            f"({total['repaired'] / total['injected'] * 100:.1f}%)"
+        )
+        print(
+            f"수정 지연시간: p50 {statistics.median(latencies):.2f}ms, "
+            f"max {max(latencies):.2f}ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="규칙 기반 SQL 수정 → LLM 보정 생략 리포트")
+    parser.add_argument("--database-url", default=None, help="실제 DB URL (없으면 내장 스냅샷)")
+    parser.add_argument("--dataset", type=Path, default=DATASET)
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 N개만")
+    parser.add_argument("--live", action="store_true", help="실제 DB/LLM으로 LLM 보정 호출 수 비교")
+    parser.add_argument("--quiet", action="store_true", help="실패 항목 출력 생략")
+    args = parser.parse_args()
+
+    pairs = load_dataset(args.dataset)[: args.limit]
+    if args.live:
+        run_live(pairs, args.quiet)
+    else:
+        run_offline(pairs, args.database_url, args.quiet)
+
+
+if __name__ == "__main__":
+    main()
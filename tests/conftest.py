@@ -4,11 +4,12 @@ Pytest Fixtures
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, AsyncMock
 from typing import List, Dict, Any, Optional, Tuple
 
 from app.core.config import Settings
 from core.container import Container
+from core.database.schema import ColumnInfo, ForeignKey, SchemaSnapshot, TableInfo
 from core.types.agent_types import AgentResult
 
 
@@ -43,6 +44,28 @@ TABLE departments:
   - dept_id (int)
   - name (varchar)
 """
+    db.get_schema_snapshot.return_value = SchemaSnapshot(
+        db_name="test_db",
+        tables=[
+            TableInfo(
+                name="employees",
+                columns=[
+                    ColumnInfo("emp_id", "int", "int"),
+                    ColumnInfo("name", "varchar", "varchar(50)"),
+                    ColumnInfo("dept_id", "int", "int"),
+                ],
+                foreign_keys=[ForeignKey("dept_id", "departments", "dept_id")],
+            ),
+            TableInfo(
+                name="departments",
+                columns=[
+                    ColumnInfo("dept_id", "int", "int"),
+                    ColumnInfo("name", "varchar", "varchar(50)"),
+                ],
+            ),
+        ],
+    )
+    db.get_schema_fingerprint.return_value = "v1"
     db.test_connection.return_value = True
     return db
 
@@ -67,6 +90,7 @@ def mock_sql_agent() -> Mock:
         metadata={"agent_type": "SQL_AGENT", "sql": "SELECT COUNT(*) FROM employees;"},
         error=None,
     )
+    agent.aquery = AsyncMock(return_value=agent.query.return_value)
     return agent
 
 
@@ -81,6 +105,7 @@ def mock_rag_agent() -> Mock:
         metadata={"agent_type": "RAG_AGENT", "source_docs": ["연차휴가 규정..."]},
         error=None,
     )
+    agent.aquery = AsyncMock(return_value=agent.query.return_value)
     return agent
 
 
@@ -90,9 +115,20 @@ def mock_router() -> Mock:
     """Mock Router"""
     router = Mock()
     router.route.return_value = "SQL_AGENT"
+    router.aroute = AsyncMock(return_value="SQL_AGENT")
     return router
 
 
+# ===== Mock HR Agent =====
+@pytest.fixture
+def mock_hr_agent(mock_sql_agent) -> Mock:
+    """Mock HRAgent (query/aquery 모두 SQL 결과 반환)"""
+    agent = Mock()
+    agent.query.return_value = mock_sql_agent.query.return_value
+    agent.aquery = AsyncMock(return_value=mock_sql_agent.query.return_value)
+    return agent
+
+
 # ===== Test Container =====
 @pytest.fixture
 def test_container(mock_settings, mock_db, mock_router, mock_sql_agent, mock_rag_agent) -> Container:
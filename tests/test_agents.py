@@ -3,9 +3,34 @@ Agent Tests (샘플)
 포트폴리오용 pytest 테스트 예시
 """
 
+import datetime
+import inspect
+import threading
+
 import pytest
-from unittest.mock import Mock, patch
+import sqlglot
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
 
+from app.core.config import Settings
+from core.agents.hr_agent import HRAgent
+from core.agents.sql_agent import SQLAgent
+from core.concurrency import Bulkhead
+from core.database.async_connection import to_async_url
+from core.database.connection import DatabaseConnection, QueryRows
+from core.database.cost_guard import QueryCostGuard
+from core.database.schema import ColumnInfo, ForeignKey, SchemaSnapshot, TableInfo, render_schema
+from core.database.result_cache import ResultCache, normalize_sql
+from core.database.schema_cache import SchemaCache
+from core.observability.metrics import LLMMetricsCallback, REGISTRY
+from core.sql.few_shot import FewShotRetriever
+from core.sql.repair import SQLRepairer
+from core.sql.row_limit import inject_limit
+from core.sql.schema_linking import SchemaLinker
+from core.sql.sql_cache import SQLCache
+from core.sql.validator import SQLValidator
+from core.types.errors import OverloadedError
 from core.types.agent_types import AgentResult
 
 
@@ -27,6 +52,49 @@ class TestSQLAgent:
         assert error is None
         assert results == [{"count": 10}]
 
+    async def test_astream_emits_stage_events(self, mock_db):
+        """astream이 SQL 생성 → 실행 → 토큰 → done 순서로 이벤트를 보내는지 테스트"""
+        # Given: SQL 1개, 답변 1개를 순서대로 반환하는 Fake LLM
+        llm = GenericFakeChatModel(
+            messages=iter(["SELECT COUNT(*) FROM employees;", "직원은 총 10명입니다."])
+        )
+        with patch("core.agents.sql_agent.create_chat_model", return_value=llm):
+            agent = SQLAgent(db=mock_db)
+
+        # When
+        events = [event async for event in agent.astream("직원 수는?", answer_mode="llm")]
+
+        # Then
+        types = [event["type"] for event in events]
+        assert types[:2] == ["sql_generated", "sql_executed"]
+        assert types[-1] == "done"
+        assert "token" in types
+        assert events[1]["data"]["row_count"] == 1
+        assert events[-1]["data"]["answer"] == "직원은 총 10명입니다."
+
+    def test_answer_modes_skip_answer_llm(self, mock_db):
+        """auto(단일 값)/template/raw는 답변용 LLM 호출 없이 응답"""
+        # Given
+        llm = GenericFakeChatModel(messages=iter(["직원은 총 10명입니다."]))
+        with patch("core.agents.sql_agent.create_chat_model", return_value=llm):
+            agent = SQLAgent(db=mock_db)
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT COUNT(*) AS count FROM employees;"
+        agent.answer_chain = Mock()
+        mock_db.execute_query.return_value = ([{"count": 10}], None)
+
+        # When
+        auto = agent.query("직원 수는?")
+        raw = agent.query("직원 수는?", answer_mode="raw")
+
+        # Then
+        assert auto["answer"] == "10명"
+        assert auto["metadata"]["answer_mode"] == "template"
+        assert raw["answer"] == '[{"count": 10}]'
+        agent.answer_chain.invoke.assert_not_called()
+        with pytest.raises(ValueError):
+            agent.query("직원 수는?", answer_mode="html")
+
     def test_get_table_schema(self, mock_db):
         """스키마 조회 테스트"""
         schema = mock_db.get_table_schema()
@@ -35,6 +103,1009 @@ class TestSQLAgent:
         assert "departments" in schema
 
 
+# ===== Schema Introspection Tests =====
+class FakeSchemaConnection:
+    """INFORMATION_SCHEMA 조회를 흉내 내는 커넥션 (실행한 SQL 기록)"""
+
+    TABLES = ["departments", "employees"]
+    COLUMNS = [
+        ("departments", "dept_id", "int", "int", ""),
+        ("departments", "name", "varchar", "varchar(50)", ""),
+        ("employees", "emp_id", "int", "int", ""),
+        ("employees", "status", "enum", "enum('재직','퇴사')", "재직 상태"),
+    ]
+    FOREIGN_KEYS = [("employees", "dept_id", "departments", "dept_id")]
+    SAMPLES = {
+        "departments": [(1, "인사팀"), (2, "개발팀")],
+        "employees": [(1, "재직")],
+    }
+
+    def __init__(self):
+        self.executed = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, clause, params=None):
+        sql = str(clause)
+        self.executed.append(sql)
+        result = Mock()
+        if "DATABASE()" in sql:
+            result.scalar.return_value = "hr_db"
+        elif "INFORMATION_SCHEMA.TABLES" in sql:
+            result.scalars.return_value.all.return_value = self.TABLES
+        elif "INFORMATION_SCHEMA.COLUMNS" in sql:
+            result.fetchall.return_value = self.COLUMNS
+        elif "KEY_COLUMN_USAGE" in sql:
+            result.fetchall.return_value = self.FOREIGN_KEYS
+        else:
+            table = sql.split("`")[1]
+            result.fetchall.return_value = self.SAMPLES[table]
+        return result
+
+
+class TestSchemaIntrospection:
+    """get_table_schema 벌크 조회 테스트"""
+
+    def test_single_connection_and_same_text(self):
+        """커넥션 1개, 컬럼 조회 1회로 기존과 같은 텍스트 생성"""
+        # Given
+        conn = FakeSchemaConnection()
+        db = DatabaseConnection.__new__(DatabaseConnection)
+        db._connect = Mock(return_value=conn)
+
+        # When
+        schema = db.get_table_schema()
+
+        # Then
+        assert db._connect.call_count == 1
+        assert sum("INFORMATION_SCHEMA.COLUMNS" in sql for sql in conn.executed) == 1
+        assert schema == (
+            "TABLE departments:\n"
+            "  - dept_id (int)\n"
+            "  - name (varchar)\n"
+            "  샘플 데이터:\n"
+            "    (1, '인사팀')\n"
+            "    (2, '개발팀')\n"
+            "\n"
+            "TABLE employees:\n"
+            "  - emp_id (int)\n"
+            "  - status (enum: 재직,퇴사)\n"
+            "  샘플 데이터:\n"
+            "    (1, '재직')"
+        )
+        assert "LIMIT" not in conn.executed[-2] and "LIMIT 3" in conn.executed[-1]
+
+    def test_fingerprint_reads_uncached_stats(self):
+        """지문 조회 전 세션 통계 캐시를 꺼서 최신 UPDATE_TIME 반영"""
+        # Given
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        conn.execute.return_value.fetchall.return_value = [("employees", None, None, 1)]
+        db = DatabaseConnection.__new__(DatabaseConnection)
+        db._connect = Mock(return_value=conn)
+
+        # When
+        db.get_schema_fingerprint()
+
+        # Then
+        executed = [str(call.args[0]) for call in conn.execute.call_args_list]
+        assert "information_schema_stats_expiry = 0" in executed[0]
+        assert "INFORMATION_SCHEMA.TABLES" in executed[1]
+
+
+class TestCompactSchemaRendering:
+    """compact 스키마 렌더링 테스트"""
+
+    def test_one_line_table_with_fk_and_iso_samples(self):
+        """1줄 DDL, FK 힌트, 중복 없는 ENUM, ISO 날짜/시간, 긴 문자열 생략"""
+        # Given
+        table = TableInfo(
+            "attendance",
+            columns=[
+                ColumnInfo("emp_id", "int", "int"),
+                ColumnInfo("date", "date", "date"),
+                ColumnInfo("check_in", "time", "time"),
+                ColumnInfo("status", "enum", "enum('LATE','PRESENT','LATE')"),
+                ColumnInfo("memo", "text", "text"),
+            ],
+            samples=[(1, datetime.date(2024, 1, 3), datetime.timedelta(hours=9, minutes=15), "LATE", "가" * 30)],
+            foreign_keys=[ForeignKey("emp_id", "employees", "emp_id")],
+        )
+
+        # When
+        text = render_schema(SchemaSnapshot("hr_db", [table]), "compact")
+
+        # Then
+        header, samples = text.splitlines()
+        assert header == (
+            "attendance(emp_id int -> employees.emp_id, date date, check_in time, "
+            "status enum(LATE|PRESENT), memo text)"
+        )
+        assert samples == f"  -- samples: (1, 2024-01-03, 09:15:00, 'LATE', '{'가' * 24}…')"
+
+    def test_compact_is_smaller(self, hr_snapshot):
+        """compact 형식이 기존 형식보다 짧음"""
+        assert len(render_schema(hr_snapshot, "compact")) < len(render_schema(hr_snapshot))
+
+
+# ===== Schema Cache Tests =====
+class TestSchemaCache:
+    """스키마 캐시 테스트"""
+
+    def test_hit_within_ttl(self, mock_db):
+        """TTL 이내에는 DB 접근 없이 캐시 반환"""
+        cache = SchemaCache(mock_db, ttl=60)
+
+        first = cache.get()
+        second = cache.get()
+
+        assert first == second
+        assert first.startswith("TABLE employees:")
+        assert mock_db.get_schema_snapshot.call_count == 1
+        assert mock_db.get_schema_fingerprint.call_count == 1
+
+    def test_unchanged_fingerprint_skips_reload(self, mock_db):
+        """TTL 경과 후 지문이 같으면 전체 재조회 생략"""
+        # Given: TTL 0 → 매번 지문 확인
+        cache = SchemaCache(mock_db, ttl=0)
+        cache.get()
+
+        # When
+        cache.get()
+
+        # Then
+        assert mock_db.get_schema_snapshot.call_count == 1
+        assert cache.stats()["validated"] == 1
+
+    def test_changed_fingerprint_reloads(self, mock_db):
+        """지문이 바뀌면 (DDL/데이터 변경) 스키마 재조회"""
+        mock_db.get_schema_fingerprint.side_effect = ["v1", "v2"]
+        cache = SchemaCache(mock_db, ttl=0)
+        cache.get()
+
+        mock_db.get_schema_snapshot.return_value = SchemaSnapshot(
+            db_name="test_db",
+            tables=[TableInfo("employees", columns=[ColumnInfo("hire_date", "date", "date")])],
+        )
+        schema = cache.get()
+
+        assert "hire_date" in schema
+        assert mock_db.get_schema_snapshot.call_count == 2
+
+    def test_extraction_failure_not_cached(self, mock_db):
+        """스키마 추출 실패는 캐시하지 않음"""
+        mock_db.get_schema_snapshot.side_effect = RuntimeError("timeout")
+        cache = SchemaCache(mock_db, ttl=60)
+
+        first = cache.get_entry()
+        cache.get()
+
+        assert first.snapshot is None
+        assert first.text == "스키마 추출 실패: timeout"
+        assert mock_db.get_schema_snapshot.call_count == 2
+
+
+# ===== Result Cache Tests =====
+class TestResultCache:
+    """SQL 결과 캐시 테스트"""
+
+    @pytest.fixture
+    def db(self, mock_db):
+        mock_db.get_table_versions.return_value = {"employees": "t1", "departments": "t1"}
+        mock_db.execute_query.return_value = ([{"cnt": 2}], None)
+        return mock_db
+
+    def test_hit_skips_execution(self, db):
+        """정규화된 SQL이 같으면 DB 실행 없이 반환"""
+        cache = ResultCache(db, poll_interval=60)
+
+        cache.execute_query("SELECT COUNT(*) AS cnt FROM employees;")
+        results, error = cache.execute_query("SELECT  COUNT(*) AS cnt\nFROM employees")
+
+        assert (results, error) == ([{"cnt": 2}], None)
+        assert db.execute_query.call_count == 1
+        assert normalize_sql("SELECT 'a  b' ;") == "SELECT 'a  b'"
+
+    def test_table_change_invalidates_only_readers(self, db):
+        """읽은 테이블의 UPDATE_TIME이 바뀐 항목만 무효화"""
+        # Given
+        cache = ResultCache(db, poll_interval=0)
+        cache.execute_query("SELECT COUNT(*) FROM employees")
+        cache.execute_query("SELECT COUNT(*) FROM departments")
+
+        # When: departments만 변경
+        db.get_table_versions.return_value = {"employees": "t1", "departments": "t2"}
+        cache.execute_query("SELECT COUNT(*) FROM employees")
+        cache.execute_query("SELECT COUNT(*) FROM departments")
+
+        # Then: departments 쿼리만 재실행
+        assert db.execute_query.call_count == 3
+        assert db.execute_query.call_args[0][0] == "SELECT COUNT(*) FROM departments"
+
+    def test_skips_queries_without_tables(self, db):
+        """테이블을 읽지 않는 쿼리(NOW() 등)는 무효화 기준이 없으므로 캐시하지 않음"""
+        cache = ResultCache(db, poll_interval=60)
+
+        cache.execute_query("SELECT NOW() AS now")
+        cache.execute_query("SELECT NOW() AS now")
+
+        assert db.execute_query.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_stale_entry_served_while_refreshing(self, db):
+        """TTL이 지난 항목은 즉시 반환하고 백그라운드에서 재실행"""
+        # Given: ttl 0 → 저장 직후부터 stale
+        cache = ResultCache(db, ttl=0, stale_ttl=60, poll_interval=60)
+        cache.execute_query("SELECT COUNT(*) AS cnt FROM employees")
+        db.execute_query.return_value = ([{"cnt": 3}], None)
+
+        # When
+        stale, _ = cache.execute_query("SELECT COUNT(*) AS cnt FROM employees")
+        cache.shutdown(wait=True)
+
+        # Then: 이번 응답은 이전 결과, 캐시는 새 결과로 갱신
+        assert stale == [{"cnt": 2}]
+        assert db.execute_query.call_count == 2
+        cache.ttl = 60
+        assert cache.peek("SELECT COUNT(*) AS cnt FROM employees") == [{"cnt": 3}]
+
+
+# ===== Schema Linking Tests =====
+@pytest.fixture
+def hr_snapshot() -> SchemaSnapshot:
+    """departments ← employees ← salaries / attendance 스냅샷"""
+    return SchemaSnapshot(
+        db_name="hr_db",
+        tables=[
+            TableInfo(
+                "departments",
+                columns=[ColumnInfo("dept_id", "int", "int"), ColumnInfo("name", "varchar", "varchar(50)")],
+                samples=[(1, "개발"), (2, "영업")],
+            ),
+            TableInfo(
+                "employees",
+                columns=[ColumnInfo("emp_id", "int", "int"), ColumnInfo("dept_id", "int", "int")],
+                samples=[(1, 1)],
+                foreign_keys=[ForeignKey("dept_id", "departments", "dept_id")],
+            ),
+            TableInfo(
+                "salaries",
+                columns=[ColumnInfo("emp_id", "int", "int"), ColumnInfo("base_salary", "int", "int")],
+                samples=[(1, 9500000)],
+                foreign_keys=[ForeignKey("emp_id", "employees", "emp_id")],
+            ),
+            TableInfo(
+                "attendance",
+                columns=[ColumnInfo("emp_id", "int", "int"), ColumnInfo("status", "enum", "enum('PRESENT','LATE')")],
+                samples=[(1, "LATE")],
+                foreign_keys=[ForeignKey("emp_id", "employees", "emp_id")],
+            ),
+        ],
+    )
+
+
+class TestSchemaLinking:
+    """스키마 링킹 테스트"""
+
+    def test_links_tables_with_join_path(self, hr_snapshot):
+        """샘플 값/키워드 매칭 + FK join 경로 테이블 추가"""
+        # Given
+        full = render_schema(hr_snapshot)
+
+        # When: '개발'(departments 샘플) + '연봉'(salaries 키워드)
+        link = SchemaLinker().link("개발팀 평균 연봉은?", hr_snapshot, full)
+
+        # Then
+        assert link.tables == ["departments", "salaries"]
+        assert link.bridge_tables == ["employees"]
+        assert "attendance" not in link.schema
+        assert "(1, 1)" not in link.schema  # bridge 테이블은 샘플 제외
+        assert link.linked_tokens < link.full_tokens
+        assert link.report()["saved_tokens"] == link.full_tokens - link.linked_tokens
+
+    def test_no_match_falls_back_to_full_schema(self, hr_snapshot):
+        """매칭되는 키워드가 없으면 전체 스키마"""
+        full = render_schema(hr_snapshot)
+
+        link = SchemaLinker().link("오늘 점심 메뉴는?", hr_snapshot, full)
+
+        assert link.fallback is True
+        assert link.schema == full
+
+    def test_sql_agent_uses_linked_schema(self, mock_db, hr_snapshot):
+        """SQL 프롬프트에는 링킹된 스키마, 보정 시 누락 컬럼 오류면 전체 스키마"""
+        # Given: 첫 SQL은 Unknown column 오류, 보정 SQL은 성공
+        mock_db.get_schema_snapshot.return_value = hr_snapshot
+        mock_db.execute_query.side_effect = [
+            (None, "(1054, \"Unknown column 'd.name' in 'where clause'\")"),
+            ([{"cnt": 3}], None),
+        ]
+        llm = GenericFakeChatModel(messages=iter(["지각은 3건입니다."]))
+        with patch("core.agents.sql_agent.create_chat_model", return_value=llm):
+            agent = SQLAgent(db=mock_db, schema_linker=SchemaLinker())
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT COUNT(*) FROM attendance WHERE status = 'LATE';"
+        agent.correction_chain = Mock()
+        agent.correction_chain.invoke.return_value = "SELECT COUNT(*) AS cnt FROM attendance WHERE status = 'LATE';"
+
+        # When
+        result = agent.query("지각 몇 번?")
+
+        # Then
+        assert result["success"] is True
+        assert "salaries" not in agent.sql_chain.invoke.call_args[0][0]["schema"]
+        assert "salaries" in agent.correction_chain.invoke.call_args[0][0]["schema"]
+        assert result["metadata"]["schema_linking"]["tables"] == ["attendance"]
+
+
+# ===== NL → SQL Cache Tests =====
+class TestSQLCache:
+    """NL → SQL 캐시 테스트"""
+
+    def _agent(self, mock_db, sql_cache):
+        llm = GenericFakeChatModel(messages=iter(["직원은 2명입니다."] * 4))
+        with patch("core.agents.sql_agent.create_chat_model", return_value=llm):
+            agent = SQLAgent(db=mock_db, sql_cache=sql_cache)
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT COUNT(*) AS cnt FROM employees;"
+        return agent
+
+    def test_hit_skips_sql_generation(self, mock_db):
+        """같은 질문(정규화 후)이면 SQL 생성 없이 바로 실행"""
+        # Given: 첫 요청에서 성공한 SQL 저장
+        mock_db.execute_query.return_value = ([{"cnt": 2}], None)
+        agent = self._agent(mock_db, SQLCache())
+        first = agent.query("직원 수는?")
+
+        # When: 공백/물음표만 다른 질문
+        second = agent.query("  직원 수는 ")
+
+        # Then
+        assert first["metadata"]["sql_cache"] == "miss"
+        assert second["metadata"]["sql_cache"] == "hit"
+        assert second["metadata"]["sql"] == "SELECT COUNT(*) AS cnt FROM employees;"
+        assert agent.sql_chain.invoke.call_count == 1
+        assert mock_db.execute_query.call_count == 2
+
+    def test_failed_cached_sql_is_deleted(self, mock_db):
+        """캐시된 SQL이 실행 실패하면 항목 삭제"""
+        # Given
+        cache = SQLCache()
+        agent = self._agent(mock_db, cache)
+        schema_hash = agent.schema_cache.get_entry().structure_hash
+        cache.put("직원 수는?", schema_hash, agent._cache_model, "SELECT * FROM gone;")
+        mock_db.execute_query.return_value = (None, "(1146, \"Table 'gone' doesn't exist\")")
+        agent.max_attempts = 1
+
+        # When
+        result = agent.query("직원 수는?")
+
+        # Then
+        assert result["success"] is False
+        assert cache.get("직원 수는?", schema_hash, agent._cache_model) is None
+
+    async def test_async_lookup_runs_off_event_loop(self, mock_db):
+        """aquery의 캐시 조회(sqlite)는 이벤트 루프가 아닌 워커 스레드에서 실행"""
+        # Given
+        cache = SQLCache()
+        agent = self._agent(mock_db, cache)
+        agent.sql_chain.ainvoke = AsyncMock(return_value="SELECT COUNT(*) AS cnt FROM employees;")
+        lookup_threads = []
+        original_get = cache.get
+
+        def get(*args):
+            lookup_threads.append(threading.get_ident())
+            return original_get(*args)
+
+        cache.get = get
+
+        # When
+        await agent.aquery("직원 수는?", answer_mode="raw")
+
+        # Then
+        assert lookup_threads and threading.get_ident() not in lookup_threads
+
+    def test_schema_change_evicts_entries(self):
+        """스키마 구조 해시가 바뀌면 이전 항목 삭제"""
+        # Given
+        cache = SQLCache()
+        cache.put("직원 수는?", "v1", "openai:gpt-4o-mini", "SELECT COUNT(*) FROM employees;")
+
+        # When
+        missed = cache.get("직원 수는?", "v2", "openai:gpt-4o-mini")
+
+        # Then
+        assert missed is None
+        assert cache.stats()["entries"] == 0
+
+
+# ===== SQL Validation Tests =====
+class TestSQLValidator:
+    """실행 전 SQL 로컬 검증 테스트"""
+
+    def test_valid_join_query_passes(self, hr_snapshot):
+        """스키마에 있는 테이블/컬럼, 허용된 ENUM 값은 통과"""
+        sql = (
+            "SELECT d.name, COUNT(*) AS cnt FROM attendance a "
+            "JOIN employees e ON a.emp_id = e.emp_id "
+            "JOIN departments d ON e.dept_id = d.dept_id "
+            "WHERE a.status IN ('late') GROUP BY d.name ORDER BY cnt DESC;"
+        )
+
+        result = SQLValidator().validate(sql, hr_snapshot)
+
+        assert result.valid is True
+        assert result.error is None
+
+    @pytest.mark.parametrize(
+        "sql, code",
+        [
+            ("DELETE FROM employees", "NOT_SELECT"),
+            ("SELECT 1; DROP TABLE employees", "NOT_SELECT"),
+            ("SELECT * FROM employee", "UNKNOWN_TABLE"),
+            ("SELECT e.nme FROM employees e", "UNKNOWN_COLUMN"),
+            ("SELECT COUNT(*) FROM attendance WHERE status = 'ABSENT'", "INVALID_ENUM"),
+        ],
+    )
+    def test_rejects_invalid_sql(self, hr_snapshot, sql, code):
+        """SELECT 외 구문, 없는 테이블/컬럼, 허용되지 않은 ENUM 값은 실패"""
+        result = SQLValidator().validate(sql, hr_snapshot)
+
+        assert result.valid is False
+        assert result.issues[0].code == code
+
+    def test_column_errors_match_mysql(self, hr_snapshot):
+        """컬럼 오류는 MySQL과 같은 오류 번호 + 작성된 한정자 (한정자 없는 모호한 컬럼은 1052)"""
+        validator = SQLValidator()
+
+        unknown = validator.validate("SELECT AVG(s.salary) FROM salaries s", hr_snapshot)
+        ambiguous = validator.validate(
+            "SELECT dept_id FROM employees e JOIN departments d ON e.dept_id = d.dept_id", hr_snapshot
+        )
+
+        assert unknown.error == "SQL 검증 실패: (1054, \"Unknown column 's.salary'\")"
+        assert ambiguous.issues[0].code == "AMBIGUOUS_COLUMN"
+        assert ambiguous.error.endswith("(1052, \"Column 'dept_id' in field list is ambiguous\")")
+
+    def test_agent_corrects_without_db_round_trip(self, mock_db, hr_snapshot):
+        """검증 실패 SQL은 DB 실행 없이 보정 단계로"""
+        # Given: 첫 SQL은 없는 컬럼, 보정 SQL은 정상
+        mock_db.get_schema_snapshot.return_value = hr_snapshot
+        mock_db.execute_query.return_value = ([{"cnt": 3}], None)
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(db=mock_db, sql_validator=SQLValidator())
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT COUNT(*) AS cnt FROM attendance WHERE state = 'LATE';"
+        agent.correction_chain = Mock()
+        agent.correction_chain.invoke.return_value = "SELECT COUNT(*) AS cnt FROM attendance WHERE status = 'LATE';"
+
+        # When
+        result = agent.query("지각 몇 번?")
+
+        # Then
+        assert result["success"] is True
+        assert result["metadata"]["attempts"] == 2
+        assert "Unknown column" in agent.correction_chain.invoke.call_args[0][0]["error"]
+        mock_db.execute_query.assert_called_once_with(
+            "SELECT COUNT(*) AS cnt FROM attendance WHERE status = 'LATE';"
+        )
+
+
+# ===== SQL Repair Tests =====
+class TestSQLRepair:
+    """규칙 기반 SQL 수정 테스트"""
+
+    def test_repairs_unknown_column_with_alias(self, hr_snapshot):
+        """LLM이 자주 쓰는 컬럼명(salary)은 스코프 테이블의 실제 컬럼으로 교체"""
+        # Given
+        sql = "SELECT AVG(s.salary) FROM salaries s"
+        error = "(pymysql.err.OperationalError) (1054, \"Unknown column 's.salary' in 'field list'\")"
+
+        # When
+        repair = SQLRepairer().repair(sql, error, hr_snapshot)
+
+        # Then
+        assert repair.sql == "SELECT AVG(s.base_salary) FROM salaries AS s"
+        assert repair.fixes == ["unknown_column: s.salary → s.base_salary"]
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("지각", "LATE"), ("late", "LATE"), ("PRESNT", "PRESENT")],
+    )
+    def test_repairs_enum_value(self, hr_snapshot, value, expected):
+        """한국어 동의어/대소문자/오타 ENUM 값은 허용 값으로 교체"""
+        sql = f"SELECT COUNT(*) FROM attendance WHERE status = '{value}'"
+        error = f"Invalid value '{value}' for enum column status (allowed: 'PRESENT', 'LATE')"
+
+        repair = SQLRepairer().repair(sql, error, hr_snapshot)
+
+        assert repair.sql == f"SELECT COUNT(*) FROM attendance WHERE status = '{expected}'"
+
+    def test_returns_none_when_ambiguous(self, hr_snapshot):
+        """후보가 하나로 정해지지 않으면 수정하지 않음"""
+        sql = "SELECT e.zzz FROM employees e"
+
+        assert SQLRepairer().repair(sql, "(1054, \"Unknown column 'e.zzz' in 'field list'\")", hr_snapshot) is None
+
+    def test_rule_follows_error_code_not_message_text(self, hr_snapshot):
+        """규칙은 오류 번호로 판단 (서버 메시지 언어가 달라도 수정, 번호 없는 문구는 무시)"""
+        sql = "SELECT AVG(s.salary) FROM salaries s"
+
+        localized = SQLRepairer().repair(sql, "(1054, \"Colonne 's.salary' inconnue dans field list\")", hr_snapshot)
+
+        assert localized.sql == "SELECT AVG(s.base_salary) FROM salaries AS s"
+        assert SQLRepairer().repair(sql, "Unknown column 's.salary'", hr_snapshot) is None
+
+    def test_rewrites_only_failing_table_references(self, hr_snapshot):
+        """오류가 난 테이블의 컬럼 참조만 교체 (ORDER BY의 SELECT 별칭 참조는 그대로)"""
+        # Given: ORDER BY salary는 출력 별칭
+        sql = "SELECT emp_id, AVG(salary) AS salary FROM salaries GROUP BY emp_id ORDER BY salary DESC"
+        error = "(1054, \"Unknown column 'salary' in 'field list'\")"
+
+        # When
+        repair = SQLRepairer().repair(sql, error, hr_snapshot)
+
+        # Then
+        assert repair.sql == (
+            "SELECT emp_id, AVG(base_salary) AS salary FROM salaries GROUP BY emp_id ORDER BY salary DESC"
+        )
+
+    def test_qualifies_join_key_from_other_side(self, hr_snapshot):
+        """join 조건 한쪽만 한정된 모호한 컬럼은 반대쪽 테이블로 한정 (d.x = d.x 방지)"""
+        sql = "SELECT COUNT(*) FROM employees e JOIN departments d ON dept_id = d.dept_id"
+        error = "(1052, \"Column 'dept_id' in on clause is ambiguous\")"
+
+        repair = SQLRepairer().repair(sql, error, hr_snapshot)
+
+        assert repair.sql == "SELECT COUNT(*) FROM employees AS e JOIN departments AS d ON e.dept_id = d.dept_id"
+
+    def test_reads_from_clause_of_older_sqlglot(self):
+        """이전 sqlglot 버전("from" 키)의 FROM 절도 스코프 테이블로 인식"""
+        # Given: FROM 절을 이전 버전 키로 옮긴 트리
+        select = sqlglot.parse_one("SELECT name FROM employees e JOIN departments d ON e.dept_id = d.dept_id")
+        select.args["from"] = select.args.pop("from_")
+
+        # When
+        tables = SQLRepairer._from_tables(select)
+
+        # Then
+        assert [table.name for table in tables] == ["employees", "departments"]
+
+    def test_agent_repairs_without_llm_correction(self, mock_db, hr_snapshot):
+        """로컬 수정에 성공하면 LLM 보정 없이 재실행"""
+        # Given: 첫 SQL은 잘못된 테이블명 + 한국어 ENUM 값
+        mock_db.get_schema_snapshot.return_value = hr_snapshot
+        mock_db.execute_query.return_value = ([{"cnt": 3}], None)
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(db=mock_db, sql_validator=SQLValidator(), sql_repairer=SQLRepairer())
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT COUNT(*) AS cnt FROM attendances WHERE status = '지각';"
+        agent.correction_chain = Mock()
+
+        # When
+        result = agent.query("지각 몇 번?")
+
+        # Then
+        assert result["success"] is True
+        assert result["metadata"]["attempts"] == 2
+        assert result["metadata"]["repairs"] == [
+            "unknown_table: attendances → attendance",
+            "enum_value: '지각' → 'LATE'",
+        ]
+        agent.correction_chain.invoke.assert_not_called()
+        mock_db.execute_query.assert_called_once_with(
+            "SELECT COUNT(*) AS cnt FROM attendance WHERE status = 'LATE'"
+        )
+
+
+# ===== Candidate SQL Tests =====
+class TestCandidateSQL:
+    """후보 SQL 동시 생성/실행 테스트"""
+
+    def test_first_successful_candidate_wins(self, mock_db, hr_snapshot):
+        """기본 후보가 실패해도 다른 후보가 성공하면 보정 없이 그 결과 사용"""
+        # Given: 0번 후보는 없는 컬럼, 1번 후보는 정상
+        mock_db.get_schema_snapshot.return_value = hr_snapshot
+        mock_db.execute_query.return_value = ([{"cnt": 3}], None)
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(db=mock_db, sql_validator=SQLValidator(), candidates=2)
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT COUNT(*) AS cnt FROM attendance WHERE state = 'LATE';"
+        agent.candidate_chain = Mock()
+        agent.candidate_chain.invoke.return_value = "SELECT COUNT(*) AS cnt FROM attendance WHERE status = 'LATE';"
+        agent.correction_chain = Mock()
+
+        # When
+        result = agent.query("지각 몇 번?")
+
+        # Then
+        assert result["success"] is True
+        assert result["metadata"]["sql"] == "SELECT COUNT(*) AS cnt FROM attendance WHERE status = 'LATE';"
+        assert result["metadata"]["attempts"] == 1
+        assert any(c["success"] for c in result["metadata"]["candidates"])
+        agent.correction_chain.invoke.assert_not_called()
+
+    async def test_majority_picks_most_common_result(self, mock_db, hr_snapshot):
+        """majority는 모든 후보를 실행하고 같은 결과를 낸 후보가 많은 쪽을 선택"""
+        # Given: 0번/2번 후보는 같은 값 (별칭만 다름), 1번 후보는 다른 값
+        sqls = {
+            0: "SELECT COUNT(*) AS cnt FROM employees;",
+            1: "SELECT COUNT(*) AS cnt FROM employees WHERE dept_id = 1;",
+            2: "SELECT COUNT(emp_id) AS total FROM employees;",
+        }
+        results = {sqls[0]: [{"cnt": 3}], sqls[1]: [{"cnt": 1}], sqls[2]: [{"total": 3}]}
+        mock_db.get_schema_snapshot.return_value = hr_snapshot
+        mock_db.execute_query.side_effect = lambda sql: (results[sql], None)
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(db=mock_db, candidates=3, candidate_strategy="majority")
+        agent.sql_chain = Mock()
+        agent.sql_chain.ainvoke = AsyncMock(return_value=sqls[0])
+        agent.candidate_chain = Mock()
+        agent.candidate_chain.ainvoke = AsyncMock(
+            side_effect=lambda inputs: sqls[1] if "JOIN" in inputs["hint"] else sqls[2]
+        )
+
+        # When
+        result = await agent.aquery("직원 수는?")
+
+        # Then
+        assert result["success"] is True
+        assert result["metadata"]["sql"] == sqls[0]
+        assert [c["index"] for c in result["metadata"]["candidates"]] == [0, 1, 2]
+        assert mock_db.execute_query.call_count == 3
+
+    def test_rejects_unknown_strategy(self, mock_db):
+        with patch("core.agents.sql_agent.create_chat_model"):
+            with pytest.raises(ValueError):
+                SQLAgent(db=mock_db, candidates=2, candidate_strategy="fastest")
+
+
+# ===== Few-shot Retriever Tests =====
+FEW_SHOT_PAIRS = [
+    ("개발팀 직원 수 알려줘", "SELECT COUNT(*) FROM employees e JOIN departments d ON e.dept_id = d.dept_id WHERE d.name = '개발'"),
+    ("영업팀 평균 연봉", "SELECT AVG(s.base_salary) FROM salaries s JOIN employees e ON s.emp_id = e.emp_id"),
+    ("가장 많이 지각한 직원", "SELECT emp_id, COUNT(*) FROM attendance WHERE status = 'LATE' GROUP BY emp_id"),
+]
+
+
+class TestFewShotRetriever:
+    """Few-shot 예시 검색 테스트"""
+
+    def test_search_ranks_similar_question_first(self):
+        """문자 bigram이 많이 겹치는 질문이 먼저, 관련 없는 질문은 제외"""
+        retriever = FewShotRetriever(FEW_SHOT_PAIRS, k=2)
+
+        matches = retriever.search("인사팀 평균 연봉은?")
+
+        assert matches[0].question == "영업팀 평균 연봉"
+        assert all(m.question != "가장 많이 지각한 직원" for m in matches)
+
+    def test_add_learned_examples_with_limit(self):
+        """운영 중 추가된 예시는 max_learned까지만 유지, 데이터셋 예시는 덮어쓰지 않음"""
+        retriever = FewShotRetriever(FEW_SHOT_PAIRS, max_learned=1)
+
+        assert retriever.add("영업팀 평균 연봉", "SELECT 1") is False
+        assert retriever.add("마케팅팀 평균 연봉", "SELECT 2") is True
+        assert retriever.add("마케팅팀 직원 수", "SELECT 3") is True
+
+        assert retriever.stats()["learned"] == 1
+        assert [m.question for m in retriever.search("마케팅팀 직원 수")][0] == "마케팅팀 직원 수"
+        assert all(m.question != "마케팅팀 평균 연봉" for m in retriever.search("마케팅팀 평균 연봉"))
+
+    def test_agent_uses_examples_and_learns_success(self, mock_db):
+        """생성 프롬프트에 예시를 넣고, 실행에 성공한 SQL은 인덱스에 추가"""
+        # Given
+        retriever = FewShotRetriever(FEW_SHOT_PAIRS)
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(db=mock_db, few_shot=retriever)
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT COUNT(*) AS count FROM employees;"
+
+        # When
+        result = agent.query("인사팀 직원 수 알려줘", answer_mode="raw")
+
+        # Then
+        examples = agent.sql_chain.invoke.call_args[0][0]["examples"]
+        assert "개발팀 직원 수 알려줘" in examples
+        assert result["metadata"]["few_shot"][0]["question"] == "개발팀 직원 수 알려줘"
+        assert retriever.search("인사팀 직원 수 알려줘")[0].source == "learned"
+
+
+# ===== Row Limit Tests =====
+class TestRowLimit:
+    """결과 행 수 제한 테스트"""
+
+    @pytest.mark.parametrize(
+        "sql, expected",
+        [
+            ("SELECT * FROM attendance;", "SELECT * FROM attendance LIMIT 101"),
+            ("SELECT dept_id, COUNT(*) FROM employees GROUP BY dept_id", "SELECT dept_id, COUNT(*) FROM employees GROUP BY dept_id LIMIT 101"),
+            ("SELECT * FROM employees LIMIT 10, 500", "SELECT * FROM employees LIMIT 101 OFFSET 10"),
+            ("SELECT COUNT(*) FROM attendance", "SELECT COUNT(*) FROM attendance"),
+            ("SELECT * FROM employees LIMIT 5", "SELECT * FROM employees LIMIT 5"),
+        ],
+    )
+    def test_inject_limit(self, sql, expected):
+        """집계가 아닌 SELECT에만 LIMIT 주입, 더 작은 기존 LIMIT은 유지"""
+        assert inject_limit(sql, 101) == expected
+
+    def test_execute_query_stops_at_max_rows(self, tmp_path):
+        """fetchmany로 max_rows행까지만 가져오고 잘렸으면 truncated 표시"""
+        # Given: 1,200행 테이블 (SQLite)
+        path = tmp_path / "rows.db"
+        db = DatabaseConnection(f"sqlite:///{path}", max_rows=700)
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE t (a INTEGER)")
+            conn.exec_driver_sql("INSERT INTO t VALUES (?)", [(i,) for i in range(1200)])
+
+        # When
+        results, error = db.execute_query("SELECT a FROM t")
+        exact, _ = db.execute_query("SELECT a FROM t LIMIT 700")
+
+        # Then
+        assert error is None
+        assert len(results) == 700
+        assert results[-1] == {"a": 699}
+        assert results.truncated is True
+        assert exact.truncated is False
+
+    def test_fetch_cap_truncation_reaches_agent(self, mock_db):
+        """DB fetch 상한에서 잘린 결과도 truncated로 표시, 상한 설정이 어긋나면 시작 시 오류"""
+        mock_db.execute_query.return_value = (QueryRows([{"emp_id": 1}, {"emp_id": 2}], truncated=True), None)
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(db=mock_db, max_rows=3)
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT emp_id FROM employees;"
+
+        result = agent.query("직원 목록", answer_mode="raw")
+
+        assert result["metadata"]["truncated"] is True
+        with pytest.raises(ValueError):
+            Settings(DB_MAX_FETCH_ROWS=1000, SQL_MAX_ROWS=1000)
+
+    def test_agent_marks_truncated_results(self, mock_db):
+        """max_rows + 1행이 오면 max_rows행으로 자르고 truncated 표시"""
+        # Given
+        mock_db.execute_query.return_value = ([{"emp_id": i} for i in range(4)], None)
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(db=mock_db, max_rows=3)
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT emp_id FROM employees;"
+
+        # When
+        result = agent.query("직원 목록", answer_mode="template")
+
+        # Then
+        mock_db.execute_query.assert_called_once_with("SELECT emp_id FROM employees LIMIT 4")
+        assert result["metadata"]["truncated"] is True
+        assert len(result["metadata"]["results"]) == 3
+        assert "상위 3행" in result["answer"]
+
+
+# ===== Query Cost Guard Tests =====
+CARTESIAN_PLAN = [
+    {"id": 1, "table": "a", "type": "ALL", "rows": 20000, "filtered": 100.0, "Extra": None},
+    {"id": 1, "table": "s", "type": "ALL", "rows": 1000, "filtered": 100.0, "Extra": "Using join buffer (hash join)"},
+]
+INDEXED_PLAN = [
+    {"id": 1, "table": "a", "type": "ALL", "rows": 20000, "filtered": 10.0, "Extra": "Using where"},
+    {"id": 1, "table": "e", "type": "eq_ref", "rows": 1, "filtered": 100.0, "Extra": None},
+]
+
+
+class TestQueryCostGuard:
+    """EXPLAIN 기반 쿼리 비용 검사 테스트"""
+
+    def test_rejects_cartesian_join(self):
+        """조인 조건 없는 전체 스캔 조인은 예상 행 수 초과로 차단, 의심 테이블 표시"""
+        db = Mock()
+        db.explain.return_value = CARTESIAN_PLAN
+
+        reason = QueryCostGuard(db, max_rows=1_000_000).check("SELECT * FROM attendance a, salaries s")
+
+        assert "20,000,000" in reason
+        assert "조인 조건 누락 가능성: s" in reason
+
+    def test_allows_indexed_join_and_explain_failure(self):
+        """인덱스 조인은 통과, EXPLAIN 실패는 실행에 맡김"""
+        db = Mock()
+        db.explain.return_value = INDEXED_PLAN
+        guard = QueryCostGuard(db, max_rows=1_000_000)
+
+        assert guard.check("SELECT ...") is None
+
+        db.explain.side_effect = RuntimeError("EXPLAIN 실패")
+        assert guard.check("SELECT ...") is None
+
+    def test_agent_sends_rejection_to_correction(self, mock_db):
+        """차단된 SQL은 실행하지 않고 사유를 보정 단계로 전달"""
+        # Given: 첫 SQL은 cartesian join, 보정 SQL은 인덱스 조인
+        mock_db.explain.side_effect = [CARTESIAN_PLAN, INDEXED_PLAN]
+        mock_db.execute_query.return_value = ([{"cnt": 3}], None)
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(db=mock_db, cost_guard=QueryCostGuard(mock_db))
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT COUNT(*) AS cnt FROM attendance a, salaries s;"
+        agent.correction_chain = Mock()
+        agent.correction_chain.invoke.return_value = (
+            "SELECT COUNT(*) AS cnt FROM attendance a JOIN employees e ON a.emp_id = e.emp_id;"
+        )
+
+        # When
+        result = agent.query("근태 기록 수는?")
+
+        # Then
+        assert result["success"] is True
+        assert "쿼리 비용 초과" in agent.correction_chain.invoke.call_args[0][0]["error"]
+        mock_db.execute_query.assert_called_once_with(
+            "SELECT COUNT(*) AS cnt FROM attendance a JOIN employees e ON a.emp_id = e.emp_id;"
+        )
+
+    def test_cached_result_skips_explain(self, mock_db):
+        """결과 캐시 hit이면 EXPLAIN 없이 반환 (테이블 버전 조회 시점이어도)"""
+        # Given: poll_interval=0 → 매 요청 버전 조회 (peek으로는 판단 불가)
+        mock_db.explain.return_value = INDEXED_PLAN
+        mock_db.get_table_versions.return_value = {"employees": "t1"}
+        mock_db.execute_query.return_value = ([{"cnt": 3}], None)
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(
+                db=mock_db,
+                result_cache=ResultCache(mock_db, poll_interval=0),
+                cost_guard=QueryCostGuard(mock_db),
+            )
+        agent.sql_chain = Mock()
+        agent.sql_chain.invoke.return_value = "SELECT COUNT(*) AS cnt FROM employees;"
+
+        # When
+        agent.query("직원 수는?", answer_mode="raw")
+        agent.query("직원 수는?", answer_mode="raw")
+
+        # Then
+        assert mock_db.explain.call_count == 1
+        assert mock_db.execute_query.call_count == 1
+
+
+# ===== Async DB Tests =====
+class TestAsyncDatabase:
+    """async 엔진 경로 테스트 (실제 드라이버 없이 연결 설정/실행 경로만)"""
+
+    def test_async_url_keeps_connection_settings(self):
+        """동기 URL의 호스트/인증/파라미터는 유지하고 드라이버만 교체"""
+        url = "mysql+pymysql://hr:p%40ss@db:3306/hr?charset=utf8mb4"
+
+        assert to_async_url(url) == "mysql+aiomysql://hr:p%40ss@db:3306/hr?charset=utf8mb4"
+        assert to_async_url(url, "asyncmy").startswith("mysql+asyncmy://")
+        with pytest.raises(ValueError):
+            to_async_url(url, "psycopg")
+
+    async def test_agent_awaits_async_db_through_result_cache(self, mock_db):
+        """async_db가 있으면 aquery는 스레드 대신 execute_query_async를 await (결과 캐시 공유)"""
+        # Given
+        async_db = Mock()
+        async_db.get_table_versions_async = AsyncMock(return_value={"employees": "t1"})
+        async_db.execute_query_async = AsyncMock(return_value=([{"cnt": 3}], None))
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(
+                db=mock_db,
+                result_cache=ResultCache(mock_db, poll_interval=60, async_db=async_db),
+                async_db=async_db,
+            )
+        agent.sql_chain = Mock()
+        agent.sql_chain.ainvoke = AsyncMock(return_value="SELECT COUNT(*) AS cnt FROM employees;")
+
+        # When: 같은 질문 2회 (두 번째는 결과 캐시 hit)
+        first = await agent.aquery("직원 수는?", answer_mode="raw")
+        second = await agent.aquery("직원 수는?", answer_mode="raw")
+
+        # Then
+        assert first["metadata"]["results"] == second["metadata"]["results"] == [{"cnt": 3}]
+        async_db.execute_query_async.assert_awaited_once_with("SELECT COUNT(*) AS cnt FROM employees;")
+        mock_db.execute_query.assert_not_called()
+
+    async def test_async_path_skips_sync_pool(self, mock_db):
+        """async_db가 있으면 스키마 지문/테이블 버전/EXPLAIN/실행 모두 async 메서드로 (동기 풀 미사용)"""
+        # Given: 매 요청 지문 확인(ttl=0) + 매 요청 버전 조회(poll_interval=0)
+        async_db = Mock()
+        async_db.get_schema_fingerprint_async = AsyncMock(return_value="fp1")
+        async_db.get_schema_snapshot_async = AsyncMock(return_value=mock_db.get_schema_snapshot.return_value)
+        async_db.get_table_versions_async = AsyncMock(return_value={"employees": "t1"})
+        async_db.explain_async = AsyncMock(return_value=INDEXED_PLAN)
+        async_db.execute_query_async = AsyncMock(return_value=([{"cnt": 3}], None))
+        with patch("core.agents.sql_agent.create_chat_model"):
+            agent = SQLAgent(
+                db=mock_db,
+                schema_cache=SchemaCache(mock_db, ttl=0, async_db=async_db),
+                result_cache=ResultCache(mock_db, poll_interval=0, async_db=async_db),
+                cost_guard=QueryCostGuard(mock_db, async_db=async_db),
+                async_db=async_db,
+            )
+        agent.sql_chain = Mock()
+        agent.sql_chain.ainvoke = AsyncMock(return_value="SELECT COUNT(*) AS cnt FROM employees;")
+
+        # When: 같은 질문 2회 (두 번째는 결과 캐시 hit → EXPLAIN 없음)
+        await agent.aquery("직원 수는?", answer_mode="raw")
+        await agent.aquery("직원 수는?", answer_mode="raw")
+
+        # Then
+        assert async_db.get_schema_fingerprint_async.await_count == 2
+        async_db.get_schema_snapshot_async.assert_awaited_once()
+        assert async_db.get_table_versions_async.await_count == 3  # 1회차: 조회 + 실행 전, 2회차: 조회
+        async_db.explain_async.assert_awaited_once()
+        async_db.execute_query_async.assert_awaited_once()
+        for method in ("get_schema_fingerprint", "get_schema_snapshot", "get_table_versions", "explain", "execute_query"):
+            getattr(mock_db, method).assert_not_called()
+
+
+# ===== Connection Pool Tests =====
+class TestConnectionPool:
+    """풀 미리 채우기 / 백그라운드 생존 확인 / 풀 메트릭 테스트 (sqlite 파일 DB)"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        return DatabaseConnection(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=2, max_overflow=1)
+
+    def test_pre_ping_default_matches_settings(self):
+        """동기 풀 pre_ping 기본값은 DB_POOL_PRE_PING 기본값과 같음 (PoolSweeper 전제)"""
+        default = inspect.signature(DatabaseConnection).parameters["pre_ping"].default
+
+        assert default is Settings.model_fields["DB_POOL_PRE_PING"].default is False
+
+    def test_prefill_and_overflow_gauge(self, db):
+        """prefill은 pool_size개를 연결해 두고, 초과 checkout은 overflow로 기록"""
+        # When
+        idle = db.prefill()
+        conns = [db._connect() for _ in range(3)]
+
+        # Then
+        assert idle == 2
+        assert REGISTRY.get_sample_value("hr_db_pool_overflow", {"pool": "sync"}) == 1
+        assert REGISTRY.get_sample_value("hr_db_pool_checked_out", {"pool": "sync"}) == 3
+        for conn in conns:
+            conn.close()
+        assert REGISTRY.get_sample_value("hr_db_pool_checked_out", {"pool": "sync"}) == 0
+
+    def test_sweep_invalidates_dead_idle_connections(self, db):
+        """ping에 실패한 idle 커넥션만 무효화 (풀 크기는 유지, 다음 checkout에서 재연결)"""
+        # Given
+        db.prefill()
+        before = REGISTRY.get_sample_value("hr_db_pool_invalidations_total", {"pool": "sync"}) or 0
+
+        # When
+        with patch.object(db.engine.dialect, "do_ping", side_effect=[True, OSError("gone")]):
+            invalidated = db.sweep_idle()
+
+        # Then
+        assert invalidated == 1
+        assert REGISTRY.get_sample_value("hr_db_pool_invalidations_total", {"pool": "sync"}) == before + 1
+        assert db.engine.pool.checkedin() == 2
+        assert db.execute_query("SELECT 1 AS one") == ([{"one": 1}], None)
+
+
+# ===== LLM Metrics Tests =====
+class TestLLMMetrics:
+    """LLM 호출 메트릭 콜백 테스트"""
+
+    def test_callback_counts_llm_calls(self):
+        """Chat 모델 호출 시 provider/model별 호출 수 증가"""
+        # Given
+        labels = {"provider": "fake", "model": "test-model", "status": "success"}
+        before = REGISTRY.get_sample_value("hr_llm_requests_total", labels) or 0
+        llm = GenericFakeChatModel(
+            messages=iter(["SQL_AGENT"]),
+            callbacks=[LLMMetricsCallback("fake", "test-model")],
+        )
+
+        # When
+        llm.invoke("직원 수는?")
+
+        # Then
+        assert REGISTRY.get_sample_value("hr_llm_requests_total", labels) == before + 1
+
+
 # ===== Router Tests =====
 class TestRouter:
     """Router 단위 테스트"""
@@ -87,6 +1158,54 @@ class TestHRAgent:
         assert "연차" in result["answer"]
         assert result["metadata"]["agent_type"] == "RAG_AGENT"
 
+    async def test_aquery_routes_to_sql_agent(self, mock_router, mock_sql_agent, mock_rag_agent):
+        """aquery가 async 경로(aroute → SQL aquery)로 처리되는지 테스트"""
+        # Given
+        agent = HRAgent(router=mock_router, sql_agent=mock_sql_agent, rag_agent=mock_rag_agent)
+
+        # When
+        result = await agent.aquery("직원 수는?")
+
+        # Then
+        assert result["metadata"]["agent_type"] == "SQL_AGENT"
+        mock_router.aroute.assert_awaited_once_with("직원 수는?")
+        mock_sql_agent.aquery.assert_awaited_once()
+        mock_sql_agent.query.assert_not_called()
+
+    async def test_aquery_router_error_falls_back_to_rag(
+        self, mock_router, mock_sql_agent, mock_rag_agent
+    ):
+        """라우팅 실패 시 RAG로 폴백"""
+        # Given
+        mock_router.aroute.side_effect = Exception("LLM timeout")
+        agent = HRAgent(router=mock_router, sql_agent=mock_sql_agent, rag_agent=mock_rag_agent)
+
+        # When
+        result = await agent.aquery("연차 규정은?")
+
+        # Then
+        assert result["metadata"]["agent_type"] == "RAG_AGENT"
+        mock_rag_agent.aquery.assert_awaited_once()
+
+    async def test_aquery_bulkhead_overload_propagates(
+        self, mock_router, mock_sql_agent, mock_rag_agent
+    ):
+        """Agent bulkhead 한도 초과는 오류 결과가 아니라 OverloadedError로 전파"""
+        # Given: 대기열 없는 SQL bulkhead의 슬롯을 이미 점유
+        bulkhead = Bulkhead("SQL_AGENT", max_concurrent=1, max_queue=0)
+        bulkhead.acquire()
+        agent = HRAgent(
+            router=mock_router,
+            sql_agent=mock_sql_agent,
+            rag_agent=mock_rag_agent,
+            bulkheads={"SQL_AGENT": bulkhead},
+        )
+
+        # When / Then
+        with pytest.raises(OverloadedError):
+            await agent.aquery("직원 수는?")
+        mock_sql_agent.aquery.assert_not_called()
+
 
 # ===== Container Tests =====
 class TestContainer:
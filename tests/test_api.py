@@ -0,0 +1,251 @@
+"""
+API Tests
+FastAPI 엔드포인트 테스트 (Container에 Mock 주입)
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core import container as container_module
+from core.container import Container
+from core.types.agent_types import AgentResult, StreamEvent
+from core.observability.health import ReadinessChecker
+from core.types.errors import OverloadedError
+
+
+@pytest.fixture
+def client(mock_settings, mock_hr_agent):
+    """Mock HRAgent가 주입된 TestClient"""
+    from app.main import app
+
+    container_module._container = Container(settings=mock_settings, _hr_agent=mock_hr_agent)
+    yield TestClient(app)
+    container_module._container = None
+
+
+def parse_sse(body: str):
+    """SSE 본문 → [(event, data)]"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestQueryEndpoint:
+    """/api/v1/query 테스트"""
+
+    def test_query_uses_async_path(self, client, mock_hr_agent):
+        """기본 실행 모드(async)에서 aquery 호출"""
+        response = client.post("/api/v1/query", json={"question": "직원 수는?"})
+
+        assert response.status_code == 200
+        assert response.json()["agent_type"] == "SQL_AGENT"
+        mock_hr_agent.aquery.assert_awaited_once_with("직원 수는?", answer_mode="auto")
+
+    def test_query_debug_timing(self, client, mock_hr_agent):
+        """Server-Timing 헤더는 항상, 본문 timings는 debug_timing일 때만"""
+        plain = client.post("/api/v1/query", json={"question": "직원 수는?"})
+        debug = client.post(
+            "/api/v1/query", json={"question": "직원 수는?", "debug_timing": True}
+        )
+
+        assert "total;dur=" in plain.headers["Server-Timing"]
+        assert plain.json()["timings"] is None
+        assert "total" in debug.json()["timings"]
+
+    def test_query_overloaded_returns_503(self, client, mock_hr_agent):
+        """bulkhead 한도 초과 시 503 + Retry-After"""
+        mock_hr_agent.aquery.side_effect = OverloadedError("SQL_AGENT 처리 한도 초과", retry_after=2)
+
+        response = client.post("/api/v1/query", json={"question": "직원 수는?"})
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "2"
+        assert response.json()["detail"]["code"] == "OVERLOADED"
+
+    def test_query_stream_sends_sse_events(self, client, mock_hr_agent):
+        """/query/stream이 단계 이벤트와 done 이벤트를 SSE로 전송"""
+        # Given
+        async def fake_astream(question, answer_mode="auto"):
+            yield StreamEvent(type="route", data={"agent_type": "RAG_AGENT"})
+            yield StreamEvent(type="sources", data={"source_docs": ["제20조(연차휴가)"]})
+            yield StreamEvent(type="token", data={"text": "15일"})
+            yield StreamEvent(type="done", data=AgentResult(
+                success=True,
+                answer="15일",
+                metadata={"agent_type": "RAG_AGENT"},
+                error=None,
+            ))
+
+        mock_hr_agent.astream = fake_astream
+
+        # When
+        response = client.post("/api/v1/query/stream", json={"question": "연차는?"})
+
+        # Then
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        assert [name for name, _ in events] == ["route", "sources", "token", "done"]
+        assert events[-1][1]["answer"] == "15일"
+        assert events[-1][1]["question"] == "연차는?"
+
+
+class TestBatchEndpoint:
+    """/api/v1/query/batch 테스트"""
+
+    def test_batch_dedup_and_order(self, client, mock_hr_agent):
+        """중복 질문은 1회만 처리하고 결과는 입력 순서대로 반환"""
+        # Given: 두 번째 질문만 실패
+        ok = mock_hr_agent.aquery.return_value
+
+        async def fake_aquery(question, answer_mode="auto"):
+            if question == "실패 질문":
+                raise RuntimeError("LLM timeout")
+            return ok
+
+        mock_hr_agent.aquery.side_effect = fake_aquery
+        questions = ["직원 수는?", "실패 질문", "직원 수는"]
+
+        # When
+        response = client.post("/api/v1/query/batch", json={"questions": questions})
+
+        # Then
+        body = response.json()
+        assert response.status_code == 200
+        assert [r["question"] for r in body["results"]] == questions
+        assert [r["success"] for r in body["results"]] == [True, False, True]
+        assert body["unique"] == 2
+        assert body["failed"] == 1
+        assert mock_hr_agent.aquery.await_count == 2
+
+    def test_batch_too_large(self, client, mock_settings):
+        """최대 개수 초과 시 400"""
+        mock_settings.QUERY_BATCH_MAX_SIZE = 2
+
+        response = client.post("/api/v1/query/batch", json={"questions": ["a", "b", "c"]})
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "BATCH_TOO_LARGE"
+
+    @pytest.mark.parametrize("question", ["", "a" * 501])
+    def test_batch_question_length(self, client, mock_hr_agent, question):
+        """질문별 길이 제한은 /query와 동일 (빈 질문/500자 초과 시 422)"""
+        response = client.post("/api/v1/query/batch", json={"questions": ["직원 수는?", question]})
+
+        assert response.status_code == 422
+        mock_hr_agent.aquery.assert_not_called()
+
+
+class TestHealthEndpoint:
+    """/api/v1/health 테스트"""
+
+    def test_live_always_ok(self, client):
+        """liveness는 외부 의존성과 무관하게 200"""
+        response = client.get("/api/v1/health/live")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+
+    def test_ready_ok(self, client, mock_db):
+        """모든 점검 통과 시 200"""
+        # Given
+        container = container_module._container
+        container._db = mock_db
+        mock_db.pool_status.return_value = "Pool size: 5"
+        container.readiness = ReadinessChecker(checks={"database": container._check_database})
+
+        # When
+        response = client.get("/api/v1/health/ready")
+
+        # Then
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert body["checks"]["database"]["ok"] is True
+        assert body["checks"]["database"]["detail"] == "Pool size: 5"
+
+    def test_ready_fails_on_empty_index(self, client, mock_rag_agent):
+        """FAISS 인덱스가 비어 있으면 503"""
+        # Given
+        container = container_module._container
+        container._rag_agent = mock_rag_agent
+        mock_rag_agent.vectorstore.index.ntotal = 0
+        container.readiness = ReadinessChecker(checks={"faiss_index": container._check_faiss_index})
+
+        # When
+        response = client.get("/api/v1/health/ready")
+
+        # Then
+        assert response.status_code == 503
+        body = response.json()
+        assert body["status"] == "not_ready"
+        assert body["checks"]["faiss_index"]["ok"] is False
+
+    def test_ready_does_not_load_index(self, mock_settings, mock_db):
+        """점검은 FAISS 인덱스를 로드하지 않고 미로드 상태만 보고"""
+        # Given: 예열 전 컨테이너 (RAGAgent 미생성)
+        container = Container(settings=mock_settings, _db=mock_db)
+
+        # When / Then
+        with patch("core.container.RAGAgent") as rag_agent_cls:
+            with pytest.raises(RuntimeError, match="로드되지 않았습니다"):
+                container._check_faiss_index()
+            container.settings = mock_settings.model_copy(update={"WARMUP_ENABLED": False})
+            assert container._check_faiss_index().startswith("not loaded")
+        rag_agent_cls.assert_not_called()
+        assert "rag_agent" not in container.__dict__
+
+    def test_ready_retries_failed_warmup_load(self, mock_settings, mock_db, mock_rag_agent):
+        """예열 로드가 실패했으면 점검에서 다시 로드 (실패/로드 중은 구분해서 보고)"""
+        # Given: 예열 중 일시적 오류로 로드 실패
+        container = Container(settings=mock_settings, _db=mock_db)
+        with patch("core.container.RAGAgent", side_effect=OSError("embedding timeout")):
+            with pytest.raises(OSError):
+                container._load_rag_agent()
+
+            # When: 같은 오류가 이어지면 실패로 보고
+            with pytest.raises(RuntimeError, match="로드 실패: OSError: embedding timeout"):
+                container._check_faiss_index()
+
+        # When: 다른 점검이 로드 중이면 기다리지 않고 "로드 중"
+        with container._rag_load_lock:
+            with pytest.raises(RuntimeError, match="로드 중"):
+                container._check_faiss_index()
+
+        # Then: 오류가 풀리면 점검에서 로드 성공
+        mock_rag_agent.vectorstore.index.ntotal = 42
+        with patch("core.container.RAGAgent", return_value=mock_rag_agent):
+            assert container._check_faiss_index() == "42 vectors"
+        assert container._rag_load_error is None
+
+
+class TestStatsEndpoint:
+    """/api/v1/stats 테스트"""
+
+    def test_stats_reports_single_flight(self, client):
+        """질의 후 single-flight 실행 횟수 노출"""
+        client.post("/api/v1/query", json={"question": "직원 수는?"})
+
+        response = client.get("/api/v1/stats")
+
+        assert response.status_code == 200
+        assert response.json()["single_flight"]["executions"] == 1
+
+
+class TestMetricsEndpoint:
+    """/api/v1/metrics 테스트"""
+
+    def test_metrics_exposes_prometheus_text(self, client):
+        """질의 후 요청 지연/ single-flight 메트릭 노출"""
+        client.post("/api/v1/query", json={"question": "직원 수는?"})
+
+        response = client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'hr_request_duration_seconds_count{agent_type="SQL_AGENT",success="true"}' in response.text
+        assert "hr_single_flight_coalesced_total" in response.text
@@ -0,0 +1,392 @@
+"""
+Concurrency Tests
+워커 풀 / 동시 요청 처리 테스트
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.concurrency import Bulkhead, QueryDispatcher, QueryExecutor, SingleFlight, run_batch
+from core.observability.health import ReadinessChecker
+from core.observability.timing import start_timing, timed
+from core.types.errors import OverloadedError
+from core.utils.text import normalize_question
+from core.warmup import run_warmup
+
+
+class TestQueryExecutor:
+    """QueryExecutor 단위 테스트"""
+
+    async def test_run_returns_result(self):
+        """워커 풀에서 실행한 함수의 결과 반환"""
+        executor = QueryExecutor(max_workers=2)
+
+        result = await executor.run(lambda q: f"answer:{q}", "직원 수는?")
+
+        assert result == "answer:직원 수는?"
+        executor.shutdown()
+
+    async def test_blocking_calls_run_concurrently(self):
+        """블로킹 호출이 이벤트 루프를 막지 않고 병렬 실행"""
+        # Given: 0.2초 블로킹 함수 8개
+        executor = QueryExecutor(max_workers=8)
+
+        # When
+        started = time.perf_counter()
+        await asyncio.gather(*(executor.run(time.sleep, 0.2) for _ in range(8)))
+        elapsed = time.perf_counter() - started
+
+        # Then: 직렬(1.6초)이 아니라 병렬로 처리됨
+        assert elapsed < 0.8
+        executor.shutdown()
+
+    def test_invalid_max_workers(self):
+        """max_workers 검증"""
+        with pytest.raises(ValueError):
+            QueryExecutor(max_workers=0)
+
+
+class TestRunBatch:
+    """run_batch 단위 테스트"""
+
+    async def test_dedup_and_input_order(self):
+        """정규화 후 같은 질문은 1회만 실행, 결과는 입력 순서대로"""
+        # Given
+        calls = []
+
+        async def fn(question):
+            calls.append(question)
+            return f"answer:{normalize_question(question)}"
+
+        questions = ["직원 수는?", "연차 규정", "  직원   수는 ", "연차 규정?"]
+
+        # When
+        results = await run_batch(questions, fn, concurrency=4)
+
+        # Then
+        assert len(calls) == 2
+        assert results == [
+            "answer:직원 수는",
+            "answer:연차 규정",
+            "answer:직원 수는",
+            "answer:연차 규정",
+        ]
+
+    async def test_failures_are_per_item(self):
+        """항목별 실패는 예외 객체로 반환"""
+        async def fn(question):
+            if question == "bad":
+                raise RuntimeError("LLM timeout")
+            return question
+
+        results = await run_batch(["ok", "bad", "ok2"], fn, concurrency=2)
+
+        assert results[0] == "ok"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == "ok2"
+
+    async def test_concurrency_cap(self):
+        """동시 실행 수가 concurrency를 넘지 않음"""
+        in_flight = 0
+        peak = 0
+
+        async def fn(question):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return question
+
+        await run_batch([f"q{i}" for i in range(20)], fn, concurrency=3)
+
+        assert peak == 3
+
+
+class TestSingleFlight:
+    """SingleFlight 단위 테스트"""
+
+    async def test_concurrent_same_key_runs_once(self):
+        """동시에 들어온 같은 키는 1회만 실행하고 결과 공유"""
+        # Given
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "15일"
+
+        # When
+        results = await asyncio.gather(*(single_flight.do("연차", fn) for _ in range(10)))
+
+        # Then
+        assert results == ["15일"] * 10
+        assert calls == 1
+        assert single_flight.stats() == {"in_flight": 0, "executions": 1, "coalesced": 9}
+
+    async def test_error_propagates_to_all_waiters(self):
+        """실행 실패 시 합류한 요청도 같은 예외를 받음"""
+        single_flight = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("LLM timeout")
+
+        results = await asyncio.gather(
+            *(single_flight.do("q", fn) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_leader_cancel_does_not_affect_followers(self):
+        """먼저 온 요청이 취소돼도 합류한 요청은 결과를 받음"""
+        single_flight = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        leader = asyncio.ensure_future(single_flight.do("q", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do("q", fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "ok"
+
+
+class TestBulkhead:
+    """Bulkhead 단위 테스트"""
+
+    async def test_limits_concurrency_and_queues(self):
+        """동시 실행 상한을 지키고 초과분은 대기 후 실행"""
+        # Given: 동시 2개, 대기열 10개
+        bulkhead = Bulkhead("SQL_AGENT", max_concurrent=2, max_queue=10)
+        in_flight = 0
+        peak = 0
+
+        async def work():
+            nonlocal in_flight, peak
+            async with bulkhead:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        # When
+        await asyncio.gather(*(work() for _ in range(8)))
+
+        # Then
+        stats = bulkhead.stats()
+        assert peak == 2
+        assert stats["admitted"] == 8
+        assert stats["active"] == 0
+        assert stats["queue_depth"] == 0
+
+    async def test_rejects_when_queue_full(self):
+        """대기열까지 가득 차면 즉시 OverloadedError"""
+        bulkhead = Bulkhead("RAG_AGENT", max_concurrent=1, max_queue=1, retry_after=3)
+        release = asyncio.Event()
+
+        async def hold():
+            async with bulkhead:
+                await release.wait()
+
+        holders = [asyncio.ensure_future(hold()) for _ in range(2)]  # 실행 1 + 대기 1
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(OverloadedError) as exc_info:
+            await bulkhead.acquire_async()
+
+        assert exc_info.value.retry_after == 3
+        assert bulkhead.stats()["rejected"] == 1
+        release.set()
+        await asyncio.gather(*holders)
+
+    def test_sync_queue_timeout(self):
+        """동기 경로: 대기 시간 초과 시 거절하고 대기열에서 제거"""
+        bulkhead = Bulkhead("SQL_AGENT", max_concurrent=1, max_queue=5, queue_timeout=0.05)
+        bulkhead.acquire()
+
+        with pytest.raises(OverloadedError):
+            bulkhead.acquire()
+
+        stats = bulkhead.stats()
+        assert stats["timed_out"] == 1
+        assert stats["queue_depth"] == 0
+        bulkhead.release()
+        assert bulkhead.stats()["active"] == 0
+
+    def test_grant_at_timeout_keeps_slot(self):
+        """타임아웃과 동시에 슬롯을 양도받으면 그 슬롯으로 실행 (실행 중 수 초과/음수 없음)"""
+        # Given: 대기 타임아웃 직후, 대기 종료 처리 전에 슬롯 양도
+        bulkhead = Bulkhead("SQL_AGENT", max_concurrent=1, max_queue=5, queue_timeout=0.01)
+        bulkhead.acquire()
+        original_wait = threading.Event.wait
+
+        def wait_then_grant(event, timeout=None):
+            original_wait(event, timeout)
+            bulkhead.release()
+            return False
+
+        # When
+        with patch.object(threading.Event, "wait", wait_then_grant):
+            bulkhead.acquire()
+
+        # Then
+        stats = bulkhead.stats()
+        assert (stats["active"], stats["admitted"], stats["timed_out"]) == (1, 2, 0)
+        bulkhead.release()
+        assert bulkhead.stats()["active"] == 0
+
+
+class TestStageTiming:
+    """단계별 소요시간 수집 테스트"""
+
+    async def test_timings_propagate_to_worker_threads(self):
+        """워커 풀에서 기록한 구간도 요청 수집기에 모임"""
+        # Given
+        executor = QueryExecutor(max_workers=2)
+        timings = start_timing()
+
+        def work():
+            with timed("sql_execute_1"):
+                time.sleep(0.01)
+
+        # When
+        with timed("router_llm"):
+            await asyncio.sleep(0.01)
+        await executor.run(work)
+
+        # Then
+        result = timings.as_dict()
+        assert list(result) == ["router_llm", "sql_execute_1"]
+        assert result["sql_execute_1"] >= 10
+        assert timings.server_timing().startswith("router_llm;dur=")
+        executor.shutdown()
+
+    async def test_coalesced_requests_get_shared_timings(self):
+        """single-flight로 합류한 요청도 공유 실행의 단계별 소요시간을 받음"""
+        # Given
+        async def aquery(question, answer_mode="auto"):
+            with timed("sql_agent"):
+                await asyncio.sleep(0.02)
+            return {"success": True, "metadata": {"agent_type": "SQL"}}
+
+        hr_agent = Mock()
+        hr_agent.aquery = aquery
+        single_flight = SingleFlight()
+        dispatcher = QueryDispatcher(hr_agent, Mock(), single_flight=single_flight)
+
+        async def request():
+            timings = start_timing()
+            await dispatcher.run("직원 수는?")
+            return timings.as_dict()
+
+        # When: 동시 요청 2건 (각자 수집기)
+        leader, follower = await asyncio.gather(request(), request())
+
+        # Then
+        assert single_flight.stats()["coalesced"] == 1
+        assert list(leader) == list(follower) == ["sql_agent"]
+        assert follower["sql_agent"] >= 20
+
+
+class TestReadinessChecker:
+    """ReadinessChecker 단위 테스트"""
+
+    async def test_caches_within_ttl(self):
+        """TTL 이내 재요청은 점검을 다시 실행하지 않음"""
+        # Given
+        calls = []
+
+        def db_check():
+            calls.append(1)
+            return "ok"
+
+        checker = ReadinessChecker(checks={"database": db_check}, ttl=60)
+
+        # When
+        first = await checker.check()
+        second = await checker.check()
+
+        # Then
+        assert first["ready"] is True and first["cached"] is False
+        assert second["cached"] is True
+        assert len(calls) == 1
+
+        checker.invalidate()
+        await checker.check()
+        assert len(calls) == 2
+
+    async def test_failure_and_timeout_mark_not_ready(self):
+        """예외/타임아웃 점검이 있으면 not ready"""
+        def broken():
+            raise RuntimeError("FAISS 인덱스가 비어 있습니다.")
+
+        checker = ReadinessChecker(
+            checks={"ok": lambda: "ok", "faiss_index": broken, "llm": lambda: time.sleep(0.5)},
+            timeout=0.05,
+        )
+
+        report = await checker.check()
+
+        assert report["ready"] is False
+        assert report["checks"]["ok"]["ok"] is True
+        assert report["checks"]["faiss_index"]["detail"] == "FAISS 인덱스가 비어 있습니다."
+        assert report["checks"]["llm"]["detail"].startswith("timeout")
+
+
+class TestWarmup:
+    """앱 시작 예열 테스트"""
+
+    async def test_phases_run_in_order_and_parallel_within(self):
+        """단계는 순서대로, 단계 안 작업은 병렬 실행"""
+        # Given
+        order = []
+
+        def step(name):
+            def fn():
+                time.sleep(0.05)
+                order.append(name)
+            return fn
+
+        phases = [{"a": step("a"), "b": step("b")}, {"c": step("c")}]
+
+        # When
+        started = time.perf_counter()
+        report = await run_warmup(phases)
+        elapsed = time.perf_counter() - started
+
+        # Then
+        assert list(report) == ["a", "b", "c"]
+        assert order[-1] == "c"
+        assert elapsed < 0.14  # 순차라면 0.15초 이상
+        assert all(r["ok"] for r in report.values())
+
+    async def test_failure_is_recorded_and_does_not_stop(self):
+        """실패한 작업은 기록만 하고 다음 단계 계속"""
+        def broken():
+            raise RuntimeError("FAISS index not found")
+
+        report = await run_warmup([{"rag_agent": broken}, {"hr_agent": lambda: None}])
+
+        assert report["rag_agent"]["ok"] is False
+        assert "FAISS index not found" in report["rag_agent"]["error"]
+        assert report["hr_agent"]["ok"] is True
+
+    async def test_container_phases_build_components(self, test_container):
+        """Container 예열 후 컴포넌트가 생성되어 있음"""
+        report = await run_warmup(test_container.warmup_phases())
+
+        assert all(r["ok"] for r in report.values()), report
+        assert {"db_pool", "tokenizer", "schema", "router_llm", "hr_agent"} <= set(report)
+        assert "hr_agent" in test_container.__dict__
+        test_container.router.llm.invoke.assert_called_once_with("ping")
+        test_container.shutdown()